@@ -3,7 +3,15 @@
 from __future__ import annotations
 
 from .account import Account
+from .archive import ReadingArchive
+from .cache import DayCache, DayCacheKey, FileDayCache, MemoryDayCache
 from .client import Client
+from .consumption import (
+    ConsumptionFlag,
+    ConsumptionSeries,
+    derive_consumption,
+    register_dials,
+)
 from .exceptions import (
     EyeOnWaterAPIError,
     EyeOnWaterAuthError,
@@ -13,15 +21,44 @@ from .exceptions import (
     EyeOnWaterResponseIsEmpty,
     EyeOnWaterUnitError,
 )
+from .gaps import BackfillScheduler, Gap, find_gaps, gap_days
+from .history import HistoryStore
 from .meter import Meter
-from .meter_reader import MeterReader
-from .models import DataPoint, EOWUnits, NativeUnits
-from .units import convert_to_native, deduce_native_units
+from .meter_reader import DayBatch, MeterReader
+from .models import (
+    ColumnarSeries,
+    DataPoint,
+    EOWUnits,
+    FrozenDataPoint,
+    NativeUnits,
+)
+from .parquet import ParquetExporter
+from .polling import PollScheduler, expected_upload
+from .rate_limiter import AdaptiveRateLimiter
+from .resample import resample
+from .storage import SQLiteStore
+from .timezones import TimezoneBackend
+from .units import (
+    conversion_factor,
+    conversion_ratio,
+    convert_datapoints_to_native,
+    convert_to_native,
+    convert_values_to_native,
+    deduce_native_units,
+)
 
 __all__ = [
     "Account",
+    "AdaptiveRateLimiter",
+    "BackfillScheduler",
     "Client",
+    "ColumnarSeries",
+    "ConsumptionFlag",
+    "ConsumptionSeries",
     "DataPoint",
+    "DayBatch",
+    "DayCache",
+    "DayCacheKey",
     "EOWUnits",
     "EyeOnWaterAPIError",
     "EyeOnWaterAuthError",
@@ -30,9 +67,29 @@ __all__ = [
     "EyeOnWaterRateLimitError",
     "EyeOnWaterResponseIsEmpty",
     "EyeOnWaterUnitError",
+    "FileDayCache",
+    "FrozenDataPoint",
+    "Gap",
+    "HistoryStore",
+    "MemoryDayCache",
     "Meter",
     "MeterReader",
     "NativeUnits",
+    "ParquetExporter",
+    "PollScheduler",
+    "ReadingArchive",
+    "SQLiteStore",
+    "TimezoneBackend",
+    "conversion_factor",
+    "conversion_ratio",
+    "convert_datapoints_to_native",
     "convert_to_native",
+    "convert_values_to_native",
     "deduce_native_units",
+    "derive_consumption",
+    "expected_upload",
+    "find_gaps",
+    "gap_days",
+    "register_dials",
+    "resample",
 ]
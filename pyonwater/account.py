@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
 import json
 from typing import TYPE_CHECKING, Any, cast
 import urllib.parse
@@ -19,6 +21,9 @@ METER_UUID_FIELD = "meter_uuid"
 METER_ID_FIELD = "meter_id"
 INFO_PREFIX = "AQ.Views.MeterPicker.meters = "
 
+# Number of meters requested per new_search page during discovery.
+DEFAULT_PAGE_SIZE = 100
+
 
 class Account:
     """Class represents account object."""
@@ -36,10 +41,50 @@ class Account:
 
     async def fetch_meter_readers(self, client: Client) -> list[MeterReader]:
         """List the meter readers associated with the account."""
-        new_search_meters = await self._fetch_meter_readers_new_search(client)
-        if new_search_meters:
-            return new_search_meters
+        return [reader async for reader in self.iter_meter_readers(client)]
+
+    async def iter_meter_readers(
+        self,
+        client: Client,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[MeterReader]:
+        """Iterate over the meter readers associated with the account.
+
+        Meters are discovered page by page through the search API; the next
+        page is requested while the current one is being consumed. When the
+        search API yields nothing, the dashboard listing is used instead.
+
+        Args:
+            client: The authenticated API client.
+            page_size: Number of meters requested per search page.
+
+        Raises:
+            ValueError: If page_size is not positive.
+        """
+        if page_size < 1:
+            msg = f"page_size must be at least 1, got {page_size}"
+            raise ValueError(msg)
+
+        found = False
+        try:
+            async for reader in self._iter_meter_readers_new_search(client, page_size):
+                found = True
+                yield reader
+        except (EyeOnWaterAPIError, json.JSONDecodeError, TypeError, ValueError):
+            # Only an unusable first page falls back to the dashboard; failing
+            # halfway through would otherwise hide part of the account.
+            if found:
+                raise
+
+        if found:
+            return
+
+        for reader in await self._fetch_meter_readers_dashboard(client):
+            yield reader
 
+    async def _fetch_meter_readers_dashboard(self, client: Client) -> list[MeterReader]:
+        """Fetch meters from the meter picker embedded in the dashboard page."""
         path = DASHBOARD_ENDPOINT + urllib.parse.quote(self.username)
         data = await client.request(path=path, method="get")
 
@@ -66,57 +111,110 @@ class Account:
 
         return meters
 
-    async def _fetch_meter_readers_new_search(
-        self, client: Client
-    ) -> list[MeterReader]:
-        """Fetch meters using the API endpoint used by modern EyeOnWater flows."""
+    async def _iter_meter_readers_new_search(
+        self, client: Client, page_size: int
+    ) -> AsyncIterator[MeterReader]:
+        """Page through meters using the API endpoint of modern EyeOnWater flows."""
+        offset = 0
+        seen: set[str] = set()
+        page = asyncio.ensure_future(
+            self._fetch_new_search_page(client, offset, page_size)
+        )
         try:
-            raw = await client.request(
-                path=NEW_SEARCH_ENDPOINT,
-                method="post",
-                json={"query": {"match_all": {}}},
-            )
-            payload: dict[str, Any] = json.loads(raw)
-        except (EyeOnWaterAPIError, json.JSONDecodeError, TypeError, ValueError):
-            return []
+            while True:
+                hits, total = await page
+                offset += len(hits)
+                readers: list[MeterReader] = []
+                for hit in hits:
+                    reader = self._parse_new_search_hit(hit)
+                    if reader is None or reader.meter_uuid in seen:
+                        continue
+                    seen.add(reader.meter_uuid)
+                    readers.append(reader)
+                # The server may cap the page size, so a short page only ends
+                # the listing when no total is reported. A page with nothing
+                # new (a server ignoring "from") always ends it.
+                has_more = bool(readers) and (
+                    offset < total if total is not None else len(hits) >= page_size
+                )
+                if has_more:
+                    page = asyncio.ensure_future(
+                        self._fetch_new_search_page(client, offset, page_size)
+                    )
+
+                for reader in readers:
+                    yield reader
+
+                if not has_more:
+                    return
+        finally:
+            if not page.done():
+                page.cancel()
+
+    @staticmethod
+    async def _fetch_new_search_page(
+        client: Client, offset: int, page_size: int
+    ) -> tuple[list[Any], int | None]:
+        """Fetch one page of new_search hits and the reported total hit count."""
+        raw = await client.request(
+            path=NEW_SEARCH_ENDPOINT,
+            method="post",
+            json={"query": {"match_all": {}}, "from": offset, "size": page_size},
+        )
+        payload: dict[str, Any] = json.loads(raw)
 
         elastic: dict[str, Any] = payload.get("elastic_results") or {}
         hits_wrapper: dict[str, Any] = elastic.get("hits") or {}
         hits: list[Any] = hits_wrapper.get("hits") or []
-        meters: list[MeterReader] = []
-        for hit in hits:
-            source: dict[str, Any] = hit.get("_source") or {}
-            meter_obj_raw: Any = source.get("meter")
-            meter_obj: dict[str, Any] = (
-                cast(dict[str, Any], meter_obj_raw)
-                if isinstance(meter_obj_raw, dict)
-                else {}
-            )
-
-            meter_uuid: str | None = (
-                meter_obj.get("meter_uuid")
-                or source.get(METER_UUID_FIELD)
-                or source.get("meter.meter_uuid")
-                or hit.get("_id")
-            )
-            meter_id: str | None = (
-                meter_obj.get("meter_id")
-                or source.get(METER_ID_FIELD)
-                or source.get("meter.meter_id")
-            )
-            if not meter_uuid or not meter_id:
-                continue
-
-            meters.append(MeterReader(meter_uuid=meter_uuid, meter_id=str(meter_id)))
 
-        return meters
+        total_raw: Any = hits_wrapper.get("total")
+        if isinstance(total_raw, dict):
+            total_raw = cast(dict[str, Any], total_raw).get("value")
+        total = total_raw if isinstance(total_raw, int) else None
+        return hits, total
+
+    @staticmethod
+    def _parse_new_search_hit(hit: dict[str, Any]) -> MeterReader | None:
+        """Build a MeterReader from a new_search hit, if it identifies a meter."""
+        source: dict[str, Any] = hit.get("_source") or {}
+        meter_obj_raw: Any = source.get("meter")
+        meter_obj: dict[str, Any] = (
+            cast(dict[str, Any], meter_obj_raw)
+            if isinstance(meter_obj_raw, dict)
+            else {}
+        )
+
+        meter_uuid: str | None = (
+            meter_obj.get("meter_uuid")
+            or source.get(METER_UUID_FIELD)
+            or source.get("meter.meter_uuid")
+            or hit.get("_id")
+        )
+        meter_id: str | None = (
+            meter_obj.get("meter_id")
+            or source.get(METER_ID_FIELD)
+            or source.get("meter.meter_id")
+        )
+        if not meter_uuid or not meter_id:
+            return None
+
+        return MeterReader(meter_uuid=meter_uuid, meter_id=str(meter_id))
 
     async def fetch_meters(self, client: Client) -> list[Meter]:
-        """List the meter states associated with the account."""
+        """List the meter states associated with the account.
+
+        Meter info is fetched with batched searches; meters the batch did not
+        return are looked up one by one.
+        """
         meter_readers = await self.fetch_meter_readers(client)
+        meter_infos = await MeterReader.read_meter_infos(
+            client, [reader.meter_uuid for reader in meter_readers]
+        )
         meters: list[Meter] = []
         for reader in meter_readers:
-            meter_info = await reader.read_meter_info(client)
+            meter_info = meter_infos.get(reader.meter_uuid)
+            if meter_info is None:
+                meter_info = await reader.read_meter_info(client)
             meters.append(Meter(reader, meter_info))
 
         return meters
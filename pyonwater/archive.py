@@ -0,0 +1,170 @@
+"""Append-only, memory mapped archive of meter readings."""
+
+from __future__ import annotations
+
+import datetime
+import mmap
+from pathlib import Path
+import struct
+import sys
+from typing import TYPE_CHECKING
+
+from .models import ColumnarSeries
+from .timezones import get_timezone
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .models import DataPoint
+
+MAGIC = b"PYOWARC1"
+# Magic, unit and timezone name, padded with NUL bytes.
+HEADER = struct.Struct("<8s24s32s")
+# Epoch seconds, reading and flow (NaN when missing).
+RECORD = struct.Struct("<qdd")
+FIELDS_PER_RECORD = 3
+
+
+class ReadingArchive:
+    """Archive of one meter's readings as fixed-width binary records.
+
+    The file starts with a 64 byte header holding the unit and timezone of
+    the series, followed by 24 byte records (int64 epoch seconds, float64
+    reading, float64 flow) in ascending time order, little-endian. Reading
+    maps the file into memory and exposes the records as a read-only
+    `ColumnarSeries` without parsing or copying them.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        unit: str | None = None,
+        tz: datetime.tzinfo | None = None,
+    ) -> None:
+        """Open the archive at `path`, creating it if needed.
+
+        Args:
+            path: Archive file.
+            unit: Unit of the readings, required to create a new archive.
+            tz: Timezone of the readings when creating an archive
+                (default: UTC).
+
+        Raises:
+            ValueError: If the archive does not exist and no unit is given,
+                if the file is not an archive, or if the unit does not
+                match the unit of the archive.
+        """
+        if sys.byteorder != "little":  # pragma: no cover
+            msg = "Reading archives are only supported on little-endian hosts"
+            raise ValueError(msg)
+        self.path = Path(path)
+
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            if unit is None:
+                msg = f"unit is required to create archive {self.path}"
+                raise ValueError(msg)
+            zone = getattr(tz, "zone", None) or getattr(tz, "key", None) or "UTC"
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_bytes(
+                HEADER.pack(
+                    MAGIC,
+                    _encode(_unit_name(unit), 24),
+                    _encode(zone, 32),
+                )
+            )
+
+        with self.path.open("rb") as f:
+            header = f.read(HEADER.size)
+        if len(header) != HEADER.size or header[:8] != MAGIC:
+            msg = f"{self.path} is not a reading archive"
+            raise ValueError(msg)
+        _, raw_unit, raw_zone = HEADER.unpack(header)
+        self.unit = _decode(raw_unit)
+        self.tz = get_timezone(_decode(raw_zone))
+        if unit is not None and _unit_name(unit) != self.unit:
+            msg = f"Archive {self.path} stores {self.unit}, not {unit}"
+            raise ValueError(msg)
+
+    def __len__(self) -> int:
+        """Return the number of complete records."""
+        return _record_count(self.path.stat().st_size)
+
+    def append(self, data: ColumnarSeries | list[DataPoint]) -> int:
+        """Append readings newer than the last archived one.
+
+        Returns:
+            The number of records appended.
+
+        Raises:
+            ValueError: If the data is not in the unit of the archive.
+        """
+        if isinstance(data, ColumnarSeries):
+            series = data
+            if len(series) and _unit_name(series.unit) != self.unit:
+                msg = f"Archive {self.path} stores {self.unit}, not {series.unit}"
+                raise ValueError(msg)
+        else:
+            series = ColumnarSeries.from_datapoints(data, unit=self.unit)
+
+        with self.path.open("r+b") as f:
+            count = _record_count(f.seek(0, 2))
+            # Drop a partial record left behind by an interrupted append.
+            end = HEADER.size + count * RECORD.size
+            f.truncate(end)
+            last_ts = None
+            if count:
+                f.seek(end - RECORD.size)
+                last_ts = RECORD.unpack(f.read(RECORD.size))[0]
+
+            f.seek(end)
+            records = bytearray()
+            for ts, reading, flow in zip(
+                series.timestamps, series.readings, series.flows, strict=True
+            ):
+                if last_ts is not None and ts <= last_ts:
+                    continue
+                records += RECORD.pack(ts, reading, flow)
+                last_ts = ts
+            f.write(records)
+        return len(records) // RECORD.size
+
+    def series(self) -> ColumnarSeries:
+        """Return the archived readings as a read-only, memory mapped series.
+
+        The series stays valid after further appends, but only shows the
+        records that existed when it was created.
+        """
+        size = self.path.stat().st_size
+        count = _record_count(size)
+        with self.path.open("rb") as f:
+            # The mapping outlives the file object; the views keep it alive.
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        body = memoryview(mapping)[HEADER.size : HEADER.size + count * RECORD.size]
+        ints = body.cast("q")
+        floats = body.cast("d")
+        return ColumnarSeries(
+            ints[0::FIELDS_PER_RECORD],
+            floats[1::FIELDS_PER_RECORD],
+            floats[2::FIELDS_PER_RECORD],
+            unit=self.unit,
+            tz=self.tz,
+        )
+
+
+def _record_count(size: int) -> int:
+    return max(size - HEADER.size, 0) // RECORD.size
+
+
+def _unit_name(unit: str) -> str:
+    return str(getattr(unit, "value", unit))
+
+
+def _encode(value: str, size: int) -> bytes:
+    raw = value.encode("utf-8")
+    if len(raw) > size:
+        msg = f"{value!r} does not fit in {size} bytes"
+        raise ValueError(msg)
+    return raw
+
+
+def _decode(raw: bytes) -> str:
+    return raw.rstrip(b"\0").decode("utf-8")
@@ -0,0 +1,158 @@
+"""Caches for historical data of closed days."""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+from collections import OrderedDict
+import contextlib
+import datetime
+import json
+import logging
+from pathlib import Path
+from typing import Any, NamedTuple
+import urllib.parse
+import uuid
+
+from .models import DataPoint, EOWUnits
+
+DEFAULT_MEMORY_CACHE_ENTRIES = 1024
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DayCacheKey(NamedTuple):
+    """Identifies one day of historical data of one meter."""
+
+    meter_uuid: str
+    date: datetime.date
+    aggregation: str
+    units: str
+
+
+class DayCache(abc.ABC):
+    """Storage for the data points of days that will not change anymore."""
+
+    @abc.abstractmethod
+    async def get(self, key: DayCacheKey) -> list[DataPoint] | None:
+        """Return the cached data points, or None on a cache miss."""
+
+    @abc.abstractmethod
+    async def set(self, key: DayCacheKey, points: list[DataPoint]) -> None:
+        """Store the data points of a day."""
+
+
+class MemoryDayCache(DayCache):
+    """In-memory cache evicting the least recently used days."""
+
+    def __init__(self, max_entries: int = DEFAULT_MEMORY_CACHE_ENTRIES) -> None:
+        """Initialize the cache.
+
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries < 1:
+            msg = f"max_entries must be at least 1, got {max_entries}"
+            raise ValueError(msg)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[DayCacheKey, list[DataPoint]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached days."""
+        return len(self._entries)
+
+    async def get(self, key: DayCacheKey) -> list[DataPoint] | None:
+        """Return the cached data points, or None on a cache miss."""
+        points = self._entries.get(key)
+        if points is None:
+            return None
+        self._entries.move_to_end(key)
+        return list(points)
+
+    async def set(self, key: DayCacheKey, points: list[DataPoint]) -> None:
+        """Store the data points of a day."""
+        self._entries[key] = list(points)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class FileDayCache(DayCache):
+    """On-disk cache storing one JSON file per meter day.
+
+    Timestamps are restored with a fixed UTC offset rather than the original
+    tzinfo object; they compare equal to the data points that were stored.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize the cache in the given directory."""
+        self.directory = Path(directory)
+
+    def _path(self, key: DayCacheKey) -> Path:
+        meter_dir = urllib.parse.quote(key.meter_uuid, safe="")
+        filename = urllib.parse.quote(
+            f"{key.date.isoformat()}_{key.aggregation}_{key.units}.json", safe=""
+        )
+        return self.directory / meter_dir / filename
+
+    async def get(self, key: DayCacheKey) -> list[DataPoint] | None:
+        """Return the cached data points, or None on a cache miss."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._read, self._path(key))
+
+    async def set(self, key: DayCacheKey, points: list[DataPoint]) -> None:
+        """Store the data points of a day."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._write, self._path(key), points)
+
+    @staticmethod
+    def _read(path: Path) -> list[DataPoint] | None:
+        try:
+            raw = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        try:
+            return [_point_from_json(item) for item in json.loads(raw)]
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            _LOGGER.warning("Ignoring corrupted cache file %s", path)
+            return None
+
+    @staticmethod
+    def _write(path: Path, points: list[DataPoint]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see partial data;
+        # a unique name keeps concurrent writes of one day apart.
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_text(
+                json.dumps([_point_to_json(point) for point in points]),
+                encoding="utf-8",
+            )
+            tmp_path.replace(path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+
+def _point_to_json(point: DataPoint) -> dict[str, Any]:
+    return {
+        "dt": point.dt.isoformat(),
+        "reading": point.reading,
+        "unit": str(getattr(point.unit, "value", point.unit)),
+        "flow_value": point.flow_value,
+        "end_dt": point.end_dt.isoformat() if point.end_dt else None,
+    }
+
+
+def _point_from_json(item: dict[str, Any]) -> DataPoint:
+    unit: str = item["unit"]
+    with contextlib.suppress(ValueError):
+        unit = EOWUnits(unit)
+    end_dt = item.get("end_dt")
+    return DataPoint(
+        dt=datetime.datetime.fromisoformat(item["dt"]),
+        reading=float(item["reading"]),
+        unit=unit,
+        flow_value=item.get("flow_value"),
+        end_dt=datetime.datetime.fromisoformat(end_dt) if end_dt else None,
+    )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import json
 import logging
@@ -21,11 +22,14 @@ from .exceptions import (
     EyeOnWaterAuthExpired,
     EyeOnWaterRateLimitError,
 )
+from .rate_limiter import AdaptiveRateLimiter
+from .timezones import DEFAULT_TIMEZONE_BACKEND, TimezoneBackend
 
 if TYPE_CHECKING:  # pragma: no cover
     from aiohttp import ClientSession
 
     from .account import Account
+    from .cache import DayCache
 
 TOKEN_EXPIRATION = datetime.timedelta(minutes=15)
 AUTH_ENDPOINT = "account/signin"
@@ -44,6 +48,9 @@ class Client:
         account: Account,
         *,
         timeout: ClientTimeout | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        day_cache: DayCache | None = None,
+        timezone_backend: TimezoneBackend = DEFAULT_TIMEZONE_BACKEND,
     ) -> None:
         """Initialize the client."""
         self.base_url = (
@@ -57,6 +64,16 @@ class Client:
         self.token_expiration = datetime.datetime.now()
         self.user_agent = None
         self.timeout = timeout or DEFAULT_TIMEOUT
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        # Historical data of closed days, consulted before consumption requests.
+        self.day_cache = day_cache
+        # Library used to localize timestamps of consumption and export data.
+        self.timezone_backend = timezone_backend
+        # Number of signins skipped because a concurrent caller already
+        # refreshed the token while this one was waiting for the lock.
+        self.signins_avoided = 0
+        self._auth_lock = asyncio.Lock()
+        self._auth_generation = 0
 
     def _truncate_payload(self, payload: str) -> str:
         if len(payload) <= MAX_LOG_PAYLOAD:
@@ -66,6 +83,13 @@ class Client:
     def _update_token_expiration(self) -> None:
         self.token_expiration = datetime.datetime.now() + TOKEN_EXPIRATION
 
+    def _invalidate_token(self, generation: int) -> None:
+        """Drop the token, unless it was already replaced since `generation`."""
+        if generation != self._auth_generation:
+            return
+        self.authenticated = False
+        self.token_expiration = datetime.datetime.now()
+
     @retry(  # type: ignore[misc]
         retry=retry_if_exception_type(
             (EyeOnWaterAuthExpired, EyeOnWaterRateLimitError),
@@ -82,6 +106,8 @@ class Client:
     ) -> str:
         """Make API calls against the eow API."""
         await self.authenticate()
+        generation = self._auth_generation
+        await self.rate_limiter.acquire()
         resp = await self.websession.request(
             method,
             f"{self.base_url}{path}",
@@ -91,11 +117,12 @@ class Client:
         )
         if resp.status == 403:
             _LOGGER.warning("Reached ratelimit")
+            self.rate_limiter.on_rate_limited()
             msg = "Reached ratelimit"
             raise EyeOnWaterRateLimitError(msg)
         elif resp.status == 401:
             _LOGGER.debug("Authentication token expired; requesting new token")
-            self.authenticated = False
+            self._invalidate_token(generation)
             await self.authenticate()
             raise EyeOnWaterAuthExpired
 
@@ -112,13 +139,27 @@ class Client:
             msg = f"Request failed: {resp.status} {data}"
             raise EyeOnWaterAPIError(msg)
 
+        self.rate_limiter.on_success()
         return data
 
     async def authenticate(self) -> None:
-        """Authenticate the client."""
-        if not self.is_token_valid:
+        """Authenticate the client.
+
+        Concurrent callers share a single signin request: whoever holds the
+        lock signs in, and everyone waiting behind it reuses the new cookies.
+        """
+        if self.is_token_valid:
+            return
+
+        async with self._auth_lock:
+            if self.is_token_valid:
+                self.signins_avoided += 1
+                _LOGGER.debug("Reusing login token obtained by a concurrent call")
+                return
+
             _LOGGER.debug("Requesting login token")
 
+            await self.rate_limiter.acquire()
             resp = await self.websession.request(
                 "POST",
                 f"{self.base_url}{AUTH_ENDPOINT}",
@@ -134,12 +175,14 @@ class Client:
                 raise EyeOnWaterAuthError(msg)
 
             if resp.status == 403:
+                self.rate_limiter.on_rate_limited()
                 msg = "Reached ratelimit"
                 raise EyeOnWaterRateLimitError(msg)
 
             self.cookies = resp.cookies
             self._update_token_expiration()
             self.authenticated = True
+            self._auth_generation += 1
             _LOGGER.debug("Successfully retrieved login token")
 
     def extract_json(self, line: str, prefix: str) -> list[dict[str, Any]]:
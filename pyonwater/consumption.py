@@ -0,0 +1,178 @@
+"""Consumption derived from cumulative register readings."""
+
+from __future__ import annotations
+
+from array import array
+import datetime
+from enum import IntFlag
+import itertools
+import math
+import operator
+from typing import TYPE_CHECKING, NamedTuple
+
+from .models import ColumnarSeries, DataPoint, HistoricalData, MeterInfo
+from .models.columnar import VALUE_TYPECODE
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+FLAG_TYPECODE = "B"
+
+# A drop is taken as a register rollover when the wrapped usage is below this
+# fraction of the register range; larger wrapped usage is implausible.
+ROLLOVER_MAX_FRACTION = 0.5
+
+# A drop to below this fraction of the previous reading is taken as a meter
+# (or register) replacement rather than a correction.
+REPLACEMENT_DROP_RATIO = 0.5
+
+
+class ConsumptionFlag(IntFlag):
+    """How the usage of an interval was derived."""
+
+    NONE = 0
+    # The register wrapped around; usage includes the wrap.
+    ROLLOVER = 1
+    # The reading was reset by a new meter or register; usage is unknown (NaN).
+    REPLACEMENT = 2
+    # The reading decreased for another reason; usage is the negative delta.
+    NEGATIVE = 4
+
+
+class Interval(NamedTuple):
+    """Usage between two consecutive readings."""
+
+    start: datetime.datetime
+    end: datetime.datetime
+    usage: float
+    flag: ConsumptionFlag
+
+
+class ConsumptionSeries:
+    """Per-interval usage of a series of cumulative readings.
+
+    Interval `i` runs from reading `i` to reading `i + 1`, so a series of n
+    readings has n - 1 intervals. Columns are typed memoryviews like those
+    of `ColumnarSeries`.
+    """
+
+    __slots__ = ("flags", "timestamps", "tz", "unit", "usage")
+
+    def __init__(
+        self,
+        timestamps: memoryview,
+        usage: memoryview,
+        flags: memoryview,
+        unit: str,
+        tz: datetime.tzinfo,
+    ) -> None:
+        """Initialize from reading timestamps and per-interval columns."""
+        self.timestamps = timestamps
+        self.usage = usage
+        self.flags = flags
+        self.unit = unit
+        self.tz = tz
+
+    def __len__(self) -> int:
+        """Return the number of intervals."""
+        return len(self.usage)
+
+    def __iter__(self) -> Iterator[Interval]:
+        """Iterate over the intervals."""
+        for index, (usage, flag) in enumerate(zip(self.usage, self.flags, strict=True)):
+            yield Interval(
+                start=datetime.datetime.fromtimestamp(
+                    self.timestamps[index], tz=self.tz
+                ),
+                end=datetime.datetime.fromtimestamp(
+                    self.timestamps[index + 1], tz=self.tz
+                ),
+                usage=usage,
+                flag=ConsumptionFlag(flag),
+            )
+
+    def total(self) -> float:
+        """Return the total usage, skipping intervals of unknown usage."""
+        return math.fsum(value for value in self.usage if not math.isnan(value))
+
+
+def register_dials(source: MeterInfo | HistoricalData) -> int | None:
+    """Return the number of register dials of a meter, if reported."""
+    if isinstance(source, MeterInfo):
+        encoder = source.reading.encoder
+        return encoder.dials if encoder is not None else None
+    encoders = source.hit.register_0_encoder
+    return encoders[0].dials if encoders else None
+
+
+def derive_consumption(
+    data: ColumnarSeries | list[DataPoint],
+    *,
+    dials: int | None = None,
+    rollover: float | None = None,
+) -> ConsumptionSeries:
+    """Derive per-interval usage from time-ordered cumulative readings.
+
+    Deltas of consecutive readings are computed in one pass over the
+    readings column. Only the (rare) decreasing readings are looked at
+    individually: with a known register range they may be a rollover,
+    a large drop is a meter replacement, anything else is flagged as a
+    negative delta.
+
+    Args:
+        data: Cumulative readings, e.g. `DataPoint.reading` values.
+        dials: Number of register dials (see `register_dials`); the
+            register then wraps at 10**dials, in the unit of the series.
+        rollover: Value at which the register wraps, overriding `dials`.
+
+    Raises:
+        ValueError: If dials or rollover is not positive.
+    """
+    if dials is not None and dials < 1:
+        msg = f"dials must be at least 1, got {dials}"
+        raise ValueError(msg)
+    if rollover is None and dials is not None:
+        rollover = float(10**dials)
+    if rollover is not None and rollover <= 0:
+        msg = f"rollover must be positive, got {rollover}"
+        raise ValueError(msg)
+
+    series = (
+        data
+        if isinstance(data, ColumnarSeries)
+        else ColumnarSeries.from_datapoints(data)
+    )
+    readings = series.readings
+    usage = array(VALUE_TYPECODE, map(operator.sub, readings[1:], readings))
+    flags = array(FLAG_TYPECODE, bytes(len(usage)))
+
+    # Readings normally only grow, so the scan for drops is usually skipped.
+    negatives: list[int] = []
+    if usage and min(usage) < 0:
+        negatives = list(
+            itertools.compress(itertools.count(), map((0.0).__gt__, usage))
+        )
+    for index in negatives:
+        previous, current = readings[index], readings[index + 1]
+        # A register never shows more than its range, so a reading above it
+        # means the dials do not describe this series.
+        if (
+            rollover is not None
+            and previous < rollover
+            and current + rollover - previous < rollover * ROLLOVER_MAX_FRACTION
+        ):
+            usage[index] = current + rollover - previous
+            flags[index] = ConsumptionFlag.ROLLOVER
+        elif current < previous * REPLACEMENT_DROP_RATIO:
+            usage[index] = math.nan
+            flags[index] = ConsumptionFlag.REPLACEMENT
+        else:
+            flags[index] = ConsumptionFlag.NEGATIVE
+
+    return ConsumptionSeries(
+        series.timestamps,
+        memoryview(usage),
+        memoryview(flags),
+        unit=series.unit,
+        tz=series.tz,
+    )
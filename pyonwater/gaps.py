@@ -0,0 +1,241 @@
+"""Detection and targeted backfill of missing historical data."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+from typing import TYPE_CHECKING, NamedTuple
+
+from .exceptions import EyeOnWaterAPIError, EyeOnWaterResponseIsEmpty
+from .models.columnar import series_timezone
+from .models.units import AggregationLevel
+from .resample import bucket_start, next_bucket_start
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from .client import Client
+    from .meter_reader import MeterReader
+    from .models import DataPoint
+    from .models.units import RequestUnits
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_DELAY = datetime.timedelta(hours=1)
+
+
+class Gap(NamedTuple):
+    """Missing interval [start, end) of a series, in the meter's timezone."""
+
+    start: datetime.datetime
+    end: datetime.datetime
+
+
+def find_gaps(
+    points: list[DataPoint],
+    aggregation: AggregationLevel,
+    *,
+    start: datetime.datetime | None = None,
+    end: datetime.datetime | None = None,
+    tz: datetime.tzinfo | None = None,
+) -> list[Gap]:
+    """Return the intervals of a series without data points.
+
+    The series is compared against the cadence of its aggregation level
+    (15 minutes, an hour, or a local day, week, month or year): every
+    expected bucket without a point is reported, with consecutive missing
+    buckets merged into one gap.
+
+    Args:
+        points: Time-ordered data points of one meter.
+        aggregation: Aggregation level of the series.
+        start: Beginning of the expected range (default: the first point).
+        end: End of the expected range, exclusive (default: after the last
+            point).
+        tz: Timezone of the buckets (default: the timezone of the first
+            point, or of `start`).
+    """
+    if tz is None:
+        if points:
+            tz = series_timezone(points[0].dt)
+        elif start is not None:
+            tz = series_timezone(start)
+        else:
+            return []
+    zone = tz
+
+    gaps: list[Gap] = []
+    expected = bucket_start(start, aggregation, zone) if start is not None else None
+    for point in points:
+        current = bucket_start(point.dt, aggregation, zone)
+        if expected is not None and current > expected:
+            gaps.append(Gap(expected, current))
+        if expected is None or current >= expected:
+            expected = next_bucket_start(current, aggregation, zone)
+
+    if end is not None and expected is not None and expected < end:
+        gaps.append(Gap(expected, end.astimezone(zone)))
+    return gaps
+
+
+def gap_days(gaps: Iterable[Gap]) -> list[datetime.date]:
+    """Return the local days touched by gaps, in ascending order."""
+    days: set[datetime.date] = set()
+    for gap in gaps:
+        day = gap.start.date()
+        # The end is exclusive: a gap ending at midnight stops the day before.
+        last = (
+            gap.end.astimezone(gap.start.tzinfo) - datetime.timedelta.resolution
+        ).date()
+        while day <= last:
+            days.add(day)
+            day += datetime.timedelta(days=1)
+    return sorted(days)
+
+
+class _PendingDay(NamedTuple):
+    attempts: int
+    next_attempt: datetime.datetime
+
+
+class BackfillScheduler:
+    """Re-requests missing days of one meter, with capped retries.
+
+    Days are added from gaps (see `find_gaps`) or directly. Each run
+    requests only the days that are due; a day that still returns no data
+    is retried after an exponentially growing delay, and dropped after
+    `max_retries` failed attempts.
+    """
+
+    def __init__(
+        self,
+        reader: MeterReader,
+        *,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_delay: datetime.timedelta = DEFAULT_RETRY_DELAY,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            reader: Reader of the meter to backfill.
+            max_retries: Number of attempts per day before giving up.
+            retry_delay: Delay before the second attempt, doubled for each
+                further attempt.
+
+        Raises:
+            ValueError: If max_retries is not positive or retry_delay is
+                negative.
+        """
+        if max_retries < 1:
+            msg = f"max_retries must be at least 1, got {max_retries}"
+            raise ValueError(msg)
+        if retry_delay < datetime.timedelta(0):
+            msg = f"retry_delay must not be negative, got {retry_delay}"
+            raise ValueError(msg)
+        self.reader = reader
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._pending: dict[datetime.date, _PendingDay] = {}
+        self.abandoned: set[datetime.date] = set()
+
+    @property
+    def pending(self) -> list[datetime.date]:
+        """Return the days waiting to be backfilled."""
+        return sorted(self._pending)
+
+    def add_days(self, days: Iterable[datetime.date]) -> None:
+        """Schedule days for an immediate backfill.
+
+        Days already pending keep their retry state.
+        """
+        now = datetime.datetime.now(tz=datetime.UTC)
+        for day in days:
+            self.abandoned.discard(day)
+            self._pending.setdefault(day, _PendingDay(0, now))
+
+    def add_gaps(self, gaps: Iterable[Gap]) -> None:
+        """Schedule the days touched by gaps."""
+        self.add_days(gap_days(gaps))
+
+    async def run(
+        self,
+        client: Client,
+        aggregation: AggregationLevel = AggregationLevel.HOURLY,
+        units: RequestUnits | None = None,
+        *,
+        max_concurrency: int = 1,
+    ) -> list[DataPoint]:
+        """Request the days that are due.
+
+        Days returning data are removed from the schedule. Days returning no
+        data or an unexpected response are rescheduled, or abandoned once
+        they ran out of retries.
+
+        Returns:
+            The fetched data points, ordered by day.
+
+        Raises:
+            ValueError: If max_concurrency is not positive.
+        """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+
+        now = datetime.datetime.now(tz=datetime.UTC)
+        due = sorted(
+            day for day, state in self._pending.items() if state.next_attempt <= now
+        )
+        if not due:
+            return []
+        _LOGGER.debug(
+            "Backfilling %d days for meter %s", len(due), self.reader.meter_uuid
+        )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_day(day: datetime.date) -> list[DataPoint]:
+            date = datetime.datetime.combine(day, datetime.time(), tzinfo=datetime.UTC)
+            async with semaphore:
+                try:
+                    return await self.reader.read_historical_data_one_day(
+                        client=client,
+                        date=date,
+                        aggregation=aggregation,
+                        units=units,
+                    )
+                except (EyeOnWaterAPIError, EyeOnWaterResponseIsEmpty) as e:
+                    _LOGGER.debug(
+                        "Backfill of %s on %s failed: %s",
+                        self.reader.meter_uuid,
+                        day,
+                        e,
+                    )
+                    return []
+
+        results = await asyncio.gather(*(fetch_day(day) for day in due))
+
+        statistics: list[DataPoint] = []
+        for day, result in zip(due, results, strict=True):
+            if result:
+                del self._pending[day]
+                statistics += result
+                continue
+            self._reschedule(day, now)
+        return statistics
+
+    def _reschedule(self, day: datetime.date, now: datetime.datetime) -> None:
+        attempts = self._pending[day].attempts + 1
+        if attempts >= self.max_retries:
+            _LOGGER.warning(
+                "Giving up backfill of meter %s on %s after %d attempts",
+                self.reader.meter_uuid,
+                day,
+                attempts,
+            )
+            del self._pending[day]
+            self.abandoned.add(day)
+            return
+        delay = self.retry_delay * 2 ** (attempts - 1)
+        self._pending[day] = _PendingDay(attempts, now + delay)
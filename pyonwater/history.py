@@ -0,0 +1,97 @@
+"""Incremental store of historical data points."""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from .models import DataPoint
+
+
+class HistoryStore:
+    """Data points of one meter indexed by timestamp.
+
+    Merging new points replaces points with the same `dt` (newer data wins)
+    and reports which points were added or changed, so a poll loop only has
+    to process the delta. With a retention window, points older than the
+    newest point minus the window are dropped.
+    """
+
+    def __init__(self, retention: datetime.timedelta | None = None) -> None:
+        """Initialize an empty store.
+
+        Args:
+            retention: How far back from the newest point data is kept
+                (default: keep everything).
+
+        Raises:
+            ValueError: If retention is not positive.
+        """
+        if retention is not None and retention <= datetime.timedelta(0):
+            msg = f"retention must be positive, got {retention}"
+            raise ValueError(msg)
+        self.retention = retention
+        self._points: dict[datetime.datetime, DataPoint] = {}
+        # Points ordered by dt, rebuilt lazily after a merge.
+        self._sorted: list[DataPoint] | None = []
+
+    def __len__(self) -> int:
+        """Return the number of stored points."""
+        return len(self._points)
+
+    @property
+    def latest(self) -> DataPoint | None:
+        """Return the newest stored point."""
+        points = self._ordered()
+        return points[-1] if points else None
+
+    def points(self) -> list[DataPoint]:
+        """Return the stored points ordered by timestamp."""
+        return list(self._ordered())
+
+    def merge(self, points: Iterable[DataPoint]) -> list[DataPoint]:
+        """Merge points into the store.
+
+        Returns:
+            The points that were added or replaced an older version, ordered
+            by timestamp.
+        """
+        changed: dict[datetime.datetime, DataPoint] = {}
+        for point in points:
+            if self._points.get(point.dt) != point:
+                self._points[point.dt] = point
+                changed[point.dt] = point
+        if changed:
+            self._sorted = None
+            self._apply_retention()
+        return sorted(
+            (point for point in changed.values() if point.dt in self._points),
+            key=lambda d: d.dt,
+        )
+
+    def replace(self, points: Iterable[DataPoint]) -> None:
+        """Replace the whole content of the store."""
+        self._points = {point.dt: point for point in points}
+        self._sorted = None
+        self._apply_retention()
+
+    def _ordered(self) -> list[DataPoint]:
+        if self._sorted is None:
+            # Usually already ordered (new points are appended), which keeps
+            # the sort close to linear.
+            self._sorted = sorted(self._points.values(), key=lambda d: d.dt)
+        return self._sorted
+
+    def _apply_retention(self) -> None:
+        if self.retention is None or not self._points:
+            return
+        points = self._ordered()
+        cutoff = points[-1].dt - self.retention
+        if points[0].dt >= cutoff:
+            return
+        kept = [point for point in points if point.dt >= cutoff]
+        self._points = {point.dt: point for point in kept}
+        self._sorted = kept
@@ -2,31 +2,80 @@
 
 from __future__ import annotations
 
+import datetime
 import logging
 from typing import TYPE_CHECKING
 
+from .consumption import ConsumptionSeries, derive_consumption, register_dials
 from .exceptions import EyeOnWaterException
-from .models import DataPoint
-from .units import EOWUnits, convert_to_native, deduce_native_units
+from .history import HistoryStore
+from .models import ColumnarSeries, DataPoint
+from .models.units import AggregationLevel
+from .resample import SUB_DAILY_INTERVALS
+from .units import (
+    conversion_ratio,
+    convert_datapoints_to_native,
+    deduce_native_units,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import AsyncIterator
+
     from .client import Client
-    from .meter_reader import MeterReader
+    from .meter_reader import DayBatch, MeterReader
     from .models import MeterInfo, Reading
 
 SEARCH_ENDPOINT = "/api/2/residential/new_search"
 CONSUMPTION_ENDPOINT = "/api/2/residential/consumption?eow=True"
 
+# Interval of the points read by `Meter.read_historical_data`.
+HISTORY_INTERVAL = SUB_DAILY_INTERVALS[AggregationLevel.HOURLY]
+
+# Upper bound on the days fetched by one watermark based delta read.
+DEFAULT_MAX_DELTA_DAYS = 30
+# Number of delta reads a past day may come back empty before the watermark
+# moves past it.
+DEFAULT_MAX_GAP_RETRIES = 3
+
 _LOGGER = logging.getLogger(__name__)
 
 
 class Meter:
     """Class represents meter state."""
 
-    def __init__(self, reader: MeterReader, meter_info: MeterInfo) -> None:
-        """Initialize the meter."""
+    def __init__(
+        self,
+        reader: MeterReader,
+        meter_info: MeterInfo,
+        *,
+        retention: datetime.timedelta | None = None,
+        watermark: datetime.datetime | None = None,
+        synced_read_time: datetime.datetime | None = None,
+    ) -> None:
+        """Initialize the meter.
+
+        Args:
+            reader: Reader used to fetch data of the meter.
+            meter_info: Latest meter info.
+            retention: How far back from the newest point historical data is
+                kept (default: keep everything).
+            watermark: Timestamp up to which historical data was fully
+                ingested, e.g. restored from a previous run.
+            synced_read_time: Latest read time of the meter at the last
+                successful history sync, e.g. restored from a previous run.
+        """
         self._reader = reader
-        self.last_historical_data: list[DataPoint] = []
+        self.history = HistoryStore(retention=retention)
+        # Points added or changed by the last read_historical_data call.
+        self.last_changes: list[DataPoint] = []
+        # Store this to resume delta reads after a restart.
+        self.watermark = watermark
+        # Store this too, so a restart does not refetch unchanged history.
+        self.synced_read_time = synced_read_time
+        # Past days the watermark moved past without data, e.g. to hand to
+        # `BackfillScheduler.add_days`. Callers may clear it once handled.
+        self.skipped_days: set[datetime.date] = set()
+        self._gap_retries: dict[datetime.date, int] = {}
 
         self._reading_data: Reading | None = None
         self._meter_info: MeterInfo | None = meter_info
@@ -46,6 +95,15 @@ class Meter:
         """Return meter ID."""
         return self._reader.meter_id
 
+    @property
+    def last_historical_data(self) -> list[DataPoint]:
+        """Return all historical data read so far, ordered by timestamp."""
+        return self.history.points()
+
+    @last_historical_data.setter
+    def last_historical_data(self, points: list[DataPoint]) -> None:
+        self.history.replace(points)
+
     @property
     def native_unit_of_measurement(self) -> str:
         """Return native measurement units."""
@@ -56,29 +114,272 @@ class Meter:
         self._meter_info = await self._reader.read_meter_info(client)
         self._reading_data = self._meter_info.reading
 
+    @property
+    def latest_read_time(self) -> datetime.datetime | None:
+        """Return the time of the latest read known from the meter info."""
+        if self._meter_info is None:
+            return None
+        candidates: list[datetime.datetime | None] = [
+            self._meter_info.reading.latest_read.read_time
+        ]
+        if self._meter_info.meter is not None:
+            candidates.append(self._meter_info.meter.last_read_time)
+        read_times = [_as_utc(dt) for dt in candidates if dt is not None]
+        return max(read_times, default=None)
+
+    @property
+    def has_new_data(self) -> bool:
+        """Return True if the meter read since the last history sync.
+
+        Only compares timestamps of the meter info, so call
+        `read_meter_info` first to see new reads.
+        """
+        latest = self.latest_read_time
+        return (
+            self.synced_read_time is None
+            or latest is None
+            or latest > _as_utc(self.synced_read_time)
+        )
+
+    async def refresh(
+        self,
+        client: Client,
+        *,
+        initial_days: int = 1,
+        max_days: int = DEFAULT_MAX_DELTA_DAYS,
+        max_gap_retries: int = DEFAULT_MAX_GAP_RETRIES,
+        max_concurrency: int = 1,
+        window_days: int = 1,
+    ) -> list[DataPoint]:
+        """Read the meter info, then new historical data if there is any.
+
+        The historical data read (see `read_historical_data_delta`) is
+        skipped when the latest read time did not advance since the last
+        history sync; `last_changes` is then empty.
+
+        Returns:
+            The historical data that was read, empty if it was skipped.
+        """
+        await self.read_meter_info(client)
+        if not self.has_new_data:
+            _LOGGER.debug("No new reads for meter %s", self.meter_uuid)
+            self.last_changes = []
+            return []
+        return await self.read_historical_data_delta(
+            client,
+            initial_days=initial_days,
+            max_days=max_days,
+            max_gap_retries=max_gap_retries,
+            max_concurrency=max_concurrency,
+            window_days=window_days,
+        )
+
     async def read_historical_data(
-        self, client: Client, days_to_load: int
+        self,
+        client: Client,
+        days_to_load: int,
+        *,
+        max_concurrency: int = 1,
+        window_days: int = 1,
     ) -> list[DataPoint]:
-        """Read historical data for N last days."""
+        """Read historical data for N last days.
+
+        The points are merged into `history`; the ones that were new or
+        changed are available as `last_changes`.
+        """
+        read_time = self.latest_read_time
         historical_data = await self._reader.read_historical_data(
-            client=client, days_to_load=days_to_load
+            client=client,
+            days_to_load=days_to_load,
+            max_concurrency=max_concurrency,
+            window_days=window_days,
         )
 
-        historical_data = [self.convert_to_native(dp) for dp in historical_data]
+        historical_data = convert_datapoints_to_native(
+            self._native_unit_of_measurement, historical_data
+        )
 
-        if not self.last_historical_data:
-            self.last_historical_data = historical_data
-        elif historical_data and self.last_historical_data:
-            if historical_data[-1].dt > self.last_historical_data[-1].dt:
-                # Take newer data
-                self.last_historical_data = historical_data
-            elif historical_data[-1].reading == self.last_historical_data[-1].reading:
-                # If it's the same date - take more data
-                if len(historical_data) > len(self.last_historical_data):
-                    self.last_historical_data = historical_data
+        self.last_changes = self.history.merge(historical_data)
+        # The API may lag behind the meter info; only a history that reached
+        # the latest read lets the next refresh skip the read.
+        if read_time is None or self._history_covers(read_time):
+            self.synced_read_time = read_time
+
+        return historical_data
 
+    def _history_covers(self, read_time: datetime.datetime) -> bool:
+        """Return True if the newest history point's interval covers a read."""
+        latest = self.history.latest
+        return latest is not None and _as_utc(latest.dt) + HISTORY_INTERVAL > read_time
+
+    async def read_historical_data_delta(
+        self,
+        client: Client,
+        *,
+        initial_days: int = 1,
+        max_days: int = DEFAULT_MAX_DELTA_DAYS,
+        max_gap_retries: int = DEFAULT_MAX_GAP_RETRIES,
+        max_concurrency: int = 1,
+        window_days: int = 1,
+    ) -> list[DataPoint]:
+        """Read historical data from the watermark up to today.
+
+        Without a watermark, `initial_days` days are read. Otherwise the
+        day of the watermark through today is read (at most `max_days`
+        days), so steady-state polling only fetches today. The watermark then
+        moves to the newest point, but not past a day that returned no data;
+        such gaps are fetched again by the next calls. A day still empty
+        after `max_gap_retries` reads no longer holds the watermark back.
+        Days given up on, including days beyond `max_days`, are added to
+        `skipped_days`.
+
+        Raises:
+            ValueError: If initial_days, max_days or max_gap_retries is not
+                positive.
+        """
+        if initial_days < 1:
+            msg = f"initial_days must be at least 1, got {initial_days}"
+            raise ValueError(msg)
+        if max_days < 1:
+            msg = f"max_days must be at least 1, got {max_days}"
+            raise ValueError(msg)
+        if max_gap_retries < 1:
+            msg = f"max_gap_retries must be at least 1, got {max_gap_retries}"
+            raise ValueError(msg)
+
+        today = datetime.datetime.now(tz=datetime.UTC).date()
+        if self.watermark is None:
+            days_to_load = initial_days
+        else:
+            days_to_load = max((today - self.watermark.date()).days + 1, 1)
+            if days_to_load > max_days:
+                self._skip_days(today, days_to_load, max_days)
+                days_to_load = max_days
+
+        historical_data = await self.read_historical_data(
+            client=client,
+            days_to_load=days_to_load,
+            max_concurrency=max_concurrency,
+            window_days=window_days,
+        )
+        self._advance_watermark(historical_data, today, days_to_load, max_gap_retries)
         return historical_data
 
+    def _skip_days(self, today: datetime.date, days: int, max_days: int) -> None:
+        """Record the oldest days of a delta read capped by max_days."""
+        first = today - datetime.timedelta(days=days - 1)
+        last = today - datetime.timedelta(days=max_days)
+        _LOGGER.warning(
+            "Delta read of meter %s is capped to %d days, skipping %s to %s",
+            self.meter_uuid,
+            max_days,
+            first,
+            last,
+        )
+        self.skipped_days.update(
+            first + datetime.timedelta(days=offset) for offset in range(days - max_days)
+        )
+
+    def _first_gap(
+        self,
+        loaded_days: set[datetime.date],
+        today: datetime.date,
+        days_to_load: int,
+        max_gap_retries: int,
+    ) -> datetime.date | None:
+        """Return the oldest past day without data that is still retried."""
+        # Today is still being filled, so only past days count as gaps.
+        for offset in range(days_to_load - 1, 0, -1):
+            day = today - datetime.timedelta(days=offset)
+            if day in loaded_days or day in self.skipped_days:
+                self._gap_retries.pop(day, None)
+                continue
+            retries = self._gap_retries.get(day, 0) + 1
+            if retries < max_gap_retries:
+                self._gap_retries[day] = retries
+                return day
+            _LOGGER.warning(
+                "No data for meter %s on %s after %d reads, skipping this day",
+                self.meter_uuid,
+                day,
+                retries,
+            )
+            self._gap_retries.pop(day, None)
+            self.skipped_days.add(day)
+        return None
+
+    def _advance_watermark(
+        self,
+        historical_data: list[DataPoint],
+        today: datetime.date,
+        days_to_load: int,
+        max_gap_retries: int,
+    ) -> None:
+        """Move the watermark to the newest point before the first gap."""
+        first_gap = self._first_gap(
+            {dp.dt.date() for dp in historical_data},
+            today,
+            days_to_load,
+            max_gap_retries,
+        )
+        candidates = [
+            dp.dt
+            for dp in historical_data
+            if first_gap is None or dp.dt.date() < first_gap
+        ]
+        if not candidates:
+            return
+        newest = max(candidates)
+        if self.watermark is None or newest > self.watermark:
+            self.watermark = newest
+
+    async def read_historical_series(
+        self,
+        client: Client,
+        days_to_load: int,
+        *,
+        max_concurrency: int = 1,
+        window_days: int = 1,
+    ) -> ColumnarSeries:
+        """Read historical data for N last days as a columnar series.
+
+        Unlike `read_historical_data`, this leaves `last_historical_data`
+        unchanged.
+        """
+        series = await self._reader.read_historical_series(
+            client=client,
+            days_to_load=days_to_load,
+            max_concurrency=max_concurrency,
+            window_days=window_days,
+        )
+        return self.convert_series_to_native(series)
+
+    async def iter_historical_data(
+        self,
+        client: Client,
+        days_to_load: int,
+        *,
+        max_concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncIterator[DayBatch]:
+        """Iterate over historical data for N last days as each day arrives.
+
+        See `MeterReader.iter_historical_data`; points are converted to the
+        native unit. Unlike `read_historical_data`, this leaves `history`
+        unchanged.
+        """
+        async for batch in self._reader.iter_historical_data(
+            client=client,
+            days_to_load=days_to_load,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        ):
+            yield batch._replace(
+                points=convert_datapoints_to_native(
+                    self._native_unit_of_measurement, batch.points
+                )
+            )
+
     async def read_historical_data_range_export(
         self,
         client: Client,
@@ -101,7 +402,9 @@ class Meter:
             poll_interval=poll_interval,
         )
 
-        return [self.convert_to_native(dp) for dp in historical_data]
+        return convert_datapoints_to_native(
+            self._native_unit_of_measurement, historical_data
+        )
 
     @property
     def meter_info(self) -> MeterInfo:
@@ -124,20 +427,48 @@ class Meter:
 
         return self.convert_to_native(dp)
 
-    def convert_to_native(self, dp: DataPoint) -> DataPoint:
-        """Convert a DataPoint to this meter's native unit of measurement."""
-        native_reading = convert_to_native(
-            self._native_unit_of_measurement, EOWUnits(dp.unit), dp.reading
+    def consumption(
+        self, data: ColumnarSeries | list[DataPoint] | None = None
+    ) -> ConsumptionSeries:
+        """Return per-interval usage of native unit readings.
+
+        Uses `last_historical_data` unless data is given, and the register
+        dials of the meter to recognize rollovers.
+        """
+        # The register wraps at 10**dials in its read unit, which may be a
+        # multiple (e.g. 100 GAL) of the native unit.
+        dials = register_dials(self.meter_info)
+        rollover = None
+        if dials is not None and dials > 0:
+            multiplier, divisor = conversion_ratio(
+                self._native_unit_of_measurement,
+                self.meter_info.reading.latest_read.units,
+            )
+            rollover = 10**dials * multiplier / divisor
+        return derive_consumption(
+            self.last_historical_data if data is None else data,
+            rollover=rollover,
         )
-        native_flow_value = None
-        if dp.flow_value is not None:
-            native_flow_value = convert_to_native(
-                self._native_unit_of_measurement, EOWUnits(dp.unit), dp.flow_value
+
+    def convert_series_to_native(self, series: ColumnarSeries) -> ColumnarSeries:
+        """Convert a columnar series to this meter's native unit of measurement."""
+        if not len(series):
+            return ColumnarSeries(
+                [], [], [], unit=self._native_unit_of_measurement, tz=series.tz
             )
-        return DataPoint(
-            dt=dp.dt,
-            reading=native_reading,
-            unit=self._native_unit_of_measurement,
-            flow_value=native_flow_value,
-            end_dt=dp.end_dt,
+        # All supported conversions are linear, so one ratio covers the series.
+        multiplier, divisor = conversion_ratio(
+            self._native_unit_of_measurement, series.unit
+        )
+        return series.scaled(
+            multiplier, self._native_unit_of_measurement, divisor=divisor
         )
+
+    def convert_to_native(self, dp: DataPoint) -> DataPoint:
+        """Convert a DataPoint to this meter's native unit of measurement."""
+        return convert_datapoints_to_native(self._native_unit_of_measurement, [dp])[0]
+
+
+def _as_utc(dt: datetime.datetime) -> datetime.datetime:
+    """Return an aware timestamp, reading naive ones as UTC."""
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=datetime.UTC)
@@ -8,17 +8,26 @@ import datetime
 import json
 import logging
 import time
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 from urllib.parse import urlparse
 
 from pydantic import ValidationError
 import pytz
 
+from .cache import DayCacheKey
 from .exceptions import EyeOnWaterAPIError, EyeOnWaterResponseIsEmpty
-from .models import DataPoint, HistoricalData, MeterInfo
+from .models import ColumnarSeries, DataPoint, HistoricalData, MeterInfo
 from .models.units import AggregationLevel, RequestUnits
+from .timezones import (
+    DEFAULT_TIMEZONE_BACKEND,
+    TimezoneBackend,
+    get_timezone,
+    localize_naive,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import AsyncIterator, Awaitable, Iterable
+
     from .client import Client
 
 SEARCH_ENDPOINT = "/api/2/residential/new_search"
@@ -29,18 +38,44 @@ EXPORT_STATUS_ENDPOINT = "/reports/export_check_status/"
 # Fallback units when the caller does not specify a preference.
 DEFAULT_REQUEST_UNITS = "cm"
 
+# Number of meter UUIDs sent in one batched new_search terms query.
+DEFAULT_METER_INFO_CHUNK_SIZE = 50
+
+# Number of meter UUIDs sent in one batched consumption query.
+DEFAULT_CONSUMPTION_CHUNK_SIZE = 20
+
+# A requested day is treated as closed (and cacheable) once this much time has
+# passed since its UTC midnight: the day itself plus a margin for the meter's
+# timezone and late uploads.
+CLOSED_DAY_DELAY = datetime.timedelta(days=2)
+
 _LOGGER = logging.getLogger(__name__)
 
 
+class DayBatch(NamedTuple):
+    """Historical data of one requested day."""
+
+    date: datetime.date
+    points: list[DataPoint]
+
+
 class MeterReader:
     """Class represents meter reader."""
 
-    def __init__(self, meter_uuid: str, meter_id: str) -> None:
+    def __init__(
+        self,
+        meter_uuid: str,
+        meter_id: str,
+        *,
+        timezone_backend: TimezoneBackend | None = None,
+    ) -> None:
         """Initialize the meter.
 
         Args:
             meter_uuid: The unique identifier for the meter (cannot be empty).
             meter_id: The meter ID (cannot be empty).
+            timezone_backend: Library used to localize timestamps (default:
+                the backend of the client).
 
         Raises:
             ValueError: If meter_uuid or meter_id is empty/None.
@@ -54,6 +89,7 @@ class MeterReader:
 
         self.meter_uuid = meter_uuid.strip()
         self.meter_id: str = meter_id.strip()
+        self.timezone_backend = timezone_backend
 
     async def read_meter_info(self, client: Client) -> MeterInfo:
         """Triggers an on-demand meter read and returns it when complete."""
@@ -67,20 +103,75 @@ class MeterReader:
             msg = "More than one meter reading found"
             raise EyeOnWaterAPIError(msg)
 
+        return self._parse_meter_info(meters[0]["_source"])
+
+    @staticmethod
+    async def read_meter_infos(
+        client: Client,
+        meter_uuids: list[str],
+        *,
+        chunk_size: int = DEFAULT_METER_INFO_CHUNK_SIZE,
+    ) -> dict[str, MeterInfo]:
+        """Read meter info for many meters with batched terms queries.
+
+        Args:
+            client: The authenticated API client.
+            meter_uuids: UUIDs of the meters to look up.
+            chunk_size: Maximum number of UUIDs sent per request.
+
+        Returns:
+            Meter info keyed by meter UUID. Meters missing from the response
+            are absent from the mapping.
+
+        Raises:
+            ValueError: If chunk_size is not positive.
+        """
+        if chunk_size < 1:
+            msg = f"chunk_size must be at least 1, got {chunk_size}"
+            raise ValueError(msg)
+
+        unique_uuids = list(dict.fromkeys(meter_uuids))
+        meter_infos: dict[str, MeterInfo] = {}
+        for start in range(0, len(unique_uuids), chunk_size):
+            chunk = unique_uuids[start : start + chunk_size]
+            _LOGGER.debug("Requesting meter readings for %d meters", len(chunk))
+
+            query = {
+                "query": {"terms": {"meter.meter_uuid": chunk}},
+                "size": len(chunk),
+            }
+            data = await client.request(path=SEARCH_ENDPOINT, method="post", json=query)
+            payload: dict[str, Any] = json.loads(data)
+            hits: list[dict[str, Any]] = payload["elastic_results"]["hits"]["hits"]
+            chunk_uuids = set(chunk)
+            for hit in hits:
+                meter_info = MeterReader._parse_meter_info(hit["_source"])
+                meter_uuid = (
+                    meter_info.meter.meter_uuid if meter_info.meter else None
+                ) or hit.get("_id")
+                if meter_uuid in chunk_uuids:
+                    meter_infos[meter_uuid] = meter_info
+
+        return meter_infos
+
+    @staticmethod
+    def _parse_meter_info(source: dict[str, Any]) -> MeterInfo:
+        """Validate a new_search hit source into MeterInfo."""
         try:
-            meter_info = MeterInfo.model_validate(meters[0]["_source"])
+            return MeterInfo.model_validate(source)
         except ValidationError as e:
-            msg = f"Unexpected EOW response {e} with payload {meters[0]['_source']}"
+            msg = f"Unexpected EOW response {e} with payload {source}"
             raise EyeOnWaterAPIError(msg) from e
 
-        return meter_info
-
     async def read_historical_data(
         self,
         client: Client,
         days_to_load: int,
         aggregation: AggregationLevel = AggregationLevel.HOURLY,
         units: RequestUnits | None = None,
+        *,
+        max_concurrency: int = 1,
+        window_days: int = 1,
     ) -> list[DataPoint]:
         """Retrieve historical data for today and past N days.
 
@@ -90,25 +181,65 @@ class MeterReader:
             aggregation: Granularity level for data (default: HOURLY).
                          Use QUARTER_HOURLY for 15-minute resolution.
             units: Preferred units for response data (optional).
+            max_concurrency: Maximum number of requests in flight at once
+                             (default: 1, i.e. requests are sent one by one).
+            window_days: Number of days requested per call (default: 1).
+                         Windows the API refuses are fetched day by day.
 
         Raises:
-            ValueError: If days_to_load is not positive.
+            ValueError: If days_to_load, max_concurrency or window_days is
+                        not positive.
         """
         if days_to_load < 1:
             msg = f"days_to_load must be at least 1, got {days_to_load}"
             raise ValueError(msg)
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+        if window_days < 1:
+            msg = f"window_days must be at least 1, got {window_days}"
+            raise ValueError(msg)
 
-        today = datetime.datetime.now(tz=pytz.UTC).replace(
-            hour=0,
-            minute=0,
-            second=0,
-            microsecond=0,
+        return await self.read_historical_data_for_dates(
+            client,
+            self._last_days(days_to_load),
+            aggregation,
+            units,
+            max_concurrency=max_concurrency,
+            window_days=window_days,
         )
 
-        date_list: list[datetime.datetime] = [
-            today - datetime.timedelta(days=x) for x in range(0, days_to_load)
-        ]
-        date_list.reverse()
+    async def read_historical_data_for_dates(
+        self,
+        client: Client,
+        date_list: list[datetime.datetime],
+        aggregation: AggregationLevel = AggregationLevel.HOURLY,
+        units: RequestUnits | None = None,
+        *,
+        max_concurrency: int = 1,
+        window_days: int = 1,
+    ) -> list[DataPoint]:
+        """Retrieve historical data for the given days.
+
+        Args:
+            client: The authenticated API client.
+            date_list: Days to retrieve, in ascending order. Runs of
+                consecutive days are requested in windows of up to
+                `window_days` days.
+            aggregation: Granularity level for data (default: HOURLY).
+            units: Preferred units for response data (optional).
+            max_concurrency: Maximum number of requests in flight at once.
+            window_days: Maximum number of days requested per call.
+
+        Raises:
+            ValueError: If max_concurrency or window_days is not positive.
+        """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+        if window_days < 1:
+            msg = f"window_days must be at least 1, got {window_days}"
+            raise ValueError(msg)
 
         _LOGGER.debug(
             "requesting historical statistics for %s on %s",
@@ -116,55 +247,358 @@ class MeterReader:
             [d.isoformat() for d in date_list],
         )
 
+        semaphore = asyncio.Semaphore(max_concurrency)
+        windows = self._consecutive_windows(date_list, window_days)
+
+        # Windows are gathered in date_list order, so concatenating their
+        # results keeps the combined series time-ordered.
+        return await self._gather_points(
+            self._read_window(client, dates, aggregation, units, semaphore)
+            for dates in windows
+        )
+
+    async def _read_window(
+        self,
+        client: Client,
+        dates: list[datetime.datetime],
+        aggregation: AggregationLevel,
+        units: RequestUnits | None,
+        semaphore: asyncio.Semaphore,
+    ) -> list[DataPoint]:
+        """Read consecutive days, requesting only the days not cached."""
+        cached = (
+            await self._read_cached_days(client, dates, aggregation, units)
+            if len(dates) > 1
+            else []
+        )
+        cached_days = {point.dt.date() for point in cached}
+        missing = [date for date in dates if date.date() not in cached_days]
+        fetched = await self._gather_points(
+            self._read_run(client, run, aggregation, units, semaphore)
+            for run in self._consecutive_windows(missing, len(missing))
+        )
+        if not cached:
+            return fetched
+        return sorted(fetched + cached, key=lambda point: point.dt)
+
+    async def _read_cached_days(
+        self,
+        client: Client,
+        dates: list[datetime.datetime],
+        aggregation: AggregationLevel,
+        units: RequestUnits | None,
+    ) -> list[DataPoint]:
+        """Return the cached points of the closed days among `dates`."""
         statistics: list[DataPoint] = []
+        for date in dates:
+            key = self._day_cache_key(client, date, aggregation, units)
+            if key is not None and client.day_cache is not None:
+                statistics += await client.day_cache.get(key) or []
+        return statistics
 
-        for date in date_list:
-            _LOGGER.debug(
-                "Fetching data for %s on %s",
+    async def _read_run(
+        self,
+        client: Client,
+        dates: list[datetime.datetime],
+        aggregation: AggregationLevel,
+        units: RequestUnits | None,
+        semaphore: asyncio.Semaphore,
+    ) -> list[DataPoint]:
+        """Read consecutive days in one call, or day by day if it is refused."""
+        if len(dates) > 1:
+            async with semaphore:
+                try:
+                    statistics = await self.read_historical_data_window(
+                        client=client,
+                        start_date=dates[0],
+                        end_date=dates[-1],
+                        aggregation=aggregation,
+                        units=units,
+                    )
+                except (EyeOnWaterAPIError, EyeOnWaterResponseIsEmpty) as e:
+                    _LOGGER.debug(
+                        "Range request for %s from %s to %s failed (%s)"
+                        " - falling back to daily requests",
+                        self.meter_uuid,
+                        dates[0],
+                        dates[-1],
+                        e,
+                    )
+                else:
+                    await self._cache_days(
+                        client, dates, statistics, aggregation, units
+                    )
+                    return statistics
+
+        return await self._read_days(client, dates, aggregation, units, semaphore)
+
+    async def _cache_days(
+        self,
+        client: Client,
+        dates: list[datetime.datetime],
+        statistics: list[DataPoint],
+        aggregation: AggregationLevel,
+        units: RequestUnits | None,
+    ) -> None:
+        """Store the points of a window result day by day in the day cache."""
+        if client.day_cache is None:
+            return
+        by_day: dict[datetime.date, list[DataPoint]] = {}
+        for point in statistics:
+            by_day.setdefault(point.dt.date(), []).append(point)
+        for date in dates:
+            key = self._day_cache_key(client, date, aggregation, units)
+            points = by_day.get(date.date())
+            # Like single days, days without data are not cached.
+            if key is not None and points:
+                await client.day_cache.set(key, points)
+
+    async def _read_days(
+        self,
+        client: Client,
+        dates: list[datetime.datetime],
+        aggregation: AggregationLevel,
+        units: RequestUnits | None,
+        semaphore: asyncio.Semaphore,
+    ) -> list[DataPoint]:
+        """Read days with one call each, concurrently within the semaphore."""
+
+        async def fetch_day(date: datetime.datetime) -> list[DataPoint]:
+            async with semaphore:
+                return await self._read_day_or_skip(client, date, aggregation, units)
+
+        return await self._gather_points(fetch_day(date) for date in dates)
+
+    @staticmethod
+    async def _gather_points(
+        requests: Iterable[Awaitable[list[DataPoint]]],
+    ) -> list[DataPoint]:
+        """Run requests concurrently and concatenate their points in order.
+
+        The remaining requests are cancelled if one of them fails.
+        """
+        tasks = [asyncio.ensure_future(request) for request in requests]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        statistics: list[DataPoint] = []
+        for result in results:
+            statistics += result
+        return statistics
+
+    async def iter_historical_data(
+        self,
+        client: Client,
+        days_to_load: int,
+        aggregation: AggregationLevel = AggregationLevel.HOURLY,
+        units: RequestUnits | None = None,
+        *,
+        max_concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncIterator[DayBatch]:
+        """Iterate over historical data for today and past N days, day by day.
+
+        Each day is yielded as soon as its request completed, so callers can
+        store it while the remaining days are fetched. At most
+        `max_concurrency` days are requested or waiting to be consumed at
+        once: a slow consumer holds back further requests. Days without data
+        are yielded with an empty list of points.
+
+        Args:
+            client: The authenticated API client.
+            days_to_load: Number of days of history to retrieve.
+            aggregation: Granularity level for data (default: HOURLY).
+            units: Preferred units for response data (optional).
+            max_concurrency: Maximum number of requests in flight at once.
+            ordered: Yield days in date order (default). Otherwise days are
+                yielded in completion order; use `DayBatch.date` to tell
+                them apart.
+
+        Raises:
+            ValueError: If days_to_load or max_concurrency is not positive.
+        """
+        if days_to_load < 1:
+            msg = f"days_to_load must be at least 1, got {days_to_load}"
+            raise ValueError(msg)
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+
+        dates = iter(self._last_days(days_to_load))
+        # Requests in flight (or done but not consumed yet), by date.
+        pending: dict[asyncio.Task[list[DataPoint]], datetime.datetime] = {}
+
+        def request_next_day() -> None:
+            date = next(dates, None)
+            if date is not None:
+                task = asyncio.ensure_future(
+                    self._read_day_or_skip(client, date, aggregation, units)
+                )
+                pending[task] = date
+
+        for _ in range(max_concurrency):
+            request_next_day()
+        try:
+            while pending:
+                done = await self._wait_for_days(pending, ordered=ordered)
+                batches = [DayBatch(pending.pop(t).date(), t.result()) for t in done]
+                # Refill before yielding so requests run while the consumer
+                # processes the batches.
+                for _ in batches:
+                    request_next_day()
+                for batch in batches:
+                    yield batch
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    @staticmethod
+    async def _wait_for_days(
+        pending: dict[asyncio.Task[list[DataPoint]], datetime.datetime],
+        *,
+        ordered: bool,
+    ) -> list[asyncio.Task[list[DataPoint]]]:
+        """Wait for the next day (ordered) or any days to complete."""
+        if ordered:
+            # Dicts keep insertion order, which is date order here.
+            task = next(iter(pending))
+            await asyncio.wait([task])
+            return [task]
+        finished, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        return sorted(finished, key=lambda t: pending[t])
+
+    async def _read_day_or_skip(
+        self,
+        client: Client,
+        date: datetime.datetime,
+        aggregation: AggregationLevel,
+        units: RequestUnits | None,
+    ) -> list[DataPoint]:
+        """Read one day, returning no points when the API has no data."""
+        _LOGGER.debug(
+            "Fetching data for %s on %s",
+            self.meter_uuid,
+            date,
+        )
+        try:
+            return await self.read_historical_data_one_day(
+                client=client,
+                date=date,
+                aggregation=aggregation,
+                units=units,
+            )
+        except EyeOnWaterResponseIsEmpty:
+            _LOGGER.warning(
+                "Empty response from API for meter %s on %s - skipping this date",
                 self.meter_uuid,
                 date,
             )
-            try:
-                statistics += await self.read_historical_data_one_day(
-                    client=client,
-                    date=date,
-                    aggregation=aggregation,
-                    units=units,
-                )
-            except EyeOnWaterResponseIsEmpty:
-                _LOGGER.warning(
-                    "Empty response from API for meter %s on %s - skipping this date",
-                    self.meter_uuid,
-                    date,
-                )
-                continue
+            return []
 
-        return statistics
+    @staticmethod
+    def _last_days(days_to_load: int) -> list[datetime.datetime]:
+        """Return UTC midnights of today and the previous days, ascending."""
+        today = datetime.datetime.now(tz=pytz.UTC).replace(
+            hour=0,
+            minute=0,
+            second=0,
+            microsecond=0,
+        )
+        return [
+            today - datetime.timedelta(days=x) for x in range(days_to_load - 1, -1, -1)
+        ]
+
+    @staticmethod
+    def _consecutive_windows(
+        date_list: list[datetime.datetime], window_days: int
+    ) -> list[list[datetime.datetime]]:
+        """Split ascending dates into runs of at most window_days consecutive days."""
+        windows: list[list[datetime.datetime]] = []
+        for date in date_list:
+            if (
+                windows
+                and len(windows[-1]) < window_days
+                and date - windows[-1][-1] == datetime.timedelta(days=1)
+            ):
+                windows[-1].append(date)
+            else:
+                windows.append([date])
+        return windows
 
-    def convert(self, data: HistoricalData, key: str) -> list[DataPoint]:
+    async def read_historical_series(
+        self,
+        client: Client,
+        days_to_load: int,
+        aggregation: AggregationLevel = AggregationLevel.HOURLY,
+        units: RequestUnits | None = None,
+        *,
+        max_concurrency: int = 1,
+        window_days: int = 1,
+    ) -> ColumnarSeries:
+        """Retrieve historical data for today and past N days as a columnar series.
+
+        Takes the same arguments as `read_historical_data`.
+
+        Raises:
+            ValueError: If the API returned points in more than one unit.
+        """
+        statistics = await self.read_historical_data(
+            client=client,
+            days_to_load=days_to_load,
+            aggregation=aggregation,
+            units=units,
+            max_concurrency=max_concurrency,
+            window_days=window_days,
+        )
+        return ColumnarSeries.from_datapoints(statistics)
+
+    def convert(
+        self,
+        data: HistoricalData,
+        key: str,
+        backend: TimezoneBackend | None = None,
+    ) -> list[DataPoint]:
         """Convert the raw data into a list of DataPoint objects."""
+        backend = backend or self.timezone_backend or DEFAULT_TIMEZONE_BACKEND
+        return self._convert_timeserie(data, key, backend)
 
-        timezones = data.hit.meter_timezone
-        timezone = pytz.timezone(timezones[0])
+    def _timezone_backend(self, client: Client) -> TimezoneBackend:
+        """Return the timezone backend of the reader, or else of the client."""
+        return self.timezone_backend or client.timezone_backend
+
+    @staticmethod
+    def _convert_timeserie(
+        data: HistoricalData,
+        key: str,
+        backend: TimezoneBackend = DEFAULT_TIMEZONE_BACKEND,
+    ) -> list[DataPoint]:
+        """Convert one timeseries of the raw data into DataPoint objects."""
+        timezone = get_timezone(MeterReader._meter_timezone(data, key), backend)
 
         ts = data.timeseries[key].series
-        statistics: list[DataPoint] = []
 
         _LOGGER.debug("Converting %d total data points from API response", len(ts))
 
-        skipped_count = 0
-        for d in ts:
-            if d.bill_read is None or d.display_unit is None:
-                skipped_count += 1
-                continue
+        valid = [
+            d for d in ts if d.bill_read is not None and d.display_unit is not None
+        ]
+        skipped_count = len(ts) - len(valid)
+        # Offsets are resolved once per DST segment instead of once per point.
+        localized = localize_naive(timezone, [d.date for d in valid])
 
-            statistics.append(
-                DataPoint(
-                    dt=timezone.localize(d.date),
-                    reading=d.bill_read,
-                    unit=d.display_unit,
-                ),
+        statistics = [
+            DataPoint(
+                dt=dt,
+                reading=cast(float, d.bill_read),
+                unit=cast(str, d.display_unit),
             )
+            for dt, d in zip(localized.values, valid, strict=True)
+        ]
 
         _LOGGER.debug(
             "After filtering: %d valid points "
@@ -172,10 +606,34 @@ class MeterReader:
             len(statistics),
             skipped_count,
         )
-        statistics.sort(key=lambda d: d.dt)
+        if not localized.ordered:
+            statistics.sort(key=lambda d: d.dt)
 
         return statistics
 
+    @staticmethod
+    def _meter_timezone(data: HistoricalData, key: str) -> str:
+        """Return the timezone name of the meter of one timeseries.
+
+        Responses covering several meters list one timezone per meter,
+        aligned with the meter UUIDs.
+
+        Raises:
+            EyeOnWaterAPIError: If the meters are in different timezones and
+                the one of this meter cannot be told apart.
+        """
+        timezones = data.hit.meter_timezone
+        if len(set(timezones)) <= 1:
+            return timezones[0]
+
+        meter_uuid = key.rsplit(",", 1)[0]
+        uuids = data.hit.meter_meter_uuid or []
+        if len(uuids) == len(timezones) and meter_uuid in uuids:
+            return timezones[uuids.index(meter_uuid)]
+
+        msg = f"Cannot resolve the timezone of meter {meter_uuid} among {timezones}"
+        raise EyeOnWaterAPIError(msg)
+
     async def read_historical_data_one_day(
         self,
         client: Client,
@@ -191,6 +649,210 @@ class MeterReader:
             aggregation: Granularity level (default: HOURLY).
                          Use QUARTER_HOURLY for 15-minute resolution.
             units: Preferred units for response (e.g., RequestUnits.GALLONS).
+
+        Closed days are served from and stored into ``client.day_cache`` when
+        the client has one.
+        """
+        cache_key = self._day_cache_key(client, date, aggregation, units)
+        if cache_key is not None and client.day_cache is not None:
+            cached = await client.day_cache.get(cache_key)
+            if cached is not None:
+                _LOGGER.debug("Using cached data for %s on %s", self.meter_uuid, date)
+                return cached
+
+        data = await self._request_historical_data(
+            client, [self.meter_uuid], date, aggregation, units
+        )
+
+        key = f"{self.meter_uuid},0"
+        if key not in data.timeseries:
+            available_keys = list(data.timeseries.keys())
+            msg = f"Meter {key} not found in timeseries keys: {available_keys}"
+            _LOGGER.debug(msg)
+            raise EyeOnWaterResponseIsEmpty(msg)
+
+        _LOGGER.debug(
+            "Found timeseries for %s, series has %d points",
+            key,
+            len(data.timeseries[key].series),
+        )
+
+        loop = asyncio.get_running_loop()
+        statistics = await loop.run_in_executor(
+            None, self.convert, data, key, self._timezone_backend(client)
+        )
+        # Days without data (e.g. not uploaded yet) are not cached, so they
+        # are requested again.
+        if cache_key is not None and client.day_cache is not None and statistics:
+            await client.day_cache.set(cache_key, statistics)
+        return statistics
+
+    def _day_cache_key(
+        self,
+        client: Client,
+        date: datetime.datetime,
+        aggregation: AggregationLevel,
+        units: RequestUnits | None,
+    ) -> DayCacheKey | None:
+        """Return the cache key of a closed day, if the client caches days."""
+        if client.day_cache is None or not self.is_closed_day(date):
+            return None
+        return DayCacheKey(
+            meter_uuid=self.meter_uuid,
+            date=date.date(),
+            aggregation=aggregation.value,
+            units=units.value if units is not None else DEFAULT_REQUEST_UNITS,
+        )
+
+    @staticmethod
+    def is_closed_day(date: datetime.datetime) -> bool:
+        """Return True if data of the requested day can no longer change."""
+        day_start = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        if day_start.tzinfo is None:
+            day_start = day_start.replace(tzinfo=pytz.UTC)
+        return datetime.datetime.now(tz=pytz.UTC) >= day_start + CLOSED_DAY_DELAY
+
+    async def read_historical_data_window(
+        self,
+        client: Client,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        aggregation: AggregationLevel = AggregationLevel.HOURLY,
+        units: RequestUnits | None = None,
+    ) -> list[DataPoint]:
+        """Retrieve historical water readings for a range of days in one call.
+
+        Args:
+            client: The authenticated API client.
+            start_date: The first day to retrieve data for.
+            end_date: The last day to retrieve data for.
+            aggregation: Granularity level (default: HOURLY).
+            units: Preferred units for response (e.g., RequestUnits.GALLONS).
+
+        Raises:
+            EyeOnWaterAPIError: If the API did not honor the requested range.
+            EyeOnWaterResponseIsEmpty: If the API returned no data.
+        """
+        data = await self._request_historical_data(
+            client,
+            [self.meter_uuid],
+            end_date,
+            aggregation,
+            units,
+            start_date=start_date,
+        )
+
+        # The API echoes the request params; a range it ignored comes back
+        # without our start date, and only covers the single `date` day.
+        echoed = data.params.start_date if data.params else None
+        if echoed is None or echoed.date() != start_date.date():
+            msg = (
+                f"Range {start_date.strftime('%Y-%m-%d')} to "
+                f"{end_date.strftime('%Y-%m-%d')} was not honored, got {echoed}"
+            )
+            raise EyeOnWaterAPIError(msg)
+
+        key = f"{self.meter_uuid},0"
+        if key not in data.timeseries:
+            available_keys = list(data.timeseries.keys())
+            msg = f"Meter {key} not found in timeseries keys: {available_keys}"
+            _LOGGER.debug(msg)
+            raise EyeOnWaterResponseIsEmpty(msg)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.convert, data, key, self._timezone_backend(client)
+        )
+
+    @staticmethod
+    async def read_historical_data_one_day_for_meters(
+        client: Client,
+        meter_uuids: list[str],
+        date: datetime.datetime,
+        aggregation: AggregationLevel = AggregationLevel.HOURLY,
+        units: RequestUnits | None = None,
+        *,
+        chunk_size: int = DEFAULT_CONSUMPTION_CHUNK_SIZE,
+    ) -> dict[str, list[DataPoint]]:
+        """Retrieve historical water readings of many meters for a requested day.
+
+        One consumption request is sent per chunk of meters and the returned
+        timeseries are split per meter. Timestamps are localized with the
+        timezone the response reports for each meter.
+
+        Args:
+            client: The authenticated API client.
+            meter_uuids: UUIDs of the meters to retrieve data for.
+            date: The date to retrieve data for.
+            aggregation: Granularity level (default: HOURLY).
+            units: Preferred units for response (e.g., RequestUnits.GALLONS).
+            chunk_size: Maximum number of meters sent per request.
+
+        Returns:
+            Data points keyed by meter UUID. Meters without data for the day
+            are absent from the mapping.
+
+        Raises:
+            ValueError: If chunk_size is not positive.
+        """
+        if chunk_size < 1:
+            msg = f"chunk_size must be at least 1, got {chunk_size}"
+            raise ValueError(msg)
+
+        def convert_chunk(
+            data: HistoricalData, keys: dict[str, str]
+        ) -> dict[str, list[DataPoint]]:
+            return {
+                meter_uuid: MeterReader._convert_timeserie(
+                    data, key, client.timezone_backend
+                )
+                for meter_uuid, key in keys.items()
+            }
+
+        unique_uuids = list(dict.fromkeys(meter_uuids))
+        loop = asyncio.get_running_loop()
+        statistics: dict[str, list[DataPoint]] = {}
+        for start in range(0, len(unique_uuids), chunk_size):
+            chunk = unique_uuids[start : start + chunk_size]
+            try:
+                data = await MeterReader._request_historical_data(
+                    client, chunk, date, aggregation, units
+                )
+            except EyeOnWaterResponseIsEmpty:
+                _LOGGER.warning(
+                    "Empty response from API for %d meters on %s",
+                    len(chunk),
+                    date,
+                )
+                continue
+
+            keys = {
+                meter_uuid: f"{meter_uuid},0"
+                for meter_uuid in chunk
+                if f"{meter_uuid},0" in data.timeseries
+            }
+            _LOGGER.debug("Found timeseries for %d of %d meters", len(keys), len(chunk))
+
+            statistics.update(
+                await loop.run_in_executor(None, convert_chunk, data, keys)
+            )
+
+        return statistics
+
+    @staticmethod
+    async def _request_historical_data(
+        client: Client,
+        meter_uuids: list[str],
+        date: datetime.datetime,
+        aggregation: AggregationLevel,
+        units: RequestUnits | None,
+        *,
+        start_date: datetime.datetime | None = None,
+    ) -> HistoricalData:
+        """Request and validate consumption for the given meters.
+
+        Only `date` is requested unless `start_date` is given, in which case
+        the range from `start_date` to `date` is requested.
         """
         params: dict[str, str | bool] = {
             "source": "barnacle",
@@ -205,10 +867,13 @@ class MeterReader:
             "display_weeks": True,
             "units": (units.value if units is not None else DEFAULT_REQUEST_UNITS),
         }
+        if start_date is not None:
+            params["start_date"] = start_date.strftime("%m/%d/%Y")
+            params["end_date"] = date.strftime("%m/%d/%Y")
 
         query: dict[str, object] = {
             "params": params,
-            "query": {"query": {"terms": {"meter.meter_uuid": [self.meter_uuid]}}},
+            "query": {"query": {"terms": {"meter.meter_uuid": meter_uuids}}},
         }
         raw_data = await client.request(
             path=CONSUMPTION_ENDPOINT,
@@ -270,21 +935,7 @@ class MeterReader:
             msg = f"Unexpected EOW response {e}"
             raise EyeOnWaterAPIError(msg) from e
 
-        key = f"{self.meter_uuid},0"
-        if key not in data.timeseries:
-            available_keys = list(data.timeseries.keys())
-            msg = f"Meter {key} not found in timeseries keys: {available_keys}"
-            _LOGGER.debug(msg)
-            raise EyeOnWaterResponseIsEmpty(msg)
-
-        _LOGGER.debug(
-            "Found timeseries for %s, series has %d points",
-            key,
-            len(data.timeseries[key].series),
-        )
-
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self.convert, data, key)
+        return data
 
     async def read_historical_data_range_export(
         self,
@@ -373,7 +1024,7 @@ class MeterReader:
         _LOGGER.debug(
             "Downloaded export CSV for task %s: %d bytes", task_id, len(raw_csv)
         )
-        points = self._parse_export_csv(raw_csv)
+        points = self._parse_export_csv(raw_csv, self._timezone_backend(client))
         _LOGGER.debug("Parsed %d export data points for task %s", len(points), task_id)
         return points
 
@@ -432,13 +1083,21 @@ class MeterReader:
         msg = f"Unsupported export url format: {export_url}"
         raise EyeOnWaterAPIError(msg)
 
-    def _parse_export_csv(self, raw_csv: str) -> list[DataPoint]:
+    def _parse_export_csv(
+        self,
+        raw_csv: str,
+        backend: TimezoneBackend | None = None,
+    ) -> list[DataPoint]:
         """Parse range export CSV into data points."""
         if not raw_csv:
             return []
+        backend = backend or self.timezone_backend or DEFAULT_TIMEZONE_BACKEND
 
         reader = csv.DictReader(raw_csv.splitlines())
-        points: list[DataPoint] = []
+        # Rows are grouped per timezone and localized in bulk afterwards.
+        rows_by_timezone: dict[
+            datetime.tzinfo, list[tuple[datetime.datetime, float, str, float | None]]
+        ] = {}
         for row in reader:
             read_time = row.get("Read_Time") or row.get("Read Time")
             timezone_name = row.get("Timezone") or "UTC"
@@ -449,18 +1108,23 @@ class MeterReader:
                 continue
             try:
                 dt_value = self._parse_export_datetime(read_time)
-                timezone = pytz.timezone(timezone_name)
+                timezone = get_timezone(timezone_name, backend)
                 reading = float(read_value)
                 flow = float(flow_value) if flow_value not in (None, "") else None  # type: ignore[arg-type]
-            except (ValueError, KeyError, pytz.UnknownTimeZoneError):
+            except (ValueError, KeyError):
                 _LOGGER.warning("Skipping unparsable CSV row: %s", row)
                 continue
-            points.append(
-                DataPoint(
-                    dt=timezone.localize(dt_value),
-                    reading=reading,
-                    unit=read_unit,
-                    flow_value=flow,
+            rows_by_timezone.setdefault(timezone, []).append(
+                (dt_value, reading, read_unit, flow)
+            )
+
+        points: list[DataPoint] = []
+        for timezone, rows in rows_by_timezone.items():
+            localized = localize_naive(timezone, [row[0] for row in rows])
+            points.extend(
+                DataPoint(dt=dt, reading=reading, unit=unit, flow_value=flow)
+                for dt, (_, reading, unit, flow) in zip(
+                    localized.values, rows, strict=True
                 )
             )
 
@@ -1,13 +1,16 @@
 """EyeOnWater data models."""
 
+from .columnar import ColumnarSeries
 from .eow_historical_models import *  # noqa: F403
 from .eow_models import *  # noqa: F403
 from .models import *  # noqa: F403
-from .models import DataPoint
+from .models import DataPoint, FrozenDataPoint
 from .units import EOWUnits, NativeUnits
 
 __all__ = [
+    "ColumnarSeries",
     "DataPoint",
     "EOWUnits",
+    "FrozenDataPoint",
     "NativeUnits",
 ]
@@ -0,0 +1,193 @@
+"""Columnar representation of historical data."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+import datetime
+import math
+from typing import overload
+
+import pytz
+
+from .models import DataPoint
+
+TIMESTAMP_TYPECODE = "q"  # int64 epoch seconds
+VALUE_TYPECODE = "d"  # float64
+
+
+class ColumnarSeries:
+    """Time series stored as parallel typed columns.
+
+    Timestamps are int64 epoch seconds, readings and flows are float64 (a
+    missing flow is NaN) and the whole series shares one unit and timezone.
+    Columns are memoryviews, so slicing a series never copies the data.
+    """
+
+    __slots__ = ("_flows", "_readings", "_timestamps", "tz", "unit")
+
+    def __init__(
+        self,
+        timestamps: Iterable[int] | memoryview,
+        readings: Iterable[float] | memoryview,
+        flows: Iterable[float] | memoryview,
+        unit: str,
+        tz: datetime.tzinfo = datetime.timezone.utc,
+    ) -> None:
+        """Initialize the series from columns of equal length.
+
+        Raises:
+            ValueError: If the columns have different lengths.
+        """
+        self._timestamps = _column(timestamps, TIMESTAMP_TYPECODE)
+        self._readings = _column(readings, VALUE_TYPECODE)
+        self._flows = _column(flows, VALUE_TYPECODE)
+        if not len(self._timestamps) == len(self._readings) == len(self._flows):
+            msg = (
+                "Columns must have the same length, got "
+                f"{len(self._timestamps)}, {len(self._readings)}, {len(self._flows)}"
+            )
+            raise ValueError(msg)
+        self.unit = unit
+        self.tz = tz
+
+    @classmethod
+    def from_datapoints(
+        cls,
+        points: list[DataPoint],
+        *,
+        unit: str | None = None,
+        tz: datetime.tzinfo | None = None,
+    ) -> ColumnarSeries:
+        """Build a series from data points sharing one unit.
+
+        Args:
+            points: Data points to store; end_dt is not kept.
+            unit: Unit of the series (default: unit of the first point).
+            tz: Timezone used when converting back (default: timezone of the
+                first point, or UTC).
+
+        Raises:
+            ValueError: If the points do not all share the series unit.
+        """
+        if unit is None:
+            unit = points[0].unit if points else ""
+        if tz is None:
+            tz = series_timezone(points[0].dt) if points else datetime.timezone.utc
+
+        if any(point.unit != unit for point in points):
+            msg = f"All data points must be in {unit}"
+            raise ValueError(msg)
+
+        return cls(
+            array(TIMESTAMP_TYPECODE, [epoch_seconds(point.dt) for point in points]),
+            array(VALUE_TYPECODE, [point.reading for point in points]),
+            array(
+                VALUE_TYPECODE,
+                [
+                    math.nan if point.flow_value is None else point.flow_value
+                    for point in points
+                ],
+            ),
+            unit=unit,
+            tz=tz,
+        )
+
+    @property
+    def timestamps(self) -> memoryview:
+        """Return epoch seconds of the data points."""
+        return self._timestamps
+
+    @property
+    def readings(self) -> memoryview:
+        """Return the readings of the data points."""
+        return self._readings
+
+    @property
+    def flows(self) -> memoryview:
+        """Return the flow values of the data points (NaN when missing)."""
+        return self._flows
+
+    def __len__(self) -> int:
+        """Return the number of data points."""
+        return len(self._timestamps)
+
+    @overload
+    def __getitem__(self, index: int) -> DataPoint: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ColumnarSeries: ...
+
+    def __getitem__(self, index: int | slice) -> DataPoint | ColumnarSeries:
+        """Return one data point, or a zero-copy view for a slice."""
+        if isinstance(index, slice):
+            return ColumnarSeries(
+                self._timestamps[index],
+                self._readings[index],
+                self._flows[index],
+                unit=self.unit,
+                tz=self.tz,
+            )
+        flow = self._flows[index]
+        return DataPoint(
+            dt=datetime.datetime.fromtimestamp(self._timestamps[index], tz=self.tz),
+            reading=self._readings[index],
+            unit=self.unit,
+            flow_value=None if math.isnan(flow) else flow,
+        )
+
+    def __iter__(self) -> Iterator[DataPoint]:
+        """Iterate over the series as data points."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_datapoints(self) -> list[DataPoint]:
+        """Convert the series back into a list of data points."""
+        return list(self)
+
+    def scaled(
+        self, factor: float, unit: str, *, divisor: float = 1.0
+    ) -> ColumnarSeries:
+        """Return a copy with readings and flows multiplied by `factor`.
+
+        Values are then divided by `divisor`, for conversions whose factor
+        is not exact in floating point.
+        """
+        return ColumnarSeries(
+            self._timestamps,
+            array(
+                VALUE_TYPECODE,
+                [value * factor / divisor for value in self._readings],
+            ),
+            array(VALUE_TYPECODE, [value * factor / divisor for value in self._flows]),
+            unit=unit,
+            tz=self.tz,
+        )
+
+
+def _column(values: Iterable[float] | memoryview, typecode: str) -> memoryview:
+    """Return values as a memoryview of the given typecode, copying if needed."""
+    if isinstance(values, memoryview) and values.format == typecode:
+        return values
+    if not isinstance(values, array) or values.typecode != typecode:
+        values = array(typecode, values)
+    return memoryview(values)
+
+
+def epoch_seconds(dt: datetime.datetime) -> int:
+    """Return epoch seconds, reading naive timestamps as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    return int(dt.timestamp())
+
+
+def series_timezone(dt: datetime.datetime) -> datetime.tzinfo:
+    """Return the zone of a timestamp, not just its fixed offset."""
+    if dt.tzinfo is None:
+        return datetime.timezone.utc
+    # pytz attaches a fixed-offset tzinfo per timestamp; recover the zone so
+    # conversions back follow DST changes.
+    zone = getattr(dt.tzinfo, "zone", None)
+    if zone is not None:
+        return pytz.timezone(zone)
+    return dt.tzinfo
@@ -11,6 +11,14 @@ from pydantic import BaseModel, Field, field_validator
 
 from .units import EOWUnits
 
+_SERIES_DATE_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",  # Actual API format: 2026-02-10 00:00:00
+    "%Y-%m-%dT%H:%M:%S",  # ISO datetime:      2026-02-10T00:00:00
+    "%Y-%m-%d",  # Date only:          2026-02-10
+    "%Y-%m",  # Month only:         2026-02
+    "%Y",  # Year only:          2026
+]
+
 
 class Register0EncoderItem(BaseModel):
     """Encoder item from register 0."""
@@ -116,15 +124,11 @@ class Series(BaseModel):
                 f"Date must be a string or datetime, got {type(v).__name__}"
             )
 
-        date_formats = [
-            "%Y-%m-%d %H:%M:%S",  # Actual API format: 2026-02-10 00:00:00
-            "%Y-%m-%dT%H:%M:%S",  # ISO datetime:      2026-02-10T00:00:00
-            "%Y-%m-%d",  # Date only:          2026-02-10
-            "%Y-%m",  # Month only:         2026-02
-            "%Y",  # Year only:          2026
-        ]
+        parsed = _parse_series_date_fast(v)
+        if parsed is not None:
+            return parsed
 
-        for fmt in date_formats:
+        for fmt in _SERIES_DATE_FORMATS:
             try:
                 return datetime.strptime(v, fmt)
             except ValueError:
@@ -136,6 +140,31 @@ class Series(BaseModel):
         )
 
 
+def _parse_series_date_fast(v: str) -> Optional[datetime]:
+    """Parse the exact date shapes the API sends, without trying formats.
+
+    The shape is picked from the string length and separators. Returns None
+    for anything else, leaving lenient variants (e.g. unpadded fields) to the
+    strptime formats.
+    """
+    try:
+        length = len(v)
+        if length == 19 or length == 10:
+            if v[4] != "-" or v[7] != "-":
+                return None
+            if length == 19 and (v[10] not in " T" or v[13] != ":" or v[16] != ":"):
+                return None
+            parsed = datetime.fromisoformat(v)
+            return parsed if parsed.tzinfo is None else None
+        if length == 7 and v[4] == "-" and v[:4].isdigit() and v[5:].isdigit():
+            return datetime(int(v[:4]), int(v[5:]), 1)
+        if length == 4 and v.isdigit():
+            return datetime(int(v), 1, 1)
+    except ValueError:
+        return None
+    return None
+
+
 class Legend(BaseModel):
     """Legend metadata for a time series."""
 
@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from datetime import datetime
 
 
-@dataclass
+def _intern_unit(unit: str) -> str:
+    """Share one string object per unit name across all data points.
+
+    Unit enums are singletons already; plain strings (e.g. parsed from CSV
+    exports) would otherwise be a separate object per point.
+    """
+    if type(unit) is str:
+        return sys.intern(unit)
+    return unit
+
+
+@dataclass(slots=True)
 class DataPoint:
     """One data point representation."""
 
@@ -18,3 +30,42 @@ class DataPoint:
     unit: str
     flow_value: float | None = None
     end_dt: datetime | None = None
+
+    def __post_init__(self) -> None:
+        """Intern the unit."""
+        self.unit = _intern_unit(self.unit)
+
+    def freeze(self) -> FrozenDataPoint:
+        """Return an immutable, hashable copy of this data point."""
+        return FrozenDataPoint(
+            dt=self.dt,
+            reading=self.reading,
+            unit=self.unit,
+            flow_value=self.flow_value,
+            end_dt=self.end_dt,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class FrozenDataPoint:
+    """Immutable, hashable data point representation."""
+
+    dt: datetime
+    reading: float
+    unit: str
+    flow_value: float | None = None
+    end_dt: datetime | None = None
+
+    def __post_init__(self) -> None:
+        """Intern the unit."""
+        object.__setattr__(self, "unit", _intern_unit(self.unit))
+
+    def thaw(self) -> DataPoint:
+        """Return a mutable copy of this data point."""
+        return DataPoint(
+            dt=self.dt,
+            reading=self.reading,
+            unit=self.unit,
+            flow_value=self.flow_value,
+            end_dt=self.end_dt,
+        )
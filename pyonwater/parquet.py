@@ -0,0 +1,227 @@
+"""Parquet export of historical series (requires the optional pyarrow)."""
+
+from __future__ import annotations
+
+from array import array
+import asyncio
+import bisect
+import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+import urllib.parse
+import uuid
+
+from .models import ColumnarSeries, DataPoint
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+PART_PREFIX = "part-"
+
+# Parquet has no second resolution timestamps, so files store milliseconds.
+TIMESTAMP_UNIT = "ms"
+
+
+def parquet_schema() -> Any:
+    """Return the schema of the data files (partition columns excluded)."""
+    return pa.schema(
+        [
+            pa.field("ts", pa.timestamp(TIMESTAMP_UNIT, tz="UTC"), nullable=False),
+            pa.field("reading", pa.float64(), nullable=False),
+            pa.field("flow_value", pa.float64()),
+            pa.field("unit", pa.dictionary(pa.int32(), pa.string()), nullable=False),
+        ]
+    )
+
+
+class ParquetExporter:
+    """Writes historical series into a Parquet dataset.
+
+    Files are laid out as `meter_uuid=<uuid>/month=<YYYY-MM>/part-NNNNN.parquet`
+    (hive partitioning, month in the meter's local time). Every write
+    appends new part files, so existing files are never rewritten; readers
+    see the union of all parts. Concurrent writes, even to the same
+    partition, get distinct part files.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize the exporter in the given directory.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        if pa is None:  # pragma: no cover
+            msg = (
+                "pyarrow is required for Parquet export: pip install pyonwater[parquet]"
+            )
+            raise ImportError(msg)
+        self.directory = Path(directory)
+        self.schema = parquet_schema()
+
+    async def write(
+        self,
+        meter_uuid: str,
+        data: ColumnarSeries | list[DataPoint],
+    ) -> list[Path]:
+        """Append a series of a meter, in the executor.
+
+        Returns:
+            The files that were written, one per month of data.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.write_sync, meter_uuid, data)
+
+    def write_sync(
+        self,
+        meter_uuid: str,
+        data: ColumnarSeries | list[DataPoint],
+    ) -> list[Path]:
+        """Append a series of a meter.
+
+        Data points are converted into a columnar series first, so they
+        must share one unit; end_dt is not exported.
+
+        Returns:
+            The files that were written, one per month of data.
+        """
+        series = (
+            data
+            if isinstance(data, ColumnarSeries)
+            else ColumnarSeries.from_datapoints(data)
+        )
+        meter_dir = self.directory / f"meter_uuid={_quote(meter_uuid)}"
+        paths = []
+        for month, part in _month_slices(series):
+            month_dir = meter_dir / f"month={month}"
+            month_dir.mkdir(parents=True, exist_ok=True)
+            path = _reserve_part(month_dir)
+            # Write to a temporary file first so readers never see partial
+            # data; the leading dot hides it from dataset discovery.
+            tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                pq.write_table(self._table(part), tmp_path)
+                tmp_path.replace(path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                path.unlink(missing_ok=True)
+                raise
+            paths.append(path)
+        return paths
+
+    def read_table(self, meter_uuid: str | None = None) -> Any:
+        """Read the dataset (or one meter of it) as a pyarrow Table.
+
+        The table includes the `meter_uuid` and `month` partition columns.
+        """
+        if not self.directory.exists():
+            return self.schema.empty_table()
+        dataset = ds.dataset(
+            self.directory,
+            format="parquet",
+            partitioning=ds.partitioning(
+                pa.schema([("meter_uuid", pa.string()), ("month", pa.string())]),
+                flavor="hive",
+            ),
+            exclude_invalid_files=True,
+        )
+        if meter_uuid is None:
+            return dataset.to_table()
+        return dataset.to_table(filter=pc.field("meter_uuid") == meter_uuid)
+
+    def _table(self, series: ColumnarSeries) -> Any:
+        count = len(series)
+        # The series columns are typed buffers, so they are shared with
+        # Arrow instead of being converted value by value.
+        timestamps = pa.Array.from_buffers(
+            pa.int64(), count, [None, _buffer(series.timestamps)]
+        )
+        readings = pa.Array.from_buffers(
+            pa.float64(), count, [None, _buffer(series.readings)]
+        )
+        flows = pa.Array.from_buffers(
+            pa.float64(), count, [None, _buffer(series.flows)]
+        )
+        flows = pc.if_else(pc.is_nan(flows), pa.scalar(None, pa.float64()), flows)
+        unit = str(getattr(series.unit, "value", series.unit))
+        units = pa.DictionaryArray.from_arrays(
+            pa.repeat(pa.scalar(0, pa.int32()), count), pa.array([unit])
+        )
+        timestamps = timestamps.cast(pa.timestamp("s", tz="UTC")).cast(
+            pa.timestamp(TIMESTAMP_UNIT, tz="UTC")
+        )
+        return pa.Table.from_arrays(
+            [timestamps, readings, flows, units], schema=self.schema
+        )
+
+
+def _buffer(column: memoryview) -> Any:
+    """Return a column as an Arrow buffer, copying it only if strided.
+
+    Arrow buffers are contiguous, while columns of e.g. a `ReadingArchive`
+    series are strided views of interleaved records.
+    """
+    if not column.contiguous:
+        column = memoryview(array(column.format, column))
+    return pa.py_buffer(column)
+
+
+def _quote(value: str) -> str:
+    return urllib.parse.quote(value, safe="")
+
+
+def _next_part(month_dir: Path) -> int:
+    """Return the number of the next part file in a partition."""
+    numbers = [
+        int(path.stem.removeprefix(PART_PREFIX))
+        for path in month_dir.glob(f"{PART_PREFIX}*.parquet")
+        if path.stem.removeprefix(PART_PREFIX).isdigit()
+    ]
+    return max(numbers, default=-1) + 1
+
+
+def _reserve_part(month_dir: Path) -> Path:
+    """Create the next free part file, empty, and return its path.
+
+    The file is created exclusively, so concurrent writers never pick the
+    same part number. Readers skip it while it is empty.
+    """
+    number = _next_part(month_dir)
+    while True:
+        path = month_dir / f"{PART_PREFIX}{number:05d}.parquet"
+        try:
+            path.touch(exist_ok=False)
+        except FileExistsError:
+            number += 1
+        else:
+            return path
+
+
+def _month_slices(series: ColumnarSeries) -> Iterator[tuple[str, ColumnarSeries]]:
+    """Split a time-ordered series into zero-copy slices per local month."""
+    timestamps = series.timestamps
+    start = 0
+    while start < len(series):
+        local = datetime.datetime.fromtimestamp(timestamps[start], tz=series.tz)
+        month_start = local.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        next_month = (month_start + datetime.timedelta(days=32)).replace(day=1)
+        # Localize the boundary through the zone so DST is taken into account.
+        boundary = _month_boundary_epoch(next_month, series.tz)
+        end = bisect.bisect_left(timestamps, boundary, lo=start)
+        end = max(end, start + 1)
+        yield month_start.strftime("%Y-%m"), series[start:end]
+        start = end
+
+
+def _month_boundary_epoch(local: datetime.datetime, tz: datetime.tzinfo) -> int:
+    naive = local.replace(tzinfo=None)
+    localize = getattr(tz, "localize", None)
+    aware = localize(naive) if localize is not None else naive.replace(tzinfo=tz)
+    return int(aware.timestamp())
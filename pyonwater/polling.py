@@ -0,0 +1,222 @@
+"""Polling of many meters driven by their upload cadence."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import datetime
+import logging
+import random
+from typing import TYPE_CHECKING
+
+from .exceptions import EyeOnWaterException
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Awaitable, Callable, Iterable
+
+    from .client import Client
+    from .meter import Meter
+    from .models import MeterInfo
+
+    PollCallback = Callable[[Client, Meter], Awaitable[object]]
+
+DEFAULT_MAX_CONCURRENCY = 4
+# Never poll a meter more often than this, whatever its cadence says.
+DEFAULT_MIN_INTERVAL = datetime.timedelta(minutes=15)
+# Poll interval of meters that do not report their cadence.
+DEFAULT_POLL_INTERVAL = datetime.timedelta(hours=1)
+# Time for an upload to be processed before it can be read from the API.
+DEFAULT_UPLOAD_DELAY = datetime.timedelta(minutes=2)
+DEFAULT_JITTER = datetime.timedelta(seconds=30)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def expected_upload(
+    meter_info: MeterInfo, now: datetime.datetime
+) -> datetime.datetime | None:
+    """Return when a meter is expected to upload next, after `now`.
+
+    The last communication time is advanced by whole communication periods
+    (falling back to the aggregation period), so missed uploads do not
+    put the expected upload in the past. Returns None if the meter does not
+    report its cadence.
+    """
+    reading = meter_info.reading
+    meter = meter_info.meter
+    last = reading.last_communication_time or (
+        meter.last_communication_time if meter is not None else None
+    )
+    seconds = (
+        reading.communication_seconds
+        or (meter.communication_seconds if meter is not None else None)
+        or reading.aggregation_seconds
+    )
+    if last is None or not seconds or seconds <= 0:
+        return None
+    if last.tzinfo is None:
+        last = last.replace(tzinfo=datetime.UTC)
+
+    period = datetime.timedelta(seconds=seconds)
+    if last > now:
+        return last
+    return last + period * ((now - last) // period + 1)
+
+
+class PollScheduler:
+    """Polls a set of meters right after their expected uploads.
+
+    Each meter is polled once when added, then after its next expected
+    upload (see `expected_upload`) plus `upload_delay` and a random jitter,
+    but never sooner than `min_interval` after its previous poll. Meters
+    that do not report their cadence are polled every `default_interval`.
+    At most `max_concurrency` polls run at once across all meters.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        meters: Iterable[Meter] = (),
+        *,
+        poll: PollCallback | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        min_interval: datetime.timedelta = DEFAULT_MIN_INTERVAL,
+        default_interval: datetime.timedelta = DEFAULT_POLL_INTERVAL,
+        upload_delay: datetime.timedelta = DEFAULT_UPLOAD_DELAY,
+        jitter: datetime.timedelta = DEFAULT_JITTER,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            client: The authenticated API client.
+            meters: Meters to poll.
+            poll: Coroutine function polling one meter (default:
+                `Meter.refresh`, which skips the history read when the
+                meter did not read since the last poll).
+            max_concurrency: Maximum number of polls running at once.
+            min_interval: Minimum time between two polls of a meter.
+            default_interval: Poll interval of meters without a cadence.
+            upload_delay: Time added to the expected upload time.
+            jitter: Upper bound of the random delay spreading polls of
+                meters with the same cadence.
+
+        Raises:
+            ValueError: If max_concurrency is not positive or an interval
+                is negative.
+        """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+        for name, value in (
+            ("min_interval", min_interval),
+            ("default_interval", default_interval),
+            ("upload_delay", upload_delay),
+            ("jitter", jitter),
+        ):
+            if value < datetime.timedelta(0):
+                msg = f"{name} must not be negative, got {value}"
+                raise ValueError(msg)
+
+        self.client = client
+        self.poll = poll or _refresh_meter
+        self.min_interval = min_interval
+        self.default_interval = default_interval
+        self.upload_delay = upload_delay
+        self.jitter = jitter
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._meters: dict[str, Meter] = {}
+        # Next poll time of every meter that is not being polled.
+        self._due: dict[str, datetime.datetime] = {}
+        self._wakeup = asyncio.Event()
+        self._running = False
+        for meter in meters:
+            self.add(meter)
+
+    def add(self, meter: Meter) -> None:
+        """Add a meter, polling it as soon as possible."""
+        self._meters[meter.meter_uuid] = meter
+        self._due[meter.meter_uuid] = datetime.datetime.now(tz=datetime.UTC)
+        self._wakeup.set()
+
+    def remove(self, meter_uuid: str) -> None:
+        """Stop polling a meter; a poll in progress is not interrupted."""
+        self._meters.pop(meter_uuid, None)
+        self._due.pop(meter_uuid, None)
+
+    def next_poll(self, meter_uuid: str) -> datetime.datetime | None:
+        """Return when a meter is polled next (None while it is polled)."""
+        return self._due.get(meter_uuid)
+
+    def stop(self) -> None:
+        """Stop `run` after the polls in progress."""
+        self._running = False
+        self._wakeup.set()
+
+    async def run(self) -> None:
+        """Poll the meters until `stop` is called."""
+        self._running = True
+        tasks: set[asyncio.Task[None]] = set()
+        try:
+            while self._running:
+                now = datetime.datetime.now(tz=datetime.UTC)
+                for meter_uuid, due in sorted(self._due.items(), key=lambda i: i[1]):
+                    if due > now:
+                        break
+                    del self._due[meter_uuid]
+                    task = asyncio.create_task(self._poll(self._meters[meter_uuid]))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+
+                timeout = (
+                    (min(self._due.values()) - now).total_seconds()
+                    if self._due
+                    else None
+                )
+                self._wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(timeout):
+                        await self._wakeup.wait()
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _poll(self, meter: Meter) -> None:
+        started = datetime.datetime.now(tz=datetime.UTC)
+        try:
+            async with self._semaphore:
+                started = datetime.datetime.now(tz=datetime.UTC)
+                await self.poll(self.client, meter)
+        except EyeOnWaterException as e:
+            _LOGGER.warning("Polling meter %s failed: %s", meter.meter_uuid, e)
+        except Exception:
+            # One broken meter (or callback) must not stop its polling.
+            _LOGGER.exception("Unexpected error polling meter %s", meter.meter_uuid)
+        finally:
+            # Also reschedule on cancellation, so a restarted run keeps it.
+            if self._meters.get(meter.meter_uuid) is meter:
+                now = datetime.datetime.now(tz=datetime.UTC)
+                self._due[meter.meter_uuid] = self._next_poll_time(meter, started, now)
+                self._wakeup.set()
+
+    def _next_poll_time(
+        self,
+        meter: Meter,
+        started: datetime.datetime,
+        now: datetime.datetime,
+    ) -> datetime.datetime:
+        upload = expected_upload(meter.meter_info, now)
+        due = (
+            upload + self.upload_delay
+            if upload is not None
+            else started + self.default_interval
+        )
+        due = max(due, started + self.min_interval)
+        # Only delay: polling before the upload would find no new data.
+        return due + self.jitter * random.random()  # nosec: B311
+
+
+async def _refresh_meter(client: Client, meter: Meter) -> None:
+    await meter.refresh(client)
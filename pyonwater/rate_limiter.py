@@ -0,0 +1,109 @@
+"""Client-side request rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+DEFAULT_MAX_RATE = 10.0
+DEFAULT_MIN_RATE = 0.1
+DEFAULT_BURST = 10
+DEFAULT_INCREASE_STEP = 0.5
+DEFAULT_DECREASE_FACTOR = 0.5
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose refill rate adapts to server pushback (AIMD).
+
+    Every request takes one token. Tokens refill at `rate` per second up to
+    `burst`. A rate-limit response multiplies the rate by `decrease_factor`,
+    each successful response adds `increase_step` back, bounded by
+    `min_rate` and `max_rate`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_rate: float = DEFAULT_MAX_RATE,
+        min_rate: float = DEFAULT_MIN_RATE,
+        initial_rate: float | None = None,
+        burst: int = DEFAULT_BURST,
+        increase_step: float = DEFAULT_INCREASE_STEP,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_rate: Upper bound for the request rate, in requests per second.
+            min_rate: Lower bound for the request rate, in requests per second.
+            initial_rate: Starting rate (default: max_rate).
+            burst: Maximum number of tokens that can be accumulated.
+            increase_step: Rate added after every successful request.
+            decrease_factor: Rate multiplier applied on a rate-limit response.
+
+        Raises:
+            ValueError: If the bounds or factors are inconsistent.
+        """
+        if min_rate <= 0:
+            msg = f"min_rate must be positive, got {min_rate}"
+            raise ValueError(msg)
+        if max_rate < min_rate:
+            msg = f"max_rate must be at least min_rate, got {max_rate} < {min_rate}"
+            raise ValueError(msg)
+        if burst < 1:
+            msg = f"burst must be at least 1, got {burst}"
+            raise ValueError(msg)
+        if not 0 < decrease_factor < 1:
+            msg = f"decrease_factor must be between 0 and 1, got {decrease_factor}"
+            raise ValueError(msg)
+        if increase_step < 0:
+            msg = f"increase_step must be non-negative, got {increase_step}"
+            raise ValueError(msg)
+
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+
+        rate = max_rate if initial_rate is None else initial_rate
+        self._rate = min(max(rate, min_rate), max_rate)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Return the currently allowed request rate (requests per second)."""
+        return self._rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self._rate)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent and take a token for it."""
+        # Waiters queue on the lock, so tokens are handed out in FIFO order.
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+
+    def on_success(self) -> None:
+        """Additively increase the rate after a successful request."""
+        self._rate = min(self.max_rate, self._rate + self.increase_step)
+
+    def on_rate_limited(self) -> None:
+        """Multiplicatively decrease the rate after the server pushed back."""
+        self._refill()
+        self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+        # Drop any saved-up burst so the slowdown takes effect immediately.
+        self._tokens = 0.0
+        _LOGGER.debug("Rate limited; lowering request rate to %.2f/s", self._rate)
@@ -0,0 +1,143 @@
+"""Local resampling of historical data to coarser aggregation levels."""
+
+from __future__ import annotations
+
+import datetime
+
+from .models import ColumnarSeries, DataPoint
+from .models.columnar import series_timezone
+from .models.units import AggregationLevel
+from .timezones import localize_naive
+
+QUARTER_HOUR_MINUTES = 15
+
+# Aggregation levels whose buckets have a fixed length.
+SUB_DAILY_INTERVALS = {
+    AggregationLevel.QUARTER_HOURLY: datetime.timedelta(minutes=QUARTER_HOUR_MINUTES),
+    AggregationLevel.HOURLY: datetime.timedelta(hours=1),
+}
+
+
+def resample(
+    data: list[DataPoint] | ColumnarSeries,
+    aggregation: AggregationLevel,
+    *,
+    tz: datetime.tzinfo | None = None,
+    week_start: int = 0,
+) -> list[DataPoint]:
+    """Resample cumulative readings into buckets of an aggregation level.
+
+    Buckets follow the wall clock of the meter's timezone: days, weeks,
+    months and years start at local midnight, so a day has 23 or 25 hours
+    around DST changes, and the repeated hour of a fall-back day forms two
+    hourly buckets. Like the consumption API, each bucket is reported at its
+    start with the last cumulative reading inside it; flow values in a
+    bucket are summed.
+
+    Args:
+        data: Time-ordered data points, e.g. quarter-hourly readings.
+        aggregation: Aggregation level of the result.
+        tz: Timezone defining the buckets (default: the timezone of the
+            first data point).
+        week_start: First day of a weekly bucket (0 = Monday, 6 = Sunday).
+
+    Raises:
+        ValueError: If week_start is not a weekday number.
+    """
+    if not 0 <= week_start <= 6:
+        msg = f"week_start must be between 0 and 6, got {week_start}"
+        raise ValueError(msg)
+
+    points = data.to_datapoints() if isinstance(data, ColumnarSeries) else data
+    if not points:
+        return []
+    zone = tz or series_timezone(points[0].dt)
+
+    buckets: list[DataPoint] = []
+    current_start: datetime.datetime | None = None
+    # Day based bucket starts only change with the local date.
+    day_cache: tuple[datetime.date, datetime.datetime] | None = None
+    for point in points:
+        local = point.dt.astimezone(zone)
+        if aggregation in SUB_DAILY_INTERVALS:
+            start = bucket_start(local, aggregation, zone)
+        else:
+            day = local.date()
+            if day_cache is None or day_cache[0] != day:
+                day_cache = (day, bucket_start(local, aggregation, zone, week_start))
+            start = day_cache[1]
+
+        if start == current_start and buckets:
+            last = buckets[-1]
+            flow_value = last.flow_value
+            if point.flow_value is not None:
+                flow_value = (flow_value or 0.0) + point.flow_value
+            buckets[-1] = DataPoint(
+                dt=start, reading=point.reading, unit=point.unit, flow_value=flow_value
+            )
+        else:
+            current_start = start
+            buckets.append(
+                DataPoint(
+                    dt=start,
+                    reading=point.reading,
+                    unit=point.unit,
+                    flow_value=point.flow_value,
+                )
+            )
+    return buckets
+
+
+def bucket_start(
+    dt: datetime.datetime,
+    aggregation: AggregationLevel,
+    zone: datetime.tzinfo,
+    week_start: int = 0,
+) -> datetime.datetime:
+    """Return the local start of the bucket that contains `dt`."""
+    local = dt.astimezone(zone)
+    if aggregation == AggregationLevel.QUARTER_HOURLY:
+        return local.replace(
+            minute=local.minute - local.minute % QUARTER_HOUR_MINUTES,
+            second=0,
+            microsecond=0,
+        )
+    if aggregation == AggregationLevel.HOURLY:
+        return local.replace(minute=0, second=0, microsecond=0)
+
+    day = local.date()
+    if aggregation == AggregationLevel.WEEKLY:
+        day -= datetime.timedelta(days=(day.weekday() - week_start) % 7)
+    elif aggregation == AggregationLevel.MONTHLY:
+        day = day.replace(day=1)
+    elif aggregation == AggregationLevel.YEARLY:
+        day = day.replace(month=1, day=1)
+    return _local_midnight(day, zone)
+
+
+def next_bucket_start(
+    start: datetime.datetime,
+    aggregation: AggregationLevel,
+    zone: datetime.tzinfo,
+) -> datetime.datetime:
+    """Return the start of the bucket following the one starting at `start`."""
+    interval = SUB_DAILY_INTERVALS.get(aggregation)
+    if interval is not None:
+        # Step in absolute time: sub-daily buckets do not stretch over DST.
+        return (start.astimezone(datetime.UTC) + interval).astimezone(zone)
+
+    day = start.astimezone(zone).date()
+    if aggregation == AggregationLevel.WEEKLY:
+        day += datetime.timedelta(days=7)
+    elif aggregation == AggregationLevel.MONTHLY:
+        day = (day.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+    elif aggregation == AggregationLevel.YEARLY:
+        day = day.replace(year=day.year + 1, month=1, day=1)
+    else:
+        day += datetime.timedelta(days=1)
+    return _local_midnight(day, zone)
+
+
+def _local_midnight(day: datetime.date, zone: datetime.tzinfo) -> datetime.datetime:
+    midnight = datetime.datetime.combine(day, datetime.time())
+    return localize_naive(zone, [midnight]).values[0]
@@ -0,0 +1,302 @@
+"""Local SQLite storage of historical data."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import datetime
+import logging
+from pathlib import Path
+import sqlite3
+from typing import TYPE_CHECKING, Any
+
+import pytz
+
+from .models import DataPoint, EOWUnits
+from .models.columnar import epoch_seconds
+from .models.units import AggregationLevel
+from .timezones import DEFAULT_TIMEZONE_BACKEND, TimezoneBackend, get_timezone
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import Client
+    from .meter_reader import MeterReader
+    from .models.units import RequestUnits
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS datapoints (
+    meter_uuid TEXT NOT NULL,
+    register INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    reading REAL NOT NULL,
+    unit TEXT NOT NULL,
+    flow_value REAL,
+    end_ts INTEGER,
+    timezone TEXT,
+    utc_offset INTEGER NOT NULL,
+    PRIMARY KEY (meter_uuid, register, ts)
+);
+CREATE INDEX IF NOT EXISTS datapoints_meter_ts ON datapoints (meter_uuid, ts);
+CREATE TABLE IF NOT EXISTS synced_days (
+    meter_uuid TEXT NOT NULL,
+    register INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    closed INTEGER NOT NULL,
+    PRIMARY KEY (meter_uuid, register, day)
+);
+"""
+
+_COLUMNS = "ts, reading, unit, flow_value, end_ts, timezone, utc_offset"
+
+
+class SQLiteStore:
+    """Historical data of many meters stored in a local SQLite database.
+
+    Points are keyed by meter, register and timestamp; writing a point that
+    already exists replaces it. Queries only read the local database. A
+    store is meant to hold a single aggregation level.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        timezone_backend: TimezoneBackend = DEFAULT_TIMEZONE_BACKEND,
+    ) -> None:
+        """Open (and create if needed) the database at `path`.
+
+        Args:
+            path: Database file, or ":memory:" for a temporary database.
+            timezone_backend: Library used to restore point timezones.
+        """
+        self.path = path
+        self.timezone_backend = timezone_backend
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        # Queries run in the executor; the lock keeps them one at a time.
+        self._lock = asyncio.Lock()
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+    async def _run(self, func: Any, *args: Any) -> Any:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, func, *args)
+
+    async def write(
+        self,
+        meter_uuid: str,
+        points: list[DataPoint],
+        *,
+        register: int = 0,
+    ) -> int:
+        """Store data points of a meter, replacing points with the same dt.
+
+        Returns:
+            The number of points written.
+        """
+        rows = [_point_to_row(meter_uuid, register, point) for point in points]
+        await self._run(self._write, rows)
+        return len(rows)
+
+    def _write(
+        self,
+        rows: list[tuple[Any, ...]],
+        synced_days: list[tuple[Any, ...]] | None = None,
+    ) -> None:
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO datapoints VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            if synced_days:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO synced_days VALUES (?, ?, ?, ?)",
+                    synced_days,
+                )
+
+    async def query(
+        self,
+        meter_uuid: str,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        *,
+        register: int = 0,
+    ) -> list[DataPoint]:
+        """Return stored points of a meter in [start, end), ordered by dt."""
+        sql = f"SELECT {_COLUMNS} FROM datapoints WHERE meter_uuid = ? AND register = ?"  # nosec: B608
+        params: list[Any] = [meter_uuid, register]
+        if start is not None:
+            sql += " AND ts >= ?"
+            params.append(epoch_seconds(start))
+        if end is not None:
+            sql += " AND ts < ?"
+            params.append(epoch_seconds(end))
+        sql += " ORDER BY ts"
+        rows = await self._run(self._fetchall, sql, params)
+        return [self._row_to_point(row) for row in rows]
+
+    async def latest(self, meter_uuid: str, *, register: int = 0) -> DataPoint | None:
+        """Return the newest stored point of a meter."""
+        rows = await self._run(
+            self._fetchall,
+            f"SELECT {_COLUMNS} FROM datapoints "  # nosec: B608
+            "WHERE meter_uuid = ? AND register = ? ORDER BY ts DESC LIMIT 1",
+            [meter_uuid, register],
+        )
+        return self._row_to_point(rows[0]) if rows else None
+
+    async def stored_days(
+        self,
+        meter_uuid: str,
+        *,
+        register: int = 0,
+    ) -> set[datetime.date]:
+        """Return the local days for which points of a meter are stored."""
+        rows = await self._run(
+            self._fetchall,
+            "SELECT DISTINCT day FROM datapoints WHERE meter_uuid = ? AND register = ?",
+            [meter_uuid, register],
+        )
+        return {datetime.date.fromisoformat(row[0]) for row in rows}
+
+    async def _closed_synced_days(
+        self, meter_uuid: str, register: int
+    ) -> set[datetime.date]:
+        """Return the days of a meter that were synced after they closed."""
+        rows = await self._run(
+            self._fetchall,
+            "SELECT day FROM synced_days "
+            "WHERE meter_uuid = ? AND register = ? AND closed = 1",
+            [meter_uuid, register],
+        )
+        return {datetime.date.fromisoformat(row[0]) for row in rows}
+
+    def _fetchall(self, sql: str, params: list[Any]) -> list[tuple[Any, ...]]:
+        return self._connection.execute(sql, params).fetchall()
+
+    async def sync(
+        self,
+        client: Client,
+        reader: MeterReader,
+        days_to_load: int,
+        aggregation: AggregationLevel = AggregationLevel.HOURLY,
+        units: RequestUnits | None = None,
+        *,
+        max_concurrency: int = 1,
+        window_days: int = 1,
+    ) -> list[DataPoint]:
+        """Fetch the days of the last `days_to_load` days that are missing.
+
+        A day is only skipped once it was synced with data after it closed
+        (see `MeterReader.is_closed_day`): days synced while still open are
+        fetched again since their data may have changed. Fetched points are
+        written to the store.
+
+        Returns:
+            The fetched data points.
+
+        Raises:
+            ValueError: If days_to_load is not positive.
+        """
+        if days_to_load < 1:
+            msg = f"days_to_load must be at least 1, got {days_to_load}"
+            raise ValueError(msg)
+
+        today = datetime.datetime.now(tz=pytz.UTC).replace(
+            hour=0,
+            minute=0,
+            second=0,
+            microsecond=0,
+        )
+        synced = await self._closed_synced_days(reader.meter_uuid, 0)
+        date_list = [
+            date
+            for date in (
+                today - datetime.timedelta(days=x)
+                for x in range(days_to_load - 1, -1, -1)
+            )
+            if date.date() not in synced
+        ]
+        _LOGGER.debug(
+            "Syncing %d of %d days for meter %s",
+            len(date_list),
+            days_to_load,
+            reader.meter_uuid,
+        )
+        if not date_list:
+            return []
+
+        # Closure is taken before the fetch, so a day closing meanwhile is
+        # fetched again next time.
+        closed = {date.date(): reader.is_closed_day(date) for date in date_list}
+        points = await reader.read_historical_data_for_dates(
+            client,
+            date_list,
+            aggregation,
+            units,
+            max_concurrency=max_concurrency,
+            window_days=window_days,
+        )
+        # Days without data are not recorded, so they are fetched again.
+        loaded_days = {point.dt.date() for point in points}
+        synced_days = [
+            (reader.meter_uuid, 0, day.isoformat(), int(is_closed))
+            for day, is_closed in closed.items()
+            if day in loaded_days
+        ]
+        rows = [_point_to_row(reader.meter_uuid, 0, point) for point in points]
+        await self._run(self._write, rows, synced_days)
+        return points
+
+    def _row_to_point(self, row: tuple[Any, ...]) -> DataPoint:
+        ts, reading, unit, flow_value, end_ts, timezone_name, utc_offset = row
+        timezone = _row_timezone(timezone_name, utc_offset, self.timezone_backend)
+        with contextlib.suppress(ValueError):
+            unit = EOWUnits(unit)
+        return DataPoint(
+            dt=datetime.datetime.fromtimestamp(ts, tz=timezone),
+            reading=reading,
+            unit=unit,
+            flow_value=flow_value,
+            end_dt=(
+                datetime.datetime.fromtimestamp(end_ts, tz=timezone)
+                if end_ts is not None
+                else None
+            ),
+        )
+
+
+def _point_to_row(meter_uuid: str, register: int, point: DataPoint) -> tuple[Any, ...]:
+    offset = point.dt.utcoffset()
+    return (
+        meter_uuid,
+        register,
+        epoch_seconds(point.dt),
+        point.dt.date().isoformat(),
+        point.reading,
+        str(getattr(point.unit, "value", point.unit)),
+        point.flow_value,
+        epoch_seconds(point.end_dt) if point.end_dt else None,
+        _timezone_name(point.dt.tzinfo),
+        int(offset.total_seconds()) if offset is not None else 0,
+    )
+
+
+def _timezone_name(tzinfo: datetime.tzinfo | None) -> str | None:
+    """Return the zone name of pytz and zoneinfo timezones."""
+    return getattr(tzinfo, "zone", None) or getattr(tzinfo, "key", None)
+
+
+def _row_timezone(
+    name: str | None, utc_offset: int, backend: TimezoneBackend
+) -> datetime.tzinfo:
+    if name is not None:
+        with contextlib.suppress(KeyError, ValueError):
+            return get_timezone(name, backend)
+    return datetime.timezone(datetime.timedelta(seconds=utc_offset))
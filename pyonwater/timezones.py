@@ -0,0 +1,205 @@
+"""Timezone lookup and bulk localization of naive meter timestamps."""
+
+from __future__ import annotations
+
+import bisect
+import datetime
+from enum import Enum
+import functools
+import itertools
+from typing import NamedTuple
+import zoneinfo
+
+import pytz
+from pytz.tzinfo import DstTzInfo
+
+_ZERO = datetime.timedelta(0)
+_DAY = datetime.timedelta(days=1)
+
+
+class TimezoneBackend(str, Enum):
+    """Library used to resolve meter timezones."""
+
+    PYTZ = "pytz"
+    ZONEINFO = "zoneinfo"
+
+
+DEFAULT_TIMEZONE_BACKEND = TimezoneBackend.PYTZ
+
+
+class LocalizedTimes(NamedTuple):
+    """Timezone aware timestamps and whether they are in ascending order."""
+
+    values: list[datetime.datetime]
+    ordered: bool
+
+
+@functools.cache
+def get_timezone(
+    name: str,
+    backend: TimezoneBackend = DEFAULT_TIMEZONE_BACKEND,
+) -> datetime.tzinfo:
+    """Return the timezone called `name` from the given backend.
+
+    Lookups are cached, so resolving the zone of every response or CSV row
+    is a dictionary hit.
+
+    Raises:
+        KeyError: If the timezone is unknown to the backend.
+        ValueError: If the name is not a valid timezone key.
+    """
+    if backend == TimezoneBackend.ZONEINFO:
+        return zoneinfo.ZoneInfo(name)
+    return pytz.timezone(name)
+
+
+def localize_naive(
+    timezone: datetime.tzinfo,
+    values: list[datetime.datetime],
+) -> LocalizedTimes:
+    """Attach `timezone` to naive local timestamps.
+
+    The result is identical to calling `timezone.localize(value)` for every
+    value, but the UTC offset is only looked up once per DST segment; points
+    inside a segment just get its tzinfo attached. Ambiguous and missing
+    local times (the hour around a DST change) still go through
+    `localize`, so they resolve exactly like before.
+
+    A `zoneinfo.ZoneInfo` is attached as is, with `fold` chosen to resolve
+    ambiguous and missing times to the same UTC offset as pytz.
+
+    `ordered` is True when the values were ascending and none of them fell
+    on a DST change, in which case the localized values are ascending too.
+    """
+    if isinstance(timezone, zoneinfo.ZoneInfo):
+        return _localize_zoneinfo(timezone, values)
+    if not isinstance(timezone, DstTzInfo):
+        localize = getattr(timezone, "localize", None)
+        if localize is None:
+            localized = [value.replace(tzinfo=timezone) for value in values]
+        else:
+            localized = [localize(value) for value in values]
+        return LocalizedTimes(localized, _is_ascending(values))
+
+    # pytz keeps the DST transitions of a zone as parallel lists.
+    transitions: list[datetime.datetime] = (
+        timezone._utc_transition_times  # type: ignore[attr-defined]
+    )
+    infos: list[tuple[datetime.timedelta, datetime.timedelta, str]] = (
+        timezone._transition_info  # type: ignore[attr-defined]
+    )
+
+    localized = []
+    ordered = True
+    # Local time window [lo, hi) in which every value maps to `current`.
+    lo = hi = datetime.datetime.max
+    current: datetime.tzinfo | None = None
+    previous: datetime.datetime | None = None
+
+    for value in values:
+        if previous is not None and value < previous:
+            ordered = False
+        previous = value
+
+        if current is not None and lo <= value < hi:
+            localized.append(value.replace(tzinfo=current))
+            continue
+
+        aware = timezone.localize(value)
+        localized.append(aware)
+
+        offset = aware.utcoffset() or datetime.timedelta(0)
+        index = bisect.bisect_right(transitions, value - offset) - 1
+        lo, hi = _segment_bounds(transitions, infos, index)
+        if lo <= value < hi:
+            current = aware.tzinfo
+        else:
+            # Ambiguous or missing local time; the next value starts over.
+            current = None
+            ordered = False
+
+    return LocalizedTimes(localized, ordered)
+
+
+def _localize_zoneinfo(
+    timezone: zoneinfo.ZoneInfo,
+    values: list[datetime.datetime],
+) -> LocalizedTimes:
+    """Attach a zoneinfo timezone, resolving DST changes like pytz does."""
+    localized = []
+    ordered = True
+    # Local day [lo, hi) known to have a single UTC offset.
+    lo = hi = datetime.datetime.max
+    previous: datetime.datetime | None = None
+
+    for value in values:
+        if previous is not None and value < previous:
+            ordered = False
+        previous = value
+
+        if lo <= value < hi:
+            localized.append(value.replace(tzinfo=timezone))
+            continue
+
+        day_start = value.replace(hour=0, minute=0, second=0, microsecond=0)
+        day_end = day_start + _DAY
+        if _single_offset(timezone, day_start, day_end):
+            lo, hi = day_start, day_end
+            localized.append(value.replace(tzinfo=timezone))
+            continue
+
+        lo = hi = datetime.datetime.max
+        aware = value.replace(tzinfo=timezone)
+        other = aware.replace(fold=1)
+        if aware.utcoffset() != other.utcoffset():
+            # Like pytz's is_dst=False: a skipped time keeps the offset from
+            # before the change (fold=0), a repeated time takes the side
+            # without DST, or the later one if that does not decide it.
+            if _is_repeated(aware) and (aware.dst() != _ZERO or other.dst() == _ZERO):
+                aware = other
+            ordered = False
+        localized.append(aware)
+
+    return LocalizedTimes(localized, ordered)
+
+
+def _is_repeated(value: datetime.datetime) -> bool:
+    """Return whether a time on a DST change is repeated, not skipped."""
+    roundtrip = value.astimezone(datetime.UTC).astimezone(value.tzinfo)
+    return roundtrip.replace(tzinfo=None) == value.replace(tzinfo=None)
+
+
+def _single_offset(
+    timezone: zoneinfo.ZoneInfo,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> bool:
+    """Return whether no DST change happens between two local times."""
+    offsets = {
+        dt.replace(tzinfo=timezone, fold=fold).utcoffset()
+        for dt in (start, end)
+        for fold in (0, 1)
+    }
+    return len(offsets) == 1
+
+
+def _segment_bounds(
+    transitions: list[datetime.datetime],
+    infos: list[tuple[datetime.timedelta, datetime.timedelta, str]],
+    index: int,
+) -> tuple[datetime.datetime, datetime.datetime]:
+    """Return the local times that only exist in the given DST segment."""
+    offset = infos[index][0]
+    if index <= 0:
+        lo = datetime.datetime.min
+    else:
+        lo = transitions[index] + max(offset, infos[index - 1][0])
+    if index + 1 >= len(transitions):
+        hi = datetime.datetime.max
+    else:
+        hi = transitions[index + 1] + min(offset, infos[index + 1][0])
+    return lo, hi
+
+
+def _is_ascending(values: list[datetime.datetime]) -> bool:
+    return all(a <= b for a, b in itertools.pairwise(values))
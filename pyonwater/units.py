@@ -1,7 +1,12 @@
 """Units related tools."""
 
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+
 from .exceptions import EyeOnWaterUnitError
-from .models import EOWUnits, NativeUnits
+from .models import DataPoint, EOWUnits, NativeUnits
 
 
 def deduce_native_units(read_unit: EOWUnits) -> NativeUnits:
@@ -35,50 +40,101 @@ def deduce_native_units(read_unit: EOWUnits) -> NativeUnits:
     )
 
 
-def convert_to_native(  # noqa: C901
-    native_unit: NativeUnits, read_unit: EOWUnits, value: float
-) -> float:
-    """Convert read units to native unit."""
+# Conversion of a read unit to a native unit as a (multiplier, divisor) pair:
+# native = value * multiplier / divisor. Every supported conversion is linear.
+# Liters are divided by 1000 because 0.001 has no exact float representation.
+CONVERSION_RATIOS: dict[NativeUnits, dict[str, tuple[float, float]]] = {
+    NativeUnits.CM: {
+        EOWUnits.UNIT_CUBIC_METER: (1.0, 1.0),
+        EOWUnits.UNIT_CM: (1.0, 1.0),
+        EOWUnits.UNIT_LITER: (1.0, 1000.0),
+        EOWUnits.UNIT_LITERS: (1.0, 1000.0),
+        EOWUnits.UNIT_LITER_LC: (1.0, 1000.0),
+    },
+    NativeUnits.GAL: {
+        EOWUnits.UNIT_KGAL: (1000.0, 1.0),
+        EOWUnits.UNIT_100_GAL: (100.0, 1.0),
+        EOWUnits.UNIT_10_GAL: (10.0, 1.0),
+        EOWUnits.UNIT_GAL: (1.0, 1.0),
+    },
+    NativeUnits.CF: {
+        EOWUnits.UNIT_CF: (1.0, 1.0),
+        EOWUnits.UNIT_CUBIC_FEET: (1.0, 1.0),
+        EOWUnits.UNIT_CCF: (100.0, 1.0),
+        EOWUnits.UNIT_10_CF: (10.0, 1.0),
+    },
+}
 
-    if native_unit == NativeUnits.CM:
-        if read_unit in [EOWUnits.UNIT_CUBIC_METER, EOWUnits.UNIT_CM]:
-            return value
-        if read_unit in [
-            EOWUnits.UNIT_LITER,
-            EOWUnits.UNIT_LITERS,
-            EOWUnits.UNIT_LITER_LC,
-        ]:
-            return value / 1000.0
-        msg = (
-            f"Unsupported measurement unit: {read_unit} "
-            f"for native unit: {native_unit}"
-        )
+
+def conversion_ratio(
+    native_unit: NativeUnits, read_unit: EOWUnits | str
+) -> tuple[float, float]:
+    """Return the (multiplier, divisor) converting read units to native units."""
+    ratios = CONVERSION_RATIOS.get(native_unit)
+    if ratios is None:
+        msg = f"Unsupported native unit: {native_unit}"
         raise EyeOnWaterUnitError(msg)
-    if native_unit == NativeUnits.GAL:
-        if read_unit == EOWUnits.UNIT_KGAL:
-            return value * 1000
-        if read_unit == EOWUnits.UNIT_100_GAL:
-            return value * 100
-        if read_unit == EOWUnits.UNIT_10_GAL:
-            return value * 10
-        if read_unit == EOWUnits.UNIT_GAL:
-            return value
+    # EOWUnits is a str enum, so plain unit strings hit the same entries.
+    ratio = ratios.get(read_unit)
+    if ratio is None:
         msg = (
             f"Unsupported measurement unit: {read_unit} "
             f"for native unit: {native_unit}"
         )
         raise EyeOnWaterUnitError(msg)
-    if native_unit == NativeUnits.CF:
-        if read_unit in [EOWUnits.UNIT_CF, EOWUnits.UNIT_CUBIC_FEET]:
-            return value
-        if read_unit == EOWUnits.UNIT_CCF:
-            return value * 100
-        if read_unit == EOWUnits.UNIT_10_CF:
-            return value * 10
-        msg = (
-            f"Unsupported measurement unit: {read_unit} "
-            f"for native unit: {native_unit}"
+    return ratio
+
+
+def conversion_factor(native_unit: NativeUnits, read_unit: EOWUnits | str) -> float:
+    """Return the factor converting values in read units to native units.
+
+    The factor of a division is rounded; convert values with
+    `conversion_ratio` (or the convert functions) for exact results.
+    """
+    multiplier, divisor = conversion_ratio(native_unit, read_unit)
+    return multiplier / divisor
+
+
+def convert_to_native(
+    native_unit: NativeUnits, read_unit: EOWUnits, value: float
+) -> float:
+    """Convert read units to native unit."""
+    multiplier, divisor = conversion_ratio(native_unit, read_unit)
+    return value * multiplier / divisor
+
+
+def convert_values_to_native(
+    native_unit: NativeUnits,
+    read_unit: EOWUnits | str,
+    values: Iterable[float],
+) -> array[float]:
+    """Convert many values sharing one read unit to native unit."""
+    multiplier, divisor = conversion_ratio(native_unit, read_unit)
+    return array("d", [value * multiplier / divisor for value in values])
+
+
+def convert_datapoints_to_native(
+    native_unit: NativeUnits, points: list[DataPoint]
+) -> list[DataPoint]:
+    """Convert data points to native unit, looking up each read unit once."""
+    ratios: dict[str, tuple[float, float]] = {}
+    converted = []
+    for dp in points:
+        ratio = ratios.get(dp.unit)
+        if ratio is None:
+            ratio = ratios[dp.unit] = conversion_ratio(native_unit, dp.unit)
+        multiplier, divisor = ratio
+        converted.append(
+            DataPoint(
+                dt=dp.dt,
+                reading=dp.reading * multiplier / divisor,
+                unit=native_unit,
+                flow_value=(
+                    None
+                    if dp.flow_value is None
+                    else dp.flow_value * multiplier / divisor
+                ),
+                end_dt=dp.end_dt,
+            )
         )
-        raise EyeOnWaterUnitError(msg)
-    msg = f"Unsupported native unit: {native_unit}"
-    raise EyeOnWaterUnitError(msg)
+    return converted
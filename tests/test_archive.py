@@ -0,0 +1,88 @@
+"""Tests for the memory mapped reading archive."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+import pytz
+
+from pyonwater import ColumnarSeries, DataPoint, EOWUnits, ReadingArchive
+
+CENTRAL = pytz.timezone("US/Central")
+
+
+def _points(start_hour: int, count: int) -> list[DataPoint]:
+    start = CENTRAL.localize(datetime(2026, 3, 1))
+    return [
+        DataPoint(
+            dt=(start + timedelta(hours=start_hour + i)).astimezone(CENTRAL),
+            reading=float(start_hour + i),
+            unit=EOWUnits.UNIT_GAL,
+            flow_value=None if i % 2 else 0.25,
+        )
+        for i in range(count)
+    ]
+
+
+def test_archive_round_trip(tmp_path: Path) -> None:
+    """Verify appended readings come back through the memory map."""
+    path = tmp_path / "meter.arc"
+    archive = ReadingArchive(path, unit=EOWUnits.UNIT_GAL, tz=CENTRAL)
+    assert len(archive.series()) == 0
+
+    assert archive.append(_points(0, 3)) == 3
+    # Only readings newer than the last archived one are appended.
+    assert archive.append(_points(2, 3)) == 2
+
+    reopened = ReadingArchive(path)
+    series = reopened.series()
+    assert reopened.unit == "GAL"
+    assert len(reopened) == 5
+    assert list(series) == _points(0, 5)
+    assert series[1].flow_value is None
+    assert series[0].dt.tzinfo.zone == "US/Central"  # type: ignore[union-attr]
+    assert series.readings.readonly
+
+
+def test_archive_series_is_a_snapshot(tmp_path: Path) -> None:
+    """Verify a series keeps its records after further appends."""
+    archive = ReadingArchive(tmp_path / "meter.arc", unit="GAL")
+    archive.append(ColumnarSeries.from_datapoints(_points(0, 2)))
+    series = archive.series()
+
+    archive.append(_points(2, 2))
+
+    assert len(series) == 2
+    assert len(archive.series()) == 4
+    assert archive.series()[2:].readings.tolist() == [2.0, 3.0]
+
+
+def test_archive_drops_partial_record(tmp_path: Path) -> None:
+    """Verify a torn trailing record is ignored and overwritten."""
+    path = tmp_path / "meter.arc"
+    archive = ReadingArchive(path, unit="GAL")
+    archive.append(_points(0, 2))
+    with path.open("ab") as f:
+        f.write(b"\x01\x02\x03")
+
+    assert len(ReadingArchive(path).series()) == 2
+    assert archive.append(_points(2, 1)) == 1
+    assert [p.reading for p in archive.series()] == [0.0, 1.0, 2.0]
+
+
+def test_archive_errors(tmp_path: Path) -> None:
+    """Verify invalid archives and units are rejected."""
+    with pytest.raises(ValueError, match="unit is required"):
+        ReadingArchive(tmp_path / "new.arc")
+
+    not_archive = tmp_path / "other.bin"
+    not_archive.write_bytes(b"something else entirely")
+    with pytest.raises(ValueError, match="is not a reading archive"):
+        ReadingArchive(not_archive)
+
+    archive = ReadingArchive(tmp_path / "meter.arc", unit="GAL")
+    with pytest.raises(ValueError, match="stores GAL"):
+        ReadingArchive(tmp_path / "meter.arc", unit="CF")
+    cf_points = [DataPoint(dt=_points(0, 1)[0].dt, reading=1.0, unit="CF")]
+    with pytest.raises(ValueError):
+        archive.append(cf_points)
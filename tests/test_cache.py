@@ -0,0 +1,211 @@
+"""Tests for the closed-day historical data caches."""
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+import json
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+from conftest import build_client, mock_historical_data_endpoint, mock_signin_endpoint
+import pytest
+
+from pyonwater import (
+    DataPoint,
+    DayCacheKey,
+    EOWUnits,
+    FileDayCache,
+    MemoryDayCache,
+    MeterReader,
+)
+
+
+def make_key(day: int) -> DayCacheKey:
+    return DayCacheKey(
+        meter_uuid="meter_uuid",
+        date=date(2026, 3, day),
+        aggregation="hourly",
+        units="gallons",
+    )
+
+
+POINTS = [
+    DataPoint(
+        dt=datetime(2026, 3, 1, 1, tzinfo=timezone(timedelta(hours=-6))),
+        reading=42.0,
+        unit=EOWUnits.UNIT_GAL,
+        flow_value=1.5,
+    ),
+    DataPoint(
+        dt=datetime(2026, 3, 1, 2, tzinfo=timezone(timedelta(hours=-6))),
+        reading=43.0,
+        unit=EOWUnits.UNIT_GAL,
+    ),
+]
+
+
+async def test_memory_day_cache_evicts_least_recently_used() -> None:
+    """Verify the memory cache keeps only the most recently used days."""
+    cache = MemoryDayCache(max_entries=2)
+    await cache.set(make_key(1), POINTS)
+    await cache.set(make_key(2), POINTS)
+    assert await cache.get(make_key(1)) == POINTS  # refresh day 1
+    await cache.set(make_key(3), POINTS)
+
+    assert len(cache) == 2
+    assert await cache.get(make_key(2)) is None
+    assert await cache.get(make_key(1)) == POINTS
+    assert await cache.get(make_key(3)) == POINTS
+
+
+def test_memory_day_cache_invalid_size() -> None:
+    """Verify max_entries must be positive."""
+    with pytest.raises(ValueError, match="max_entries must be at least 1"):
+        MemoryDayCache(max_entries=0)
+
+
+async def test_file_day_cache_round_trip(tmp_path: Path) -> None:
+    """Verify the file cache restores stored data points."""
+    cache = FileDayCache(tmp_path)
+    assert await cache.get(make_key(1)) is None
+
+    await cache.set(make_key(1), POINTS)
+
+    restored = await FileDayCache(tmp_path).get(make_key(1))
+    assert restored == POINTS
+    assert restored is not None
+    assert restored[0].unit == EOWUnits.UNIT_GAL
+
+
+async def test_file_day_cache_concurrent_sets(tmp_path: Path) -> None:
+    """Verify concurrent writes of one day neither fail nor leave temp files."""
+    cache = FileDayCache(tmp_path)
+
+    for _ in range(10):
+        await asyncio.gather(*(cache.set(make_key(1), POINTS) for _ in range(8)))
+
+    assert await cache.get(make_key(1)) == POINTS
+    assert [path.suffix for path in tmp_path.rglob("*") if path.is_file()] == [".json"]
+
+
+async def test_file_day_cache_ignores_corrupted_file(tmp_path: Path) -> None:
+    """Verify a corrupted cache file is treated as a miss."""
+    cache = FileDayCache(tmp_path)
+    await cache.set(make_key(1), POINTS)
+    for path in tmp_path.rglob("*.json"):
+        path.write_text("{not json", encoding="utf-8")
+
+    assert await cache.get(make_key(1)) is None
+
+
+async def test_meter_reader_uses_day_cache_for_closed_days(
+    aiohttp_client: Any,
+) -> None:
+    """Verify closed days are fetched once while today is always refetched."""
+    requests = 0
+
+    async def mock_counting_consumption(request: web.Request) -> web.Response:
+        nonlocal requests
+        requests += 1
+        return await mock_historical_data_endpoint(request)
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_counting_consumption)
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+    client.day_cache = MemoryDayCache()
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+
+    past_day = datetime.now(tz=timezone.utc) - timedelta(days=5)
+    first = await reader.read_historical_data_one_day(client=client, date=past_day)
+    second = await reader.read_historical_data_one_day(client=client, date=past_day)
+    assert first == second
+    assert requests == 1
+
+    today = datetime.now(tz=timezone.utc)
+    await reader.read_historical_data_one_day(client=client, date=today)
+    await reader.read_historical_data_one_day(client=client, date=today)
+    assert requests == 3
+
+
+async def test_meter_reader_window_uses_day_cache(aiohttp_client: Any) -> None:
+    """Verify windows store closed days one by one and skip cached days."""
+    requests: list[dict[str, Any]] = []
+
+    async def mock_range_consumption(request: web.Request) -> web.Response:
+        params = (await request.json())["params"]
+        requests.append(params)
+        end = datetime.strptime(params["date"], "%m/%d/%Y")
+        start = datetime.strptime(params.get("start_date", params["date"]), "%m/%d/%Y")
+
+        with open(
+            "tests/mock_data/historical_data_mock_anonymized.json", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+        data["params"]["start_date"] = start.isoformat()
+        template = data["timeseries"]["meter_uuid,0"]["series"][0]
+        data["timeseries"]["meter_uuid,0"]["series"] = [
+            {**template, "date": (start + timedelta(days=x)).isoformat(" ")}
+            for x in range((end - start).days + 1)
+        ]
+        return web.Response(text=json.dumps(data))
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_range_consumption)
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+    client.day_cache = MemoryDayCache()
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+
+    first = await reader.read_historical_data(
+        client=client, days_to_load=6, window_days=6
+    )
+    # The four closed days of the window are cached as separate days.
+    assert len(client.day_cache) == 4
+
+    second = await reader.read_historical_data(
+        client=client, days_to_load=6, window_days=6
+    )
+    assert second == first
+    assert len(requests) == 2
+    yesterday = datetime.now(tz=timezone.utc) - timedelta(days=1)
+    assert requests[1]["start_date"] == yesterday.strftime("%m/%d/%Y")
+
+
+async def test_meter_reader_does_not_cache_days_without_data(
+    aiohttp_client: Any,
+) -> None:
+    """Verify a closed day whose points are all empty is requested again."""
+    requests = 0
+
+    async def mock_null_consumption(_request: web.Request) -> web.Response:
+        nonlocal requests
+        requests += 1
+        with open(
+            "tests/mock_data/historical_data_mock_anonymized.json", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+        for point in data["timeseries"]["meter_uuid,0"]["series"]:
+            point["bill_read"] = None
+            point["display_unit"] = None
+        return web.Response(text=json.dumps(data))
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_null_consumption)
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+    client.day_cache = MemoryDayCache()
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+
+    past_day = datetime.now(tz=timezone.utc) - timedelta(days=5)
+    for _ in range(3):
+        assert await reader.read_historical_data_one_day(client, past_day) == []
+
+    assert requests == 3
+    assert len(client.day_cache) == 0
@@ -1,5 +1,9 @@
 """Tests for pyonwater client."""  # nosec: B101, B106
 
+import asyncio
+from collections.abc import Awaitable, Callable
+import copy
+import json
 from typing import Any
 
 from aiohttp import web
@@ -10,6 +14,7 @@ from conftest import (
     mock_signin_endpoint,
 )
 import pytest
+from tenacity import wait_none
 
 from pyonwater import (
     Account,
@@ -292,3 +297,243 @@ async def test_client_falls_back_to_dashboard_when_new_search_empty(
     assert len(readers) == 1  # nosec: B101
     assert readers[0].meter_uuid == "123"  # nosec: B101
     assert readers[0].meter_id == "456"  # nosec: B101
+
+
+@pytest.mark.asyncio()
+async def test_client_concurrent_authenticate_single_signin(
+    aiohttp_client: Any,
+) -> None:
+    """Verify concurrent authenticate calls share one signin request."""
+    signin_calls = 0
+
+    async def mock_slow_signin(request: web.Request) -> web.Response:
+        nonlocal signin_calls
+        signin_calls += 1
+        await asyncio.sleep(0.01)
+        return await mock_signin_endpoint(request)
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_slow_signin)
+    websession = await aiohttp_client(app)
+
+    account = Account(  # nosec: B106
+        eow_hostname="",
+        username="user",
+        password="",
+    )
+    client = Client(websession=websession, account=account)
+
+    await asyncio.gather(*(client.authenticate() for _ in range(10)))
+
+    assert signin_calls == 1  # nosec: B101
+    assert client.signins_avoided == 9  # nosec: B101
+    assert client.authenticated is True  # nosec: B101
+
+
+@pytest.mark.asyncio()
+async def test_client_concurrent_401_single_signin(aiohttp_client: Any) -> None:
+    """Verify a burst of 401 responses triggers only one re-signin."""
+    signin_calls = 0
+    expired = True
+
+    async def mock_counting_signin(request: web.Request) -> web.Response:
+        nonlocal signin_calls, expired
+        signin_calls += 1
+        await asyncio.sleep(0.01)
+        # The first signin hands out a token that the server then rejects.
+        expired = signin_calls == 1
+        return await mock_signin_endpoint(request)
+
+    async def mock_dashboard(request: web.Request) -> web.Response:
+        if expired:
+            await asyncio.sleep(0.01)
+            return web.Response(status=401)
+        return await mock_get_meters_endpoint(request)
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_counting_signin)
+    app.router.add_get("/dashboard/user", mock_dashboard)
+    websession = await aiohttp_client(app)
+
+    account = Account(  # nosec: B106
+        eow_hostname="",
+        username="user",
+        password="",
+    )
+    client = Client(websession=websession, account=account)
+    await client.authenticate()
+    assert signin_calls == 1  # nosec: B101
+
+    request = client.request.retry_with(wait=wait_none())  # type: ignore
+    await asyncio.gather(
+        *(request(client, path="dashboard/user", method="get") for _ in range(5))
+    )
+
+    assert signin_calls == 2  # nosec: B101
+    assert client.signins_avoided == 4  # nosec: B101
+
+
+@pytest.mark.asyncio()
+async def test_account_fetch_meters_batches_meter_info(aiohttp_client: Any) -> None:
+    """Verify fetch_meters reads meter info in chunked batch requests."""
+    with open("tests/mock_data/read_meter_mock_anonymized.json", encoding="utf-8") as f:
+        template = json.load(f)
+    hit_template = template["elastic_results"]["hits"]["hits"][0]
+
+    def make_hit(meter_uuid: str) -> dict[str, Any]:
+        hit = copy.deepcopy(hit_template)
+        hit["_id"] = meter_uuid
+        hit["_source"]["meter"]["meter_uuid"] = meter_uuid
+        hit["_source"]["meter"]["meter_id"] = f"id-{meter_uuid}"
+        return hit
+
+    all_uuids = [f"uuid-{i}" for i in range(120)]
+    batch_sizes: list[int] = []
+
+    async def mock_new_search(request: web.Request) -> web.Response:
+        payload = await request.json()
+        query = payload["query"]
+        if "match_all" in query:
+            hits = [make_hit(meter_uuid) for meter_uuid in all_uuids]
+        else:
+            requested = query["terms"]["meter.meter_uuid"]
+            batch_sizes.append(len(requested))
+            # The last meter is only returned when it is looked up on its own.
+            hits = [
+                make_hit(u)
+                for u in requested
+                if u != all_uuids[-1] or len(requested) == 1
+            ]
+        response = copy.deepcopy(template)
+        response["elastic_results"]["hits"]["hits"] = hits
+        return web.Response(text=json.dumps(response))
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/new_search", mock_new_search)
+    websession = await aiohttp_client(app)
+
+    account = Account(  # nosec: B106
+        eow_hostname="",
+        username="user",
+        password="",
+    )
+    client = Client(websession=websession, account=account)
+    await client.authenticate()
+
+    meters = await account.fetch_meters(client=client)
+
+    assert [meter.meter_uuid for meter in meters] == all_uuids  # nosec: B101
+    assert all(  # nosec: B101
+        meter.meter_info.meter.meter_uuid == meter.meter_uuid for meter in meters
+    )
+    # Three chunked lookups plus one single lookup for the missing meter.
+    assert batch_sizes == [50, 50, 20, 1]  # nosec: B101
+
+
+def build_paged_new_search(
+    total: int, *, honor_from: bool = True, max_size: int | None = None
+) -> tuple[Callable[[web.Request], Awaitable[web.Response]], list[int]]:
+    """Build a new_search mock serving `total` meters in from/size pages."""
+    offsets: list[int] = []
+
+    async def mock_new_search(request: web.Request) -> web.Response:
+        payload = await request.json()
+        offset = payload["from"] if honor_from else 0
+        offsets.append(payload["from"])
+        size = min(payload["size"], max_size or payload["size"])
+        hits = [
+            {"_source": {"meter": {"meter_uuid": f"uuid-{i}", "meter_id": i + 1}}}
+            for i in range(offset, min(offset + size, total))
+        ]
+        data = {
+            "elastic_results": {
+                "hits": {"hits": hits, "total": {"relation": "eq", "value": total}}
+            }
+        }
+        return web.Response(text=json.dumps(data))
+
+    return mock_new_search, offsets
+
+
+@pytest.mark.asyncio()
+async def test_account_iter_meter_readers_paginates(aiohttp_client: Any) -> None:
+    """Verify discovery pages through new_search until the total is reached."""
+    mock_new_search, offsets = build_paged_new_search(250)
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/new_search", mock_new_search)
+    websession = await aiohttp_client(app)
+
+    account = Account(  # nosec: B106
+        eow_hostname="",
+        username="user",
+        password="",
+    )
+    client = Client(websession=websession, account=account)
+
+    readers = [
+        reader async for reader in account.iter_meter_readers(client, page_size=100)
+    ]
+
+    assert [reader.meter_uuid for reader in readers] == [  # nosec: B101
+        f"uuid-{i}" for i in range(250)
+    ]
+    assert offsets == [0, 100, 200]  # nosec: B101
+
+
+@pytest.mark.asyncio()
+async def test_account_iter_meter_readers_capped_page_size(
+    aiohttp_client: Any,
+) -> None:
+    """Verify short pages do not end discovery before the reported total."""
+    mock_new_search, offsets = build_paged_new_search(250, max_size=40)
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/new_search", mock_new_search)
+    websession = await aiohttp_client(app)
+
+    account = Account(  # nosec: B106
+        eow_hostname="",
+        username="user",
+        password="",
+    )
+    client = Client(websession=websession, account=account)
+
+    readers = [
+        reader async for reader in account.iter_meter_readers(client, page_size=100)
+    ]
+
+    assert [reader.meter_uuid for reader in readers] == [  # nosec: B101
+        f"uuid-{i}" for i in range(250)
+    ]
+    assert offsets == list(range(0, 250, 40))  # nosec: B101
+
+
+@pytest.mark.asyncio()
+async def test_account_iter_meter_readers_stops_without_new_meters(
+    aiohttp_client: Any,
+) -> None:
+    """Verify discovery stops when the server keeps returning the same page."""
+    mock_new_search, offsets = build_paged_new_search(250, honor_from=False)
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/new_search", mock_new_search)
+    websession = await aiohttp_client(app)
+
+    account = Account(  # nosec: B106
+        eow_hostname="",
+        username="user",
+        password="",
+    )
+    client = Client(websession=websession, account=account)
+
+    readers = [
+        reader async for reader in account.iter_meter_readers(client, page_size=100)
+    ]
+
+    assert len(readers) == 100  # nosec: B101
+    assert offsets[:2] == [0, 100]  # nosec: B101
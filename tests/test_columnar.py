@@ -0,0 +1,117 @@
+"""Tests for the columnar time-series container."""
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from aiohttp import web
+from conftest import (
+    build_client,
+    build_meter,
+    change_units_decorator,
+    mock_historical_data_endpoint,
+    mock_read_meter_endpoint,
+    mock_signin_endpoint,
+)
+import pytest
+import pytz
+
+from pyonwater import ColumnarSeries, DataPoint, EOWUnits, NativeUnits
+
+CENTRAL = pytz.timezone("US/Central")
+
+
+def make_points() -> list[DataPoint]:
+    # Spans the 2026-03-08 spring-forward transition in US/Central.
+    start = datetime(2026, 3, 8, 4, tzinfo=pytz.UTC)
+    return [
+        DataPoint(
+            dt=(start + timedelta(hours=hour)).astimezone(CENTRAL),
+            reading=100.0 + hour,
+            unit=EOWUnits.UNIT_GAL,
+            flow_value=None if hour % 2 else float(hour),
+        )
+        for hour in range(8)
+    ]
+
+
+def test_columnar_round_trip() -> None:
+    """Verify conversion back yields the original points across DST."""
+    points = make_points()
+    series = ColumnarSeries.from_datapoints(points)
+
+    assert len(series) == len(points)
+    assert series.unit == EOWUnits.UNIT_GAL
+    restored = series.to_datapoints()
+    assert restored == points
+    assert [p.dt.utcoffset() for p in restored] == [p.dt.utcoffset() for p in points]
+    assert restored[1].flow_value is None
+
+
+def test_columnar_slice_is_zero_copy() -> None:
+    """Verify slicing shares the underlying buffers."""
+    series = ColumnarSeries.from_datapoints(make_points())
+
+    window = series[2:5]
+
+    assert len(window) == 3
+    assert window.timestamps.obj is series.timestamps.obj
+    assert window.readings.obj is series.readings.obj
+    assert window.to_datapoints() == make_points()[2:5]
+    assert series[-1] == make_points()[-1]
+
+
+def test_columnar_rejects_mixed_units() -> None:
+    """Verify a series holds a single unit."""
+    points = make_points()
+    points[3].unit = EOWUnits.UNIT_CF
+
+    with pytest.raises(ValueError, match="All data points must be in"):
+        ColumnarSeries.from_datapoints(points)
+
+
+def test_columnar_rejects_mismatched_columns() -> None:
+    """Verify columns must have the same length."""
+    with pytest.raises(ValueError, match="Columns must have the same length"):
+        ColumnarSeries([1, 2], [1.0], [1.0, 2.0], unit="gal")
+
+
+def test_columnar_scaled() -> None:
+    """Verify scaling multiplies readings and flows but keeps timestamps."""
+    series = ColumnarSeries([0, 60], [1.0, 2.0], [float("nan"), 0.5], unit="100 GAL")
+
+    scaled = series.scaled(100.0, "gal")
+
+    assert list(scaled.readings) == [100.0, 200.0]
+    assert scaled[0].flow_value is None
+    assert scaled[1].flow_value == 50.0
+    assert scaled.timestamps.obj is series.timestamps.obj
+    assert scaled.unit == "gal"
+
+    liters = ColumnarSeries([0], [0.3], [0.7], unit="Liters")
+    cubic_meters = liters.scaled(1.0, "cm", divisor=1000.0)
+    assert list(cubic_meters.readings) == [0.3 / 1000.0]
+    assert list(cubic_meters.flows) == [0.7 / 1000.0]
+
+
+async def test_meter_read_historical_series(aiohttp_client: Any) -> None:
+    """Verify the meter returns a native-unit columnar series."""
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post(
+        "/api/2/residential/new_search",
+        change_units_decorator(mock_read_meter_endpoint, EOWUnits.UNIT_100_GAL),
+    )
+    app.router.add_post(
+        "/api/2/residential/consumption",
+        change_units_decorator(mock_historical_data_endpoint, EOWUnits.UNIT_100_GAL),
+    )
+    websession = await aiohttp_client(app)
+
+    _, client = await build_client(websession)
+    meter = await build_meter(client)
+
+    series = await meter.read_historical_series(client=client, days_to_load=1)
+
+    assert series.unit == NativeUnits.GAL
+    assert list(series.readings) == [4200.0]
+    assert meter.last_historical_data == []
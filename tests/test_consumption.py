@@ -0,0 +1,152 @@
+"""Tests for consumption derived from cumulative readings."""
+
+from datetime import datetime, timedelta, timezone
+import json
+import math
+from typing import Any
+
+from aiohttp import web
+from conftest import (
+    build_client,
+    build_meter,
+    mock_historical_data_endpoint,
+    mock_read_meter_endpoint,
+    mock_signin_endpoint,
+)
+import pytest
+
+from pyonwater import (
+    ColumnarSeries,
+    ConsumptionFlag,
+    DataPoint,
+    Meter,
+    MeterReader,
+    derive_consumption,
+    register_dials,
+)
+from pyonwater.models import HistoricalData, MeterInfo
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _points(readings: list[float]) -> list[DataPoint]:
+    return [
+        DataPoint(dt=START + timedelta(hours=hour), reading=reading, unit="GAL")
+        for hour, reading in enumerate(readings)
+    ]
+
+
+def test_derive_consumption_deltas() -> None:
+    """Verify usage is the difference of consecutive readings."""
+    consumption = derive_consumption(_points([10.0, 12.5, 12.5, 20.0]))
+
+    assert list(consumption.usage) == [2.5, 0.0, 7.5]  # nosec: B101
+    assert set(consumption.flags) == {ConsumptionFlag.NONE}  # nosec: B101
+    assert consumption.total() == 10.0  # nosec: B101
+
+    intervals = list(consumption)
+    assert len(intervals) == len(consumption) == 3  # nosec: B101
+    assert intervals[0].start == START  # nosec: B101
+    assert intervals[0].end == START + timedelta(hours=1)  # nosec: B101
+    assert intervals[2].usage == 7.5  # nosec: B101
+
+    assert len(derive_consumption([])) == 0  # nosec: B101
+    assert len(derive_consumption(_points([1.0]))) == 0  # nosec: B101
+
+
+def test_derive_consumption_rollover_replacement_negative() -> None:
+    """Verify decreasing readings are classified and flagged."""
+    readings = [9990.0, 5.0, 20.0, 18.0, 2.0, 4.0]
+
+    consumption = derive_consumption(_points(readings), dials=4)
+
+    assert list(consumption.flags) == [  # nosec: B101
+        ConsumptionFlag.ROLLOVER,
+        ConsumptionFlag.NONE,
+        ConsumptionFlag.NEGATIVE,
+        ConsumptionFlag.REPLACEMENT,
+        ConsumptionFlag.NONE,
+    ]
+    usage = list(consumption.usage)
+    assert usage[0] == 15.0  # nosec: B101
+    assert usage[2] == -2.0  # nosec: B101
+    assert math.isnan(usage[3])  # nosec: B101
+    assert consumption.total() == 15.0 + 15.0 - 2.0 + 2.0  # nosec: B101
+
+    # Without a register range the same drop is a replacement.
+    unknown = derive_consumption(_points(readings))
+    assert unknown.flags[0] == ConsumptionFlag.REPLACEMENT  # nosec: B101
+
+    # Dials that cannot describe the readings are ignored.
+    too_small = derive_consumption(_points(readings), dials=1)
+    assert too_small.flags[0] == ConsumptionFlag.REPLACEMENT  # nosec: B101
+
+    explicit = derive_consumption(_points(readings), rollover=10_000.0)
+    assert explicit.usage[0] == 15.0  # nosec: B101
+
+    with pytest.raises(ValueError, match="dials"):
+        derive_consumption(_points(readings), dials=0)
+    with pytest.raises(ValueError, match="rollover"):
+        derive_consumption(_points(readings), rollover=-1.0)
+
+
+def test_derive_consumption_columnar() -> None:
+    """Verify columnar series give the same result as data points."""
+    points = _points([1.0, 3.0, 2.0, 6.0])
+    series = ColumnarSeries.from_datapoints(points)
+
+    from_series = derive_consumption(series)
+    from_points = derive_consumption(points)
+
+    assert list(from_series.usage) == list(from_points.usage)  # nosec: B101
+    assert list(from_series.flags) == list(from_points.flags)  # nosec: B101
+    # Timestamps are shared with the series, not copied.
+    assert from_series.timestamps.obj is series.timestamps.obj  # nosec: B101
+
+
+def test_register_dials_from_historical_data() -> None:
+    """Verify dials are read from the consumption response."""
+    with open(
+        "tests/mock_data/historical_data_mock_anonymized.json", encoding="utf-8"
+    ) as f:
+        data = HistoricalData.model_validate(json.load(f))
+
+    assert register_dials(data) == 1  # nosec: B101
+
+
+@pytest.mark.asyncio()
+async def test_meter_consumption(aiohttp_client: Any) -> None:
+    """Verify a meter derives usage with the dials of its register."""
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/new_search", mock_read_meter_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_historical_data_endpoint)
+    websession = await aiohttp_client(app)
+
+    _, client = await build_client(websession)
+    meter = await build_meter(client)
+    assert register_dials(meter.meter_info) == 1  # nosec: B101
+
+    meter.last_historical_data = _points([8.0, 9.0, 1.0])
+    consumption = meter.consumption()
+
+    assert list(consumption.usage) == [1.0, 2.0]  # nosec: B101
+    assert consumption.flags[1] == ConsumptionFlag.ROLLOVER  # nosec: B101
+
+
+def test_meter_consumption_scales_rollover_to_native_unit() -> None:
+    """Verify the register range is converted from the read unit."""
+    with open("tests/mock_data/read_meter_mock_anonymized.json", encoding="utf-8") as f:
+        source = json.load(f)["elastic_results"]["hits"]["hits"][0]["_source"]
+    source["register_0"]["latest_read"]["units"] = "100 GAL"
+    meter = Meter(
+        MeterReader(meter_uuid="meter_uuid", meter_id="meter_id"),
+        MeterInfo.model_validate(source),
+    )
+    assert meter.native_unit_of_measurement == "gal"  # nosec: B101
+
+    # One dial of 100 GAL wraps at 1000 gallons.
+    consumption = meter.consumption(_points([900.0, 950.0, 30.0]))
+
+    assert consumption.flags[1] == ConsumptionFlag.ROLLOVER  # nosec: B101
+    assert consumption.usage[1] == 80.0  # nosec: B101
@@ -0,0 +1,178 @@
+"""Tests for gap detection and backfill."""
+
+from datetime import date, datetime, timedelta, timezone
+import json
+from typing import Any
+
+from aiohttp import web
+from conftest import build_client, mock_signin_endpoint
+import pytest
+import pytz
+
+from pyonwater import (
+    BackfillScheduler,
+    DataPoint,
+    Gap,
+    MeterReader,
+    find_gaps,
+    gap_days,
+)
+from pyonwater.models.units import AggregationLevel
+
+CENTRAL = pytz.timezone("US/Central")
+
+
+def _point(local: datetime, reading: float = 1.0) -> DataPoint:
+    return DataPoint(dt=CENTRAL.localize(local), reading=reading, unit="GAL")
+
+
+def test_find_gaps_hourly() -> None:
+    """Verify missing hours are merged into gaps, including the range ends."""
+    points = [_point(datetime(2026, 5, 1, hour)) for hour in (1, 2, 5, 6, 7, 9)]
+
+    assert find_gaps(points, AggregationLevel.HOURLY) == [  # nosec: B101
+        Gap(CENTRAL.localize(datetime(2026, 5, 1, 3)), points[2].dt),
+        Gap(CENTRAL.localize(datetime(2026, 5, 1, 8)), points[5].dt),
+    ]
+
+    gaps = find_gaps(
+        points,
+        AggregationLevel.HOURLY,
+        start=CENTRAL.localize(datetime(2026, 5, 1)),
+        end=CENTRAL.localize(datetime(2026, 5, 1, 12)),
+    )
+    assert gaps[0] == Gap(  # nosec: B101
+        CENTRAL.localize(datetime(2026, 5, 1)), points[0].dt
+    )
+    assert gaps[-1] == Gap(  # nosec: B101
+        CENTRAL.localize(datetime(2026, 5, 1, 10)),
+        CENTRAL.localize(datetime(2026, 5, 1, 12)),
+    )
+    assert gap_days(gaps) == [date(2026, 5, 1)]  # nosec: B101
+
+    assert find_gaps([], AggregationLevel.HOURLY) == []  # nosec: B101
+
+
+def test_find_gaps_daily_across_dst() -> None:
+    """Verify a 23 hour day is not reported as a gap, a missing day is."""
+    points = [_point(datetime(2026, 3, day)) for day in (7, 8, 9, 11)]
+
+    gaps = find_gaps(points, AggregationLevel.DAILY)
+
+    assert gaps == [  # nosec: B101
+        Gap(CENTRAL.localize(datetime(2026, 3, 10)), points[3].dt)
+    ]
+    assert gap_days(gaps) == [date(2026, 3, 10)]  # nosec: B101
+
+
+def test_find_gaps_over_fall_back_hour() -> None:
+    """Verify both instances of the repeated hour are expected."""
+    first = CENTRAL.localize(datetime(2026, 11, 1, 1), is_dst=True)
+    points = [
+        DataPoint(dt=first + timedelta(hours=hours), reading=1.0, unit="GAL")
+        for hours in (0, 2)
+    ]
+
+    gaps = find_gaps(points, AggregationLevel.HOURLY)
+
+    assert len(gaps) == 1  # nosec: B101
+    assert gaps[0].start.hour == 1  # nosec: B101
+    assert gaps[0].start.utcoffset() == timedelta(hours=-6)  # nosec: B101
+
+
+def test_backfill_scheduler_validation() -> None:
+    """Verify invalid retry settings are refused."""
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+    with pytest.raises(ValueError, match="max_retries"):
+        BackfillScheduler(reader, max_retries=0)
+    with pytest.raises(ValueError, match="retry_delay"):
+        BackfillScheduler(reader, retry_delay=timedelta(seconds=-1))
+
+
+@pytest.mark.asyncio()
+async def test_backfill_scheduler(aiohttp_client: Any) -> None:
+    """Verify only the missing days are requested, with capped retries."""
+    requested: list[str] = []
+    today = datetime.now(tz=timezone.utc).date()
+    filled_day = today - timedelta(days=3)
+    empty_day = today - timedelta(days=5)
+
+    async def mock_consumption(request: web.Request) -> web.Response:
+        payload = await request.json()
+        requested.append(payload["params"]["date"])
+        if payload["params"]["date"] == empty_day.strftime("%m/%d/%Y"):
+            return web.Response(text="")
+        with open(
+            "tests/mock_data/historical_data_mock_anonymized.json", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+        data["timeseries"]["meter_uuid,0"]["series"][0]["date"] = datetime.strptime(
+            payload["params"]["date"], "%m/%d/%Y"
+        ).strftime("%Y-%m-%d %H:%M:%S")
+        return web.Response(text=json.dumps(data))
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_consumption)
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+    scheduler = BackfillScheduler(reader, max_retries=2, retry_delay=timedelta(0))
+
+    scheduler.add_days([empty_day, filled_day])
+    data = await scheduler.run(client)
+
+    assert len(data) == 1  # nosec: B101
+    assert data[0].dt.date() == filled_day  # nosec: B101
+    assert sorted(requested) == sorted(  # nosec: B101
+        d.strftime("%m/%d/%Y") for d in (empty_day, filled_day)
+    )
+    assert scheduler.pending == [empty_day]  # nosec: B101
+
+    # The empty day runs out of retries on its second attempt.
+    requested.clear()
+    assert await scheduler.run(client) == []  # nosec: B101
+    assert requested == [empty_day.strftime("%m/%d/%Y")]  # nosec: B101
+    assert scheduler.pending == []  # nosec: B101
+    assert scheduler.abandoned == {empty_day}  # nosec: B101
+
+    requested.clear()
+    assert await scheduler.run(client) == []  # nosec: B101
+    assert requested == []  # nosec: B101
+
+
+@pytest.mark.asyncio()
+async def test_backfill_scheduler_waits_for_retry_delay(aiohttp_client: Any) -> None:
+    """Verify a failed day is not retried before its delay passed."""
+    calls = 0
+
+    async def mock_empty(_request: web.Request) -> web.Response:
+        nonlocal calls
+        calls += 1
+        return web.Response(text="")
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_empty)
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+    scheduler = BackfillScheduler(reader, retry_delay=timedelta(hours=1))
+
+    scheduler.add_gaps(
+        [
+            Gap(
+                CENTRAL.localize(datetime(2026, 5, 1, 22)),
+                CENTRAL.localize(datetime(2026, 5, 3)),
+            )
+        ]
+    )
+    assert scheduler.pending == [date(2026, 5, 1), date(2026, 5, 2)]  # nosec: B101
+
+    await scheduler.run(client)
+    await scheduler.run(client)
+
+    assert calls == 2  # nosec: B101
+    assert len(scheduler.pending) == 2  # nosec: B101
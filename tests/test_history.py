@@ -0,0 +1,79 @@
+"""Tests for the historical data store."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pyonwater import DataPoint, HistoryStore
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _point(hour: int, reading: float) -> DataPoint:
+    return DataPoint(dt=START + timedelta(hours=hour), reading=reading, unit="GAL")
+
+
+def test_merge_reports_added_and_changed_points() -> None:
+    """Verify merging dedupes by dt and returns only the delta."""
+    store = HistoryStore()
+
+    changes = store.merge([_point(1, 1.0), _point(0, 0.0)])
+    assert changes == [_point(0, 0.0), _point(1, 1.0)]  # nosec: B101
+
+    # Same points again: nothing changed.
+    assert store.merge([_point(0, 0.0), _point(1, 1.0)]) == []  # nosec: B101
+
+    # Newer data wins for an existing timestamp, new timestamps are added.
+    changes = store.merge([_point(1, 1.5), _point(2, 2.0)])
+    assert changes == [_point(1, 1.5), _point(2, 2.0)]  # nosec: B101
+    assert store.points() == [  # nosec: B101
+        _point(0, 0.0),
+        _point(1, 1.5),
+        _point(2, 2.0),
+    ]
+    assert store.latest == _point(2, 2.0)  # nosec: B101
+    assert len(store) == 3  # nosec: B101
+
+
+def test_merge_dedupes_equal_instants_across_timezones() -> None:
+    """Verify the same instant in another timezone replaces the point."""
+    store = HistoryStore()
+    store.merge([_point(0, 0.0)])
+
+    local = DataPoint(
+        dt=START.astimezone(timezone(timedelta(hours=-6))), reading=1.0, unit="GAL"
+    )
+    assert store.merge([local]) == [local]  # nosec: B101
+    assert store.points() == [local]  # nosec: B101
+
+
+def test_retention_drops_old_points() -> None:
+    """Verify points older than the retention window are dropped."""
+    store = HistoryStore(retention=timedelta(hours=2))
+    store.merge([_point(0, 0.0), _point(1, 1.0)])
+
+    changes = store.merge([_point(3, 3.0)])
+    assert changes == [_point(3, 3.0)]  # nosec: B101
+    assert store.points() == [_point(1, 1.0), _point(3, 3.0)]  # nosec: B101
+
+    # Points already outside the window are not reported as changes.
+    assert store.merge([_point(0, 0.5)]) == []  # nosec: B101
+    assert len(store) == 2  # nosec: B101
+
+
+def test_replace() -> None:
+    """Verify replace swaps the whole content."""
+    store = HistoryStore()
+    store.merge([_point(0, 0.0)])
+    store.replace([_point(2, 2.0), _point(1, 1.0)])
+    assert store.points() == [_point(1, 1.0), _point(2, 2.0)]  # nosec: B101
+
+    store.replace([])
+    assert store.points() == []  # nosec: B101
+    assert store.latest is None  # nosec: B101
+
+
+def test_retention_must_be_positive() -> None:
+    """Verify a non-positive retention raises ValueError."""
+    with pytest.raises(ValueError, match="retention must be positive"):
+        HistoryStore(retention=timedelta(0))
@@ -1,6 +1,7 @@
 """Tests for pyonwater meter."""
 
 from datetime import datetime, timedelta, timezone
+import json
 from typing import Any
 from unittest.mock import patch
 
@@ -361,3 +362,243 @@ async def test_meter_convert_to_native_preserves_flow_and_end_dt(
     assert converted.reading == 100.0
     assert converted.flow_value == 200.0
     assert converted.end_dt == end_dt
+
+
+async def test_meter_historical_data_merges_polls(aiohttp_client: Any) -> None:
+    """Repeated polls merge into the history and only report changes."""
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/new_search", mock_read_meter_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_historical_data_endpoint)
+    websession = await aiohttp_client(app)
+
+    _, client = await build_client(websession)
+    meter = await build_meter(client)
+
+    data = await meter.read_historical_data(client=client, days_to_load=1)
+    assert meter.last_changes == data  # nosec: B101
+
+    await meter.read_historical_data(client=client, days_to_load=1)
+    assert meter.last_changes == []  # nosec: B101
+    assert meter.last_historical_data == data  # nosec: B101
+
+    app2 = web.Application()
+    app2.router.add_post("/account/signin", mock_signin_endpoint)
+    app2.router.add_post(
+        "/api/2/residential/consumption",
+        mock_historical_data_newerdata_moredata_endpoint,
+    )
+    websession2 = await aiohttp_client(app2)
+    _, client2 = await build_client(websession2)
+
+    newer = await meter.read_historical_data(client=client2, days_to_load=1)
+    assert meter.last_changes  # nosec: B101
+    assert all(point in newer for point in meter.last_changes)  # nosec: B101
+    history = meter.last_historical_data
+    assert [p.dt for p in history] == sorted(
+        {p.dt for p in data + newer}
+    )  # nosec: B101
+
+
+async def test_meter_historical_data_delta(aiohttp_client: Any) -> None:
+    """Delta reads resume from the watermark and refetch gaps."""
+    requested: list[str] = []
+    missing: set[str] = set()
+
+    async def mock_consumption(request: web.Request) -> web.Response:
+        date = (await request.json())["params"]["date"]
+        requested.append(date)
+        if date in missing:
+            return web.Response(text="")
+        with open(
+            "tests/mock_data/historical_data_mock_anonymized.json", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+        data["timeseries"]["meter_uuid,0"]["series"][0]["date"] = datetime.strptime(
+            date, "%m/%d/%Y"
+        ).strftime("%Y-%m-%d 12:00:00")
+        return web.Response(text=json.dumps(data))
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/new_search", mock_read_meter_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_consumption)
+    websession = await aiohttp_client(app)
+
+    _, client = await build_client(websession)
+    meter = await build_meter(client)
+
+    today = datetime.now(tz=timezone.utc)
+    days = [(today - timedelta(days=x)).strftime("%m/%d/%Y") for x in range(3)]
+
+    # First read: yesterday is missing, so the watermark stops before it.
+    missing.add(days[1])
+    data = await meter.read_historical_data_delta(client=client, initial_days=3)
+    assert len(requested) == 3  # nosec: B101
+    assert len(data) == 2  # nosec: B101
+    assert meter.watermark == data[0].dt  # nosec: B101
+
+    # The gap is fetched again together with today.
+    missing.clear()
+    requested.clear()
+    data = await meter.read_historical_data_delta(client=client)
+    assert requested == days[::-1]  # nosec: B101
+    assert meter.watermark == data[-1].dt  # nosec: B101
+    assert len(meter.last_changes) == 1  # nosec: B101
+
+    # Steady state: one request for today.
+    requested.clear()
+    await meter.read_historical_data_delta(client=client)
+    assert requested == [days[0]]  # nosec: B101
+
+    # A restored watermark far in the past is capped by max_days, and the
+    # days in between are reported.
+    requested.clear()
+    meter.watermark = today - timedelta(days=100)
+    await meter.read_historical_data_delta(client=client, max_days=2)
+    assert requested == days[1::-1]  # nosec: B101
+    assert meter.watermark == meter.last_historical_data[-1].dt  # nosec: B101
+    assert len(meter.skipped_days) == 99  # nosec: B101
+    assert (today - timedelta(days=2)).date() in meter.skipped_days  # nosec: B101
+
+    with pytest.raises(ValueError, match="max_days must be at least 1"):
+        await meter.read_historical_data_delta(client=client, max_days=0)
+    with pytest.raises(ValueError, match="max_gap_retries must be at least 1"):
+        await meter.read_historical_data_delta(client=client, max_gap_retries=0)
+
+
+async def test_meter_historical_data_delta_gives_up_on_gaps(
+    aiohttp_client: Any,
+) -> None:
+    """Delta reads stop refetching a day that never returns data."""
+    requested: list[str] = []
+    today = datetime.now(tz=timezone.utc)
+    days = [(today - timedelta(days=x)).strftime("%m/%d/%Y") for x in range(3)]
+
+    async def mock_consumption(request: web.Request) -> web.Response:
+        date = (await request.json())["params"]["date"]
+        requested.append(date)
+        if date == days[1]:
+            return web.Response(text="")
+        with open(
+            "tests/mock_data/historical_data_mock_anonymized.json", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+        data["timeseries"]["meter_uuid,0"]["series"][0]["date"] = datetime.strptime(
+            date, "%m/%d/%Y"
+        ).strftime("%Y-%m-%d 12:00:00")
+        return web.Response(text=json.dumps(data))
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/new_search", mock_read_meter_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_consumption)
+    websession = await aiohttp_client(app)
+
+    _, client = await build_client(websession)
+    meter = await build_meter(client)
+
+    # Yesterday holds the watermark back for two reads, then is given up on.
+    await meter.read_historical_data_delta(
+        client=client, initial_days=3, max_gap_retries=2
+    )
+    assert meter.skipped_days == set()  # nosec: B101
+    await meter.read_historical_data_delta(client=client, max_gap_retries=2)
+
+    watermark = meter.watermark
+    assert watermark is not None  # nosec: B101
+    assert watermark.date() == today.date()  # nosec: B101
+    assert meter.skipped_days == {(today - timedelta(days=1)).date()}  # nosec: B101
+
+    requested.clear()
+    await meter.read_historical_data_delta(client=client, max_gap_retries=2)
+    assert requested == [days[0]]  # nosec: B101
+
+
+async def test_meter_refresh_skips_unchanged_reads(aiohttp_client: Any) -> None:
+    """Refresh only reads history when the meter read since the last sync."""
+    read_time = "2026-05-01T10:00:00"
+    # Local (US/Central) time of the newest point the API returns.
+    history_end = "2026-05-01 05:00:00"
+    consumption_calls = 0
+
+    async def mock_search(_request: web.Request) -> web.Response:
+        with open(
+            "tests/mock_data/read_meter_mock_anonymized.json", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+        source = data["elastic_results"]["hits"]["hits"][0]["_source"]
+        source["register_0"]["latest_read"]["read_time"] = read_time
+        return web.Response(text=json.dumps(data))
+
+    async def mock_consumption(_request: web.Request) -> web.Response:
+        nonlocal consumption_calls
+        consumption_calls += 1
+        with open(
+            "tests/mock_data/historical_data_mock_anonymized.json", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+        data["timeseries"]["meter_uuid,0"]["series"][0]["date"] = history_end
+        return web.Response(text=json.dumps(data))
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/new_search", mock_search)
+    app.router.add_post("/api/2/residential/consumption", mock_consumption)
+    websession = await aiohttp_client(app)
+
+    _, client = await build_client(websession)
+    meter = await build_meter(client)
+    assert meter.has_new_data  # nosec: B101
+
+    data = await meter.refresh(client)
+    assert consumption_calls == 1  # nosec: B101
+    assert len(data) == 1  # nosec: B101
+    assert meter.synced_read_time == datetime(  # nosec: B101
+        2026, 5, 1, 10, tzinfo=timezone.utc
+    )
+    assert not meter.has_new_data  # nosec: B101
+
+    # Same read time: the history read is skipped.
+    assert await meter.refresh(client) == []  # nosec: B101
+    assert consumption_calls == 1  # nosec: B101
+    assert meter.last_changes == []  # nosec: B101
+
+    # A newer read the API does not serve yet keeps the meter out of sync.
+    read_time = "2026-05-01T11:00:00"
+    calls = consumption_calls
+    assert await meter.refresh(client)  # nosec: B101
+    assert consumption_calls > calls  # nosec: B101
+    assert meter.has_new_data  # nosec: B101
+
+    history_end = "2026-05-01 06:00:00"
+    calls = consumption_calls
+    assert await meter.refresh(client)  # nosec: B101
+    assert consumption_calls > calls  # nosec: B101
+    assert meter.synced_read_time == datetime(  # nosec: B101
+        2026, 5, 1, 11, tzinfo=timezone.utc
+    )
+    assert not meter.has_new_data  # nosec: B101
+
+
+async def test_meter_iter_historical_data(aiohttp_client: Any) -> None:
+    """Streamed days are converted to the native unit."""
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/new_search", mock_read_meter_endpoint)
+    app.router.add_post(
+        "/api/2/residential/consumption",
+        change_units_decorator(mock_historical_data_endpoint, "100 GAL"),
+    )
+    websession = await aiohttp_client(app)
+
+    _, client = await build_client(websession)
+    meter = await build_meter(client)
+
+    batches = [batch async for batch in meter.iter_historical_data(client, 2)]
+
+    assert len(batches) == 2  # nosec: B101
+    point = batches[0].points[0]
+    assert point.unit == NativeUnits.GAL  # nosec: B101
+    assert point.reading == 42.0 * 100  # nosec: B101
+    assert meter.last_historical_data == []  # nosec: B101
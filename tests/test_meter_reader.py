@@ -1,9 +1,13 @@
 """Tests for pyonwater meter reader."""  # nosec: B101, B106
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
 import json
 import logging
 from typing import Any
 from unittest.mock import patch
+from zoneinfo import ZoneInfo
 
 from aiohttp import web
 from conftest import (
@@ -15,8 +19,11 @@ from conftest import (
     mock_signin_endpoint,
 )
 import pytest
+import pytz
 
 from pyonwater import EyeOnWaterAPIError, MeterReader
+from pyonwater.models import HistoricalData
+from pyonwater.timezones import TimezoneBackend
 
 
 @pytest.mark.asyncio()
@@ -286,3 +293,418 @@ def test_parse_export_csv_skips_invalid_rows_with_warning(
     assert len(points) == 1  # nosec: B101
     assert points[0].reading == 100.0  # nosec: B101
     assert "Skipping unparsable CSV row" in caplog.text  # nosec: B101
+
+
+@pytest.mark.asyncio()
+async def test_meter_reader_concurrent_days(aiohttp_client: Any) -> None:
+    """Verify day requests run concurrently, bounded, and stay date-ordered."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_slow_consumption(request: web.Request) -> web.Response:
+        nonlocal in_flight, max_in_flight
+        payload = await request.json()
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            in_flight -= 1
+        if payload["params"]["date"] == requested_dates[1]:
+            return web.Response(text="")
+        with open(
+            "tests/mock_data/historical_data_mock_anonymized.json", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+        data["timeseries"]["meter_uuid,0"]["series"][0]["date"] = datetime.strptime(
+            payload["params"]["date"], "%m/%d/%Y"
+        ).strftime("%Y-%m-%d %H:%M:%S")
+        return web.Response(text=json.dumps(data))
+
+    today = datetime.now(tz=timezone.utc)
+    requested_dates = [
+        (today - timedelta(days=x)).strftime("%m/%d/%Y") for x in range(4, -1, -1)
+    ]
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_slow_consumption)
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+
+    data = await reader.read_historical_data(
+        client=client, days_to_load=5, max_concurrency=2
+    )
+
+    assert max_in_flight == 2  # nosec: B101
+    assert len(data) == 4  # nosec: B101  # one empty day is skipped
+    assert [point.dt for point in data] == sorted(  # nosec: B101
+        point.dt for point in data
+    )
+
+
+@pytest.mark.asyncio()
+async def test_meter_reader_one_day_for_meters(aiohttp_client: Any) -> None:
+    """Verify one consumption request serves several meters, split per meter."""
+    requested: list[list[str]] = []
+
+    async def mock_fleet_consumption(request: web.Request) -> web.Response:
+        payload = await request.json()
+        meter_uuids = payload["query"]["query"]["terms"]["meter.meter_uuid"]
+        requested.append(meter_uuids)
+        with open(
+            "tests/mock_data/historical_data_mock_anonymized.json", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+        template = data["timeseries"].pop("meter_uuid,0")
+        for index, meter_uuid in enumerate(meter_uuids):
+            if meter_uuid == "uuid-missing":
+                continue
+            serie = json.loads(json.dumps(template))
+            serie["series"][0]["bill_read"] = float(index)
+            data["timeseries"][f"{meter_uuid},0"] = serie
+        return web.Response(text=json.dumps(data))
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_fleet_consumption)
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+
+    data = await MeterReader.read_historical_data_one_day_for_meters(
+        client=client,
+        meter_uuids=["uuid-a", "uuid-b", "uuid-missing", "uuid-c"],
+        date=datetime(2024, 1, 2),
+        chunk_size=3,
+    )
+
+    assert requested == [  # nosec: B101
+        ["uuid-a", "uuid-b", "uuid-missing"],
+        ["uuid-c"],
+    ]
+    assert sorted(data) == ["uuid-a", "uuid-b", "uuid-c"]  # nosec: B101
+    assert [dp.reading for dp in data["uuid-a"]] == [0.0]  # nosec: B101
+    assert [dp.reading for dp in data["uuid-b"]] == [1.0]  # nosec: B101
+    assert [dp.reading for dp in data["uuid-c"]] == [0.0]  # nosec: B101
+
+
+@pytest.mark.asyncio()
+async def test_meter_reader_one_day_for_meters_timezones(aiohttp_client: Any) -> None:
+    """Verify each meter of a mixed batch is localized in its own timezone."""
+    resolvable = True
+
+    async def mock_fleet_consumption(request: web.Request) -> web.Response:
+        payload = await request.json()
+        meter_uuids = payload["query"]["query"]["terms"]["meter.meter_uuid"]
+        with open(
+            "tests/mock_data/historical_data_mock_anonymized.json", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+        template = data["timeseries"].pop("meter_uuid,0")
+        for meter_uuid in meter_uuids:
+            data["timeseries"][f"{meter_uuid},0"] = template
+        data["hit"]["meter.timezone"] = ["US/Central", "US/Pacific"]
+        data["hit"]["meter.meter_uuid"] = (
+            meter_uuids if resolvable else ["1111111111111111111"]
+        )
+        return web.Response(text=json.dumps(data))
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_fleet_consumption)
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+
+    data = await MeterReader.read_historical_data_one_day_for_meters(
+        client=client,
+        meter_uuids=["uuid-central", "uuid-pacific"],
+        date=datetime(2024, 1, 2),
+    )
+
+    central = data["uuid-central"][0].dt
+    pacific = data["uuid-pacific"][0].dt
+    assert central.utcoffset() == timedelta(hours=-6)  # nosec: B101
+    assert pacific.utcoffset() == timedelta(hours=-8)  # nosec: B101
+
+    resolvable = False
+    with pytest.raises(EyeOnWaterAPIError, match="timezone"):
+        await MeterReader.read_historical_data_one_day_for_meters(
+            client=client,
+            meter_uuids=["uuid-central", "uuid-pacific"],
+            date=datetime(2024, 1, 2),
+        )
+
+
+def build_range_consumption_endpoint(
+    *, honor_range: bool
+) -> tuple[Callable[[web.Request], Awaitable[web.Response]], list[dict[str, Any]]]:
+    """Build a consumption mock returning one point per requested day."""
+    requests: list[dict[str, Any]] = []
+
+    async def mock_consumption(request: web.Request) -> web.Response:
+        params = (await request.json())["params"]
+        requests.append(params)
+        end = datetime.strptime(params["date"], "%m/%d/%Y")
+        start = end
+        if honor_range and "start_date" in params:
+            start = datetime.strptime(params["start_date"], "%m/%d/%Y")
+
+        with open(
+            "tests/mock_data/historical_data_mock_anonymized.json", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+        data["params"]["start_date"] = start.isoformat()
+        data["params"]["end_date"] = end.isoformat()
+        template = data["timeseries"]["meter_uuid,0"]["series"][0]
+        series = []
+        day = start
+        while day <= end:
+            point = dict(template)
+            point["date"] = day.strftime("%Y-%m-%d %H:%M:%S")
+            series.append(point)
+            day += timedelta(days=1)
+        data["timeseries"]["meter_uuid,0"]["series"] = series
+        return web.Response(text=json.dumps(data))
+
+    return mock_consumption, requests
+
+
+@pytest.mark.parametrize(
+    "honor_range,expected_requests",
+    [
+        (True, 2),  # 3-day window + 2-day window
+        (False, 7),  # both windows refused, then 5 daily requests
+    ],
+)
+async def test_meter_reader_window_days(
+    aiohttp_client: Any, honor_range: bool, expected_requests: int
+) -> None:
+    """Verify range requests and the per-day fallback return the same days."""
+    mock_consumption, requests = build_range_consumption_endpoint(
+        honor_range=honor_range
+    )
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_consumption)
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+
+    data = await reader.read_historical_data(
+        client=client, days_to_load=5, window_days=3
+    )
+
+    today = datetime.now(tz=timezone.utc).date()
+    assert [point.dt.date() for point in data] == [  # nosec: B101
+        today - timedelta(days=x) for x in range(4, -1, -1)
+    ]
+    assert len(requests) == expected_requests  # nosec: B101
+    assert "start_date" in requests[0]  # nosec: B101
+
+
+async def test_meter_reader_window_fallback_is_concurrent(aiohttp_client: Any) -> None:
+    """Verify the days of a refused window are requested concurrently."""
+    mock_consumption, requests = build_range_consumption_endpoint(honor_range=False)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_slow_consumption(request: web.Request) -> web.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await mock_consumption(request)
+        finally:
+            in_flight -= 1
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_slow_consumption)
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+
+    data = await reader.read_historical_data(
+        client=client, days_to_load=4, window_days=4, max_concurrency=3
+    )
+
+    assert len(data) == 4  # nosec: B101
+    assert len(requests) == 5  # nosec: B101  # refused window + 4 days
+    assert max_in_flight == 3  # nosec: B101
+
+
+def test_convert_across_dst_change() -> None:
+    """Verify conversion on a fall-back day matches per-point localization."""
+    with open("tests/mock_data/historical_data_mock_anonymized.json") as f:
+        raw = json.load(f)
+    template = raw["timeseries"]["meter_uuid,0"]["series"][0]
+    start = datetime(2023, 11, 5)
+    dates = [start + timedelta(minutes=15 * i) for i in range(24 * 4)]
+    raw["timeseries"]["meter_uuid,0"]["series"] = [
+        {**template, "date": d.strftime("%Y-%m-%d %H:%M:%S"), "bill_read": float(i)}
+        for i, d in enumerate(reversed(dates))
+    ]
+    data = HistoricalData.model_validate(raw)
+
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+    points = reader.convert(data, "meter_uuid,0")
+
+    tz = pytz.timezone(data.hit.meter_timezone[0])
+    expected = sorted(tz.localize(d) for d in dates)
+    assert [p.dt for p in points] == expected  # nosec: B101
+    assert [p.dt.tzinfo for p in points] == [  # nosec: B101
+        dt.tzinfo for dt in expected
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_meter_reader_timezone_backend(aiohttp_client: Any) -> None:
+    """Verify the client and the reader select the timezone backend."""
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_historical_data_endpoint)
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+    client.timezone_backend = TimezoneBackend.ZONEINFO
+
+    meter_reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+    data = await meter_reader.read_historical_data(client=client, days_to_load=1)
+    assert data  # nosec: B101
+    assert all(isinstance(p.dt.tzinfo, ZoneInfo) for p in data)  # nosec: B101
+
+    meter_reader = MeterReader(
+        meter_uuid="meter_uuid",
+        meter_id="meter_id",
+        timezone_backend=TimezoneBackend.PYTZ,
+    )
+    pytz_data = await meter_reader.read_historical_data(client=client, days_to_load=1)
+    assert not any(isinstance(p.dt.tzinfo, ZoneInfo) for p in pytz_data)  # nosec: B101
+    assert [p.dt for p in pytz_data] == [p.dt for p in data]  # nosec: B101
+
+
+def test_parse_export_csv_timezone_backends() -> None:
+    """Verify both backends parse export rows of several timezones alike."""
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+    raw_csv = (
+        "Read_Time,Read,Read_Unit,Flow,Timezone\n"
+        "11/01/2026 1:30 AM,102.0,GAL,,US/Central\n"
+        "11/01/2026 12:05 AM,100.0,GAL,,US/Pacific\n"
+        "11/01/2026 1:15 AM,101.0,GAL,,US/Central\n"
+        "11/01/2026 1:15 AM,99.0,GAL,,Not/AZone\n"
+    )
+
+    pytz_points = reader._parse_export_csv(raw_csv, TimezoneBackend.PYTZ)
+    zoneinfo_points = reader._parse_export_csv(raw_csv, TimezoneBackend.ZONEINFO)
+
+    assert [p.reading for p in pytz_points] == [100.0, 101.0, 102.0]  # nosec: B101
+    # PEP 495: ambiguous times never compare equal across zones, use instants.
+    assert [p.dt.timestamp() for p in pytz_points] == [  # nosec: B101
+        p.dt.timestamp() for p in zoneinfo_points
+    ]
+    assert [p.reading for p in zoneinfo_points] == [  # nosec: B101
+        p.reading for p in pytz_points
+    ]
+    assert all(  # nosec: B101
+        isinstance(p.dt.tzinfo, ZoneInfo) for p in zoneinfo_points
+    )
+
+
+def _streaming_app(
+    delays: dict[str, float], started: list[str], empty: set[str]
+) -> web.Application:
+    async def mock_consumption(request: web.Request) -> web.Response:
+        date = (await request.json())["params"]["date"]
+        started.append(date)
+        await asyncio.sleep(delays.get(date, 0.0))
+        if date in empty:
+            return web.Response(text="")
+        with open(
+            "tests/mock_data/historical_data_mock_anonymized.json", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+        data["timeseries"]["meter_uuid,0"]["series"][0]["date"] = datetime.strptime(
+            date, "%m/%d/%Y"
+        ).strftime("%Y-%m-%d %H:%M:%S")
+        return web.Response(text=json.dumps(data))
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_consumption)
+    return app
+
+
+@pytest.mark.asyncio()
+async def test_meter_reader_iter_historical_data(aiohttp_client: Any) -> None:
+    """Verify days are streamed in date order or as they complete."""
+    today = datetime.now(tz=timezone.utc)
+    days = [(today - timedelta(days=x)) for x in range(3, -1, -1)]
+    requested = [day.strftime("%m/%d/%Y") for day in days]
+    started: list[str] = []
+    # The oldest day is slow and the next one has no data.
+    app = _streaming_app({requested[0]: 0.05}, started, {requested[1]})
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+
+    ordered = [
+        batch
+        async for batch in reader.iter_historical_data(
+            client, days_to_load=4, max_concurrency=2
+        )
+    ]
+    assert [batch.date for batch in ordered] == [  # nosec: B101
+        day.date() for day in days
+    ]
+    assert [len(batch.points) for batch in ordered] == [1, 0, 1, 1]  # nosec: B101
+
+    unordered = [
+        batch.date
+        async for batch in reader.iter_historical_data(
+            client, days_to_load=4, max_concurrency=2, ordered=False
+        )
+    ]
+    # The slow oldest day arrives last.
+    assert unordered[-1] == days[0].date()  # nosec: B101
+    assert sorted(unordered) == [day.date() for day in days]  # nosec: B101
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        async for _ in reader.iter_historical_data(
+            client, days_to_load=1, max_concurrency=0
+        ):
+            pass
+
+
+@pytest.mark.asyncio()
+async def test_meter_reader_iter_historical_data_backpressure(
+    aiohttp_client: Any,
+) -> None:
+    """Verify a slow consumer holds back requests, and closing cancels them."""
+    started: list[str] = []
+    app = _streaming_app({}, started, set())
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+
+    consumed = 0
+    batches = reader.iter_historical_data(client, days_to_load=10, max_concurrency=2)
+    async for _ in batches:
+        consumed += 1
+        await asyncio.sleep(0.02)
+        assert len(started) <= consumed + 2  # nosec: B101
+        if consumed == 3:
+            break
+    await batches.aclose()
+
+    await asyncio.sleep(0.05)
+    assert len(started) <= 5  # nosec: B101
@@ -1,8 +1,12 @@
 """Tests for additional model fields."""
 
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timezone
 from typing import Any
 
-from pyonwater.models import MeterInfo
+import pytest
+
+from pyonwater.models import DataPoint, EOWUnits, FrozenDataPoint, MeterInfo
 
 
 def test_meter_info_parses_leak_fields() -> None:
@@ -44,3 +48,34 @@ def test_meter_info_parses_leak_fields() -> None:
     assert model.meter.leak.max_flow_rate == 0.9
     assert model.reading.leak is not None
     assert model.reading.leak.total_leak_24hrs == 5.6
+
+
+def test_data_point_is_slotted_with_interned_units() -> None:
+    """Test DataPoint has no per-instance dict and shares unit strings."""
+    dt = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    first = DataPoint(dt=dt, reading=1.0, unit="".join(["G", "AL"]))
+    second = DataPoint(dt=dt, reading=2.0, unit="".join(["G", "AL"]))
+
+    assert not hasattr(first, "__dict__")
+    assert first.unit is second.unit
+    with pytest.raises(AttributeError):
+        first.extra = 1  # type: ignore[attr-defined]
+
+
+def test_frozen_data_point_round_trip() -> None:
+    """Test the frozen variant is immutable, hashable and converts back."""
+    point = DataPoint(
+        dt=datetime(2026, 2, 1, tzinfo=timezone.utc),
+        reading=1.0,
+        unit=EOWUnits.UNIT_GAL,
+        flow_value=0.5,
+    )
+
+    frozen = point.freeze()
+
+    assert isinstance(frozen, FrozenDataPoint)
+    assert frozen.reading == point.reading
+    assert len({frozen, point.freeze()}) == 1
+    with pytest.raises(FrozenInstanceError):
+        frozen.reading = 2.0  # type: ignore[misc]
+    assert frozen.thaw() == point
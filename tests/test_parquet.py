@@ -0,0 +1,115 @@
+"""Tests for the Parquet export of historical series."""
+
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+import pytz
+
+from pyonwater import (
+    ColumnarSeries,
+    DataPoint,
+    EOWUnits,
+    ParquetExporter,
+    ReadingArchive,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+CENTRAL = pytz.timezone("US/Central")
+
+
+def _points(start: datetime, hours: int, unit: str = "GAL") -> list[DataPoint]:
+    utc_start = CENTRAL.localize(start).astimezone(pytz.utc)
+    return [
+        DataPoint(
+            dt=(utc_start + timedelta(hours=i)).astimezone(CENTRAL),
+            reading=float(i),
+            unit=unit,
+            flow_value=None if i % 2 else 0.5,
+        )
+        for i in range(hours)
+    ]
+
+
+async def test_parquet_partitions_by_meter_and_local_month(tmp_path: Path) -> None:
+    """Verify files are split per meter and local month."""
+    exporter = ParquetExporter(tmp_path)
+    # 23:00 local on Jan 31 is already February in UTC.
+    points = _points(datetime(2026, 1, 31, 22), 3)
+
+    paths = await exporter.write("meter/1", points)
+
+    assert [p.relative_to(tmp_path).as_posix() for p in paths] == [
+        "meter_uuid=meter%2F1/month=2026-01/part-00000.parquet",
+        "meter_uuid=meter%2F1/month=2026-02/part-00000.parquet",
+    ]
+    table = exporter.read_table("meter/1").sort_by("ts")
+    assert table.column("reading").to_pylist() == [0.0, 1.0, 2.0]
+    assert table.column("flow_value").to_pylist() == [0.5, None, 0.5]
+    assert table.column("month").to_pylist() == ["2026-01", "2026-01", "2026-02"]
+    assert [ts.timestamp() for ts in table.column("ts").to_pylist()] == [
+        p.dt.timestamp() for p in points
+    ]
+    assert set(table.column("unit").to_pylist()) == {"GAL"}
+
+
+async def test_parquet_appends_with_stable_schema(tmp_path: Path) -> None:
+    """Verify repeated writes append parts and keep the schema."""
+    exporter = ParquetExporter(tmp_path)
+    first = _points(datetime(2026, 3, 1), 2, unit=EOWUnits.UNIT_GAL)
+    second = ColumnarSeries.from_datapoints(_points(datetime(2026, 3, 2), 2))
+
+    await exporter.write("meter_uuid", first)
+    paths = await exporter.write("meter_uuid", second)
+    await exporter.write("other_uuid", first)
+
+    assert paths[0].name == "part-00001.parquet"
+    table = exporter.read_table("meter_uuid")
+    assert table.num_rows == 4
+    assert table.schema.field("ts").type == pa.timestamp("ms", tz="UTC")
+    assert set(table.column("unit").to_pylist()) == {"GAL"}
+    assert exporter.read_table().num_rows == 6
+
+
+async def test_parquet_empty_series(tmp_path: Path) -> None:
+    """Verify an empty series writes nothing."""
+    exporter = ParquetExporter(tmp_path / "missing")
+    assert await exporter.write("meter_uuid", []) == []
+    assert exporter.read_table().num_rows == 0
+
+
+async def test_parquet_concurrent_writes_to_one_partition(tmp_path: Path) -> None:
+    """Verify concurrent writes of one meter and month keep every part."""
+    exporter = ParquetExporter(tmp_path)
+    batches = [_points(datetime(2026, 4, 1, hour), 1) for hour in range(16)]
+
+    paths = await asyncio.gather(
+        *(exporter.write("meter_uuid", batch) for batch in batches)
+    )
+
+    assert len({path for written in paths for path in written}) == 16
+    month_dir = tmp_path / "meter_uuid=meter_uuid" / "month=2026-04"
+    assert sorted(p.name for p in month_dir.iterdir()) == [
+        f"part-{number:05d}.parquet" for number in range(16)
+    ]
+    table = exporter.read_table("meter_uuid")
+    assert table.num_rows == 16
+
+
+def test_parquet_exports_archive_series(tmp_path: Path) -> None:
+    """Verify the strided columns of an archive series are exported."""
+    points = _points(datetime(2026, 5, 1), 4)
+    archive = ReadingArchive(tmp_path / "meter.arc", unit="GAL", tz=CENTRAL)
+    archive.append(points)
+    exporter = ParquetExporter(tmp_path / "dataset")
+
+    exporter.write_sync("meter_uuid", archive.series())
+
+    table = exporter.read_table("meter_uuid").sort_by("ts")
+    assert table.column("reading").to_pylist() == [p.reading for p in points]
+    assert table.column("flow_value").to_pylist() == [p.flow_value for p in points]
+    assert [ts.timestamp() for ts in table.column("ts").to_pylist()] == [
+        p.dt.timestamp() for p in points
+    ]
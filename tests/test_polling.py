@@ -0,0 +1,207 @@
+"""Tests for the fleet poll scheduler."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyonwater import (
+    Client,
+    EyeOnWaterAPIError,
+    Meter,
+    MeterReader,
+    PollScheduler,
+    expected_upload,
+)
+from pyonwater.models import MeterInfo
+
+NOW = datetime(2026, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _meter_info(**reading: Any) -> MeterInfo:
+    with open("tests/mock_data/read_meter_mock_anonymized.json", encoding="utf-8") as f:
+        source = json.load(f)["elastic_results"]["hits"]["hits"][0]["_source"]
+    source["register_0"].update(reading)
+    source["meter"]["communication_seconds"] = None
+    source["meter"]["last_communication_time"] = None
+    return MeterInfo.model_validate(source)
+
+
+def _meter(uuid: str, **reading: Any) -> Meter:
+    reader = MeterReader(meter_uuid=uuid, meter_id=uuid)
+    return Meter(reader, _meter_info(**reading))
+
+
+def test_expected_upload() -> None:
+    """Verify the next upload follows the communication cadence."""
+    info = _meter_info(
+        last_communication_time="2026-05-01T11:30:00",
+        communication_seconds=3600,
+    )
+    assert expected_upload(info, NOW) == NOW + timedelta(minutes=30)  # nosec: B101
+
+    # Missed uploads move the expectation to the next future slot.
+    late = NOW + timedelta(hours=5, minutes=40)
+    expected = NOW + timedelta(hours=6, minutes=30)
+    assert expected_upload(info, late) == expected  # nosec: B101
+
+    fallback = _meter_info(
+        last_communication_time="2026-05-01T11:50:00",
+        communication_seconds=None,
+        aggregation_seconds=900,
+    )
+    assert expected_upload(fallback, NOW) == NOW + timedelta(minutes=5)  # nosec: B101
+
+    unknown = _meter_info(
+        last_communication_time=None,
+        communication_seconds=None,
+        aggregation_seconds=None,
+    )
+    assert expected_upload(unknown, NOW) is None  # nosec: B101
+
+
+def test_poll_scheduler_validation() -> None:
+    """Verify invalid settings are refused."""
+    client = MagicMock(spec=Client)
+    with pytest.raises(ValueError, match="max_concurrency"):
+        PollScheduler(client, max_concurrency=0)
+    with pytest.raises(ValueError, match="min_interval"):
+        PollScheduler(client, min_interval=timedelta(seconds=-1))
+
+
+@pytest.mark.asyncio()
+async def test_poll_scheduler_follows_cadence() -> None:
+    """Verify meters are polled after their next upload, within the cap."""
+    now = datetime.now(tz=timezone.utc)
+    soon = _meter(
+        "soon",
+        last_communication_time=(now - timedelta(seconds=0.5)).isoformat(),
+        communication_seconds=1,
+    )
+    later = _meter(
+        "later",
+        last_communication_time=now.isoformat(),
+        communication_seconds=3600,
+    )
+    unknown = _meter(
+        "unknown",
+        last_communication_time=None,
+        communication_seconds=None,
+        aggregation_seconds=None,
+    )
+
+    polls: list[str] = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def poll(_client: Client, meter: Meter) -> None:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            in_flight -= 1
+        polls.append(meter.meter_uuid)
+        if meter is unknown:
+            msg = "boom"
+            raise EyeOnWaterAPIError(msg)
+
+    scheduler = PollScheduler(
+        MagicMock(spec=Client),
+        [soon, later, unknown],
+        poll=poll,
+        max_concurrency=2,
+        min_interval=timedelta(0),
+        default_interval=timedelta(hours=1),
+        upload_delay=timedelta(0),
+        jitter=timedelta(0),
+    )
+    runner = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(0.2)
+
+    # Every meter is polled once at start, even the failing one.
+    assert sorted(polls) == ["later", "soon", "unknown"]  # nosec: B101
+    assert max_in_flight == 2  # nosec: B101
+    later_poll = scheduler.next_poll("later")
+    assert later_poll is not None  # nosec: B101
+    assert later_poll - now >= timedelta(minutes=59)  # nosec: B101
+    unknown_poll = scheduler.next_poll("unknown")
+    assert unknown_poll is not None  # nosec: B101
+    assert unknown_poll - now >= timedelta(minutes=59)  # nosec: B101
+
+    # The meter with a one second cadence is polled again after its upload.
+    await asyncio.sleep(1.0)
+    assert polls.count("soon") >= 2  # nosec: B101
+    assert polls.count("later") == 1  # nosec: B101
+
+    scheduler.remove("soon")
+    assert scheduler.next_poll("soon") is None  # nosec: B101
+    scheduler.stop()
+    await asyncio.wait_for(runner, timeout=1)
+
+
+@pytest.mark.asyncio()
+async def test_poll_scheduler_min_interval() -> None:
+    """Verify the minimum interval caps the poll rate of a meter."""
+    meter = _meter(
+        "fast",
+        last_communication_time=datetime.now(tz=timezone.utc).isoformat(),
+        communication_seconds=1,
+    )
+    polls = 0
+
+    async def poll(_client: Client, _meter: Meter) -> None:
+        nonlocal polls
+        polls += 1
+
+    scheduler = PollScheduler(
+        MagicMock(spec=Client),
+        [meter],
+        poll=poll,
+        min_interval=timedelta(minutes=5),
+        jitter=timedelta(seconds=10),
+    )
+    runner = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(0.1)
+    scheduler.stop()
+    await asyncio.wait_for(runner, timeout=1)
+
+    assert polls == 1  # nosec: B101
+    next_poll = scheduler.next_poll("fast")
+    assert next_poll is not None  # nosec: B101
+    remaining = next_poll - datetime.now(tz=timezone.utc)
+    assert remaining > timedelta(minutes=4)  # nosec: B101
+
+
+@pytest.mark.asyncio()
+async def test_poll_scheduler_survives_unexpected_errors() -> None:
+    """Verify a meter whose poll raises an unexpected error stays scheduled."""
+    meter = _meter(
+        "broken",
+        last_communication_time=None,
+        communication_seconds=None,
+        aggregation_seconds=None,
+    )
+    polls = 0
+
+    async def poll(_client: Client, _meter: Meter) -> None:
+        nonlocal polls
+        polls += 1
+        msg = "unexpected"
+        raise KeyError(msg)
+
+    scheduler = PollScheduler(MagicMock(spec=Client), [meter], poll=poll)
+    runner = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(0.1)
+    scheduler.stop()
+    await asyncio.wait_for(runner, timeout=1)
+
+    assert polls == 1  # nosec: B101
+    next_poll = scheduler.next_poll("broken")
+    assert next_poll is not None  # nosec: B101
+    remaining = next_poll - datetime.now(tz=timezone.utc)
+    assert remaining > timedelta(minutes=59)  # nosec: B101
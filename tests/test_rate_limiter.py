@@ -0,0 +1,100 @@
+"""Tests for the adaptive client-side rate limiter."""
+
+import time
+from typing import Any
+
+from aiohttp import web
+from conftest import mock_signin_endpoint
+import pytest
+
+from pyonwater import (
+    Account,
+    AdaptiveRateLimiter,
+    Client,
+    EyeOnWaterRateLimitError,
+)
+
+
+def test_rate_limiter_aimd_bounds() -> None:
+    """Verify multiplicative decrease and additive increase stay in bounds."""
+    limiter = AdaptiveRateLimiter(
+        max_rate=4.0, min_rate=1.0, increase_step=0.5, decrease_factor=0.5
+    )
+    assert limiter.rate == 4.0  # nosec: B101
+
+    limiter.on_rate_limited()
+    assert limiter.rate == 2.0  # nosec: B101
+    limiter.on_rate_limited()
+    limiter.on_rate_limited()
+    assert limiter.rate == 1.0  # nosec: B101
+
+    limiter.on_success()
+    assert limiter.rate == 1.5  # nosec: B101
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.rate == 4.0  # nosec: B101
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"min_rate": 0},
+        {"max_rate": 1.0, "min_rate": 2.0},
+        {"burst": 0},
+        {"decrease_factor": 1.0},
+        {"increase_step": -1.0},
+    ],
+)
+def test_rate_limiter_invalid_arguments(kwargs: dict[str, Any]) -> None:
+    """Verify inconsistent limiter settings raise ValueError."""
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(**kwargs)
+
+
+@pytest.mark.asyncio()
+async def test_rate_limiter_paces_after_burst() -> None:
+    """Verify requests beyond the burst wait for tokens to refill."""
+    limiter = AdaptiveRateLimiter(max_rate=100.0, burst=2)
+
+    start = time.monotonic()
+    for _ in range(2):
+        await limiter.acquire()
+    assert time.monotonic() - start < 0.02  # nosec: B101
+
+    for _ in range(3):
+        await limiter.acquire()
+    assert time.monotonic() - start >= 0.025  # nosec: B101
+
+
+@pytest.mark.asyncio()
+async def test_client_feeds_rate_limiter(aiohttp_client: Any) -> None:
+    """Verify the client lowers its rate on 403 and raises it on success."""
+    rate_limited = True
+
+    async def mock_dashboard(_request: web.Request) -> web.Response:
+        if rate_limited:
+            return web.Response(status=403)
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_get("/dashboard/user", mock_dashboard)
+    websession = await aiohttp_client(app)
+
+    account = Account(  # nosec: B106
+        eow_hostname="",
+        username="user",
+        password="",
+    )
+    limiter = AdaptiveRateLimiter(max_rate=50.0, increase_step=1.0)
+    client = Client(websession=websession, account=account, rate_limiter=limiter)
+    await client.authenticate()
+
+    request = client.request.retry_with(stop=lambda _state: True)  # type: ignore
+    with pytest.raises(EyeOnWaterRateLimitError):
+        await request(client, path="dashboard/user", method="get")
+    assert limiter.rate == 25.0  # nosec: B101
+
+    rate_limited = False
+    await client.request(path="dashboard/user", method="get")
+    assert limiter.rate == 26.0  # nosec: B101
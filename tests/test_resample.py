@@ -0,0 +1,124 @@
+"""Tests for local resampling of historical data."""
+
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+import pytz
+
+from pyonwater import ColumnarSeries, DataPoint, resample
+from pyonwater.models.units import AggregationLevel
+
+CENTRAL = pytz.timezone("US/Central")
+
+
+def _quarter_hours(start: datetime, end: datetime) -> list[DataPoint]:
+    """Return cumulative quarter-hourly readings (1 per interval) in US/Central."""
+    points = []
+    ts = start
+    reading = 0.0
+    while ts < end:
+        reading += 1
+        points.append(
+            DataPoint(
+                dt=ts.astimezone(CENTRAL),
+                reading=reading,
+                unit="GAL",
+                flow_value=1.0,
+            )
+        )
+        ts += timedelta(minutes=15)
+    return points
+
+
+def test_resample_hourly_across_fall_back() -> None:
+    """Verify the repeated hour of a fall-back day forms two buckets."""
+    # 2026-11-01 00:00 to 2026-11-02 00:00 US/Central (25 hours).
+    start = CENTRAL.localize(datetime(2026, 11, 1)).astimezone(timezone.utc)
+    end = CENTRAL.localize(datetime(2026, 11, 2)).astimezone(timezone.utc)
+    points = _quarter_hours(start, end)
+
+    hourly = resample(points, AggregationLevel.HOURLY)
+
+    assert len(hourly) == 25  # nosec: B101
+    assert [p.dt.hour for p in hourly[:4]] == [0, 1, 1, 2]  # nosec: B101
+    assert hourly[1].dt.utcoffset() != hourly[2].dt.utcoffset()  # nosec: B101
+    assert hourly[0].reading == 4.0  # nosec: B101
+    assert hourly[0].flow_value == 4.0  # nosec: B101
+    assert hourly[-1].reading == points[-1].reading  # nosec: B101
+
+    daily = resample(points, AggregationLevel.DAILY)
+    assert len(daily) == 1  # nosec: B101
+    assert daily[0].dt == start  # nosec: B101
+    assert daily[0].reading == 100.0  # nosec: B101
+    assert daily[0].flow_value == 100.0  # nosec: B101
+
+
+def test_resample_daily_across_spring_forward() -> None:
+    """Verify days start at local midnight around a 23 hour day."""
+    start = CENTRAL.localize(datetime(2026, 3, 7)).astimezone(timezone.utc)
+    end = CENTRAL.localize(datetime(2026, 3, 10)).astimezone(timezone.utc)
+    points = _quarter_hours(start, end)
+
+    daily = resample(points, AggregationLevel.DAILY)
+
+    assert [p.dt.strftime("%Y-%m-%d %H:%M %z") for p in daily] == [  # nosec: B101
+        "2026-03-07 00:00 -0600",
+        "2026-03-08 00:00 -0600",
+        "2026-03-09 00:00 -0500",
+    ]
+    assert [p.flow_value for p in daily] == [96.0, 92.0, 96.0]  # nosec: B101
+    assert len(resample(points, AggregationLevel.HOURLY)) == 71  # nosec: B101
+
+
+def test_resample_weekly_monthly_yearly() -> None:
+    """Verify calendar buckets use the local date of each reading."""
+    points = [
+        # 23:45 on Jan 31 locally is already February in UTC.
+        DataPoint(
+            dt=CENTRAL.localize(datetime(2026, 1, 31, 23, 45)), reading=1, unit="GAL"
+        ),
+        DataPoint(
+            dt=CENTRAL.localize(datetime(2026, 2, 1, 0, 15)), reading=2, unit="GAL"
+        ),
+        DataPoint(dt=CENTRAL.localize(datetime(2026, 2, 4, 8)), reading=3, unit="GAL"),
+    ]
+
+    monthly = resample(points, AggregationLevel.MONTHLY)
+    assert [(p.dt.month, p.reading) for p in monthly] == [(1, 1), (2, 3)]  # nosec: B101
+
+    yearly = resample(points, AggregationLevel.YEARLY)
+    assert [(p.dt.date().isoformat(), p.reading) for p in yearly] == [  # nosec: B101
+        ("2026-01-01", 3)
+    ]
+
+    # 2026-01-31 is a Saturday, 2026-02-01 a Sunday.
+    weekly = resample(points, AggregationLevel.WEEKLY)
+    assert [p.dt.date().isoformat() for p in weekly] == [  # nosec: B101
+        "2026-01-26",
+        "2026-02-02",
+    ]
+    sunday = resample(points, AggregationLevel.WEEKLY, week_start=6)
+    assert [p.dt.date().isoformat() for p in sunday] == [  # nosec: B101
+        "2026-01-25",
+        "2026-02-01",
+    ]
+
+
+def test_resample_columnar_and_explicit_timezone() -> None:
+    """Verify columnar input and bucketing in another zone."""
+    start = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    points = _quarter_hours(start, start + timedelta(hours=12))
+    series = ColumnarSeries.from_datapoints(points)
+
+    daily = resample(series, AggregationLevel.DAILY, tz=ZoneInfo("US/Central"))
+    # 00:00-12:00 UTC spans two Central days.
+    assert [p.dt.isoformat() for p in daily] == [  # nosec: B101
+        "2026-05-31T00:00:00-05:00",
+        "2026-06-01T00:00:00-05:00",
+    ]
+    assert sum(p.flow_value or 0 for p in daily) == 48.0  # nosec: B101
+
+    assert resample([], AggregationLevel.DAILY) == []  # nosec: B101
+    with pytest.raises(ValueError, match="week_start"):
+        resample(points, AggregationLevel.WEEKLY, week_start=7)
@@ -75,3 +75,29 @@ def test_series_date_parsing_invalid_type() -> None:
         Series.model_validate(
             {"date": 12345, "meter_uuid": 521577795832501, "value": 166.10}
         )
+
+
+def test_series_date_parsing_unpadded_falls_back_to_strptime() -> None:
+    """Test lenient strptime-only shapes are still accepted."""
+    series = Series.model_validate(
+        {"date": "2026-2-3", "meter_uuid": 521577795832501, "value": 166.10}
+    )
+    assert series.date == datetime(2026, 2, 3, 0, 0, 0)  # nosec: B101
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2026-13",  # month out of range
+        "2026-02-30",  # day out of range
+        "2026-02-10 24:00:00",  # hour out of range
+        "2026-02-10T00:00:00+01:00",  # timezone offsets were never accepted
+        "2026-02-10X00:00:00",  # wrong separator
+    ],
+)
+def test_series_date_parsing_rejects_invalid_shapes(value: str) -> None:
+    """Test the fast path rejects what the strptime formats reject."""
+    with pytest.raises(ValueError, match="Unable to parse date"):
+        Series.model_validate(
+            {"date": value, "meter_uuid": 521577795832501, "value": 166.10}
+        )
@@ -0,0 +1,166 @@
+"""Tests for the SQLite historical data store."""
+
+from datetime import datetime, timedelta, timezone
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp import web
+from conftest import build_client, mock_signin_endpoint
+import pytz
+
+from pyonwater import DataPoint, EOWUnits, MeterReader, SQLiteStore
+
+CENTRAL = pytz.timezone("US/Central")
+
+POINTS = [
+    DataPoint(
+        dt=CENTRAL.localize(datetime(2026, 3, 1, 1)),
+        reading=42.0,
+        unit=EOWUnits.UNIT_GAL,
+        flow_value=1.5,
+    ),
+    DataPoint(
+        dt=CENTRAL.localize(datetime(2026, 3, 1, 2)),
+        reading=43.0,
+        unit=EOWUnits.UNIT_GAL,
+        end_dt=CENTRAL.localize(datetime(2026, 3, 1, 3)),
+    ),
+    DataPoint(
+        dt=datetime(2026, 3, 2, 1, tzinfo=timezone(timedelta(hours=-6))),
+        reading=44.0,
+        unit="Custom",
+    ),
+]
+
+
+async def test_sqlite_store_round_trip(tmp_path: Path) -> None:
+    """Verify points are restored, including timezone, after reopening."""
+    store = SQLiteStore(tmp_path / "history.db")
+    assert await store.write("meter_uuid", POINTS) == 3
+    assert await store.write("other_uuid", POINTS[:1]) == 1
+    store.close()
+
+    store = SQLiteStore(tmp_path / "history.db")
+    restored = await store.query("meter_uuid")
+    store.close()
+
+    assert restored == POINTS
+    assert restored[0].unit == EOWUnits.UNIT_GAL
+    assert restored[0].dt.tzinfo.zone == "US/Central"  # type: ignore[union-attr]
+    assert restored[0].dt.utcoffset() == POINTS[0].dt.utcoffset()
+    assert restored[1].end_dt == POINTS[1].end_dt
+    assert restored[2].dt.utcoffset() == timedelta(hours=-6)
+
+
+async def test_sqlite_store_replaces_and_queries_ranges() -> None:
+    """Verify rewrites replace points and ranges are half-open."""
+    store = SQLiteStore(":memory:")
+    await store.write("meter_uuid", POINTS)
+    newer = DataPoint(dt=POINTS[0].dt, reading=50.0, unit=EOWUnits.UNIT_GAL)
+    await store.write("meter_uuid", [newer])
+
+    assert await store.query("meter_uuid", start=POINTS[0].dt, end=POINTS[2].dt) == [
+        newer,
+        POINTS[1],
+    ]
+    assert await store.query("meter_uuid", register=1) == []
+    assert await store.latest("meter_uuid") == POINTS[2]
+    assert await store.latest("missing_uuid") is None
+    assert {d.isoformat() for d in await store.stored_days("meter_uuid")} == {
+        "2026-03-01",
+        "2026-03-02",
+    }
+    store.close()
+
+
+async def test_sqlite_store_sync_fetches_missing_days(aiohttp_client: Any) -> None:
+    """Verify sync only requests days missing from the store or still open."""
+    requested: list[str] = []
+
+    async def mock_consumption(request: web.Request) -> web.Response:
+        date = (await request.json())["params"]["date"]
+        requested.append(date)
+        with open(
+            "tests/mock_data/historical_data_mock_anonymized.json", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+        data["timeseries"]["meter_uuid,0"]["series"][0]["date"] = datetime.strptime(
+            date, "%m/%d/%Y"
+        ).strftime("%Y-%m-%d 12:00:00")
+        return web.Response(text=json.dumps(data))
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_consumption)
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+    store = SQLiteStore(":memory:")
+
+    today = datetime.now(tz=timezone.utc)
+    days = [(today - timedelta(days=x)).strftime("%m/%d/%Y") for x in range(5)]
+
+    fetched = await store.sync(client, reader, days_to_load=5, window_days=1)
+    assert len(fetched) == 5
+    assert requested == days[::-1]
+    assert len(await store.query("meter_uuid")) == 5
+
+    # Closed days are served from the store; today and yesterday are refetched.
+    requested.clear()
+    await store.sync(client, reader, days_to_load=5)
+    assert requested == days[1::-1]
+
+    # A wider sync fills the older days only.
+    requested.clear()
+    await store.sync(client, reader, days_to_load=7)
+    assert sorted(requested) == sorted(
+        [(today - timedelta(days=x)).strftime("%m/%d/%Y") for x in (6, 5, 1, 0)]
+    )
+    assert len(await store.query("meter_uuid")) == 7
+    store.close()
+
+
+async def test_sqlite_store_sync_refetches_days_synced_while_open(
+    aiohttp_client: Any,
+) -> None:
+    """Verify a day synced before it closed is fetched again once closed."""
+    requested: list[str] = []
+
+    async def mock_consumption(request: web.Request) -> web.Response:
+        date = (await request.json())["params"]["date"]
+        requested.append(date)
+        with open(
+            "tests/mock_data/historical_data_mock_anonymized.json", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+        data["timeseries"]["meter_uuid,0"]["series"][0]["date"] = datetime.strptime(
+            date, "%m/%d/%Y"
+        ).strftime("%Y-%m-%d 12:00:00")
+        return web.Response(text=json.dumps(data))
+
+    app = web.Application()
+    app.router.add_post("/account/signin", mock_signin_endpoint)
+    app.router.add_post("/api/2/residential/consumption", mock_consumption)
+
+    websession = await aiohttp_client(app)
+    _, client = await build_client(websession)
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+    store = SQLiteStore(":memory:")
+    old_day = (datetime.now(tz=timezone.utc) - timedelta(days=4)).strftime("%m/%d/%Y")
+
+    # The old day is synced while it still counts as open.
+    with patch.object(MeterReader, "is_closed_day", return_value=False):
+        await store.sync(client, reader, days_to_load=5)
+    requested.clear()
+    await store.sync(client, reader, days_to_load=5)
+    assert old_day in requested
+
+    # Synced again after it closed, it is now served from the store.
+    requested.clear()
+    await store.sync(client, reader, days_to_load=5)
+    assert old_day not in requested
+    assert len(requested) == 2
+    store.close()
@@ -0,0 +1,121 @@
+"""Tests for bulk timezone localization."""
+
+from __future__ import annotations
+
+import datetime
+import zoneinfo
+
+import pytest
+import pytz
+
+from pyonwater.timezones import TimezoneBackend, get_timezone, localize_naive
+
+
+def _quarter_hours(start: datetime.datetime, hours: int) -> list[datetime.datetime]:
+    return [start + datetime.timedelta(minutes=15 * i) for i in range(hours * 4)]
+
+
+def _assert_same_as_localize(
+    timezone: datetime.tzinfo, values: list[datetime.datetime]
+) -> None:
+    localized = localize_naive(timezone, values).values
+    expected = [timezone.localize(value) for value in values]  # type: ignore[attr-defined]
+    assert localized == expected  # nosec: B101
+    # Equal instants are not enough; the attached offsets must match too.
+    assert [dt.tzinfo for dt in localized] == [  # nosec: B101
+        dt.tzinfo for dt in expected
+    ]
+
+
+@pytest.mark.parametrize(
+    "start",
+    [
+        # Missing hour: 02:00-03:00 does not exist.
+        datetime.datetime(2023, 3, 12),
+        # Ambiguous hour: 01:00-02:00 happens twice.
+        datetime.datetime(2023, 11, 5),
+        datetime.datetime(2023, 7, 1),
+    ],
+)
+def test_localize_matches_pytz_around_dst(start: datetime.datetime) -> None:
+    """Verify localization is identical to pytz localize on DST days."""
+    _assert_same_as_localize(pytz.timezone("US/Central"), _quarter_hours(start, 24))
+
+
+def test_localize_matches_pytz_over_a_year() -> None:
+    """Verify localization across several DST segments."""
+    values = [
+        datetime.datetime(2023, 1, 1) + datetime.timedelta(hours=5 * i)
+        for i in range(365 * 24 // 5)
+    ]
+    _assert_same_as_localize(pytz.timezone("Europe/Berlin"), values)
+
+
+def test_localize_static_timezones() -> None:
+    """Verify zones without DST are localized too."""
+    values = _quarter_hours(datetime.datetime(2023, 3, 12), 4)
+    _assert_same_as_localize(pytz.utc, values)
+    _assert_same_as_localize(pytz.timezone("Etc/GMT+5"), values)
+
+
+def test_localize_ordered_flag() -> None:
+    """Verify the ordered flag reflects input order and DST changes."""
+    timezone = pytz.timezone("US/Central")
+    summer = _quarter_hours(datetime.datetime(2023, 7, 1), 24)
+    assert localize_naive(timezone, summer).ordered  # nosec: B101
+    assert not localize_naive(timezone, summer[::-1]).ordered  # nosec: B101
+
+    # 02:30 does not exist and localizes after 03:00 CDT, so it needs a sort.
+    spring = _quarter_hours(datetime.datetime(2023, 3, 12), 24)
+    assert not localize_naive(timezone, spring).ordered  # nosec: B101
+
+
+def test_localize_empty() -> None:
+    """Verify an empty input is handled."""
+    localized = localize_naive(pytz.timezone("US/Central"), [])
+    assert localized.values == []  # nosec: B101
+    assert localized.ordered  # nosec: B101
+
+
+@pytest.mark.parametrize(
+    ("name", "start"),
+    [
+        ("US/Central", datetime.datetime(2023, 3, 12)),
+        ("US/Central", datetime.datetime(2023, 11, 5)),
+        ("US/Central", datetime.datetime(2023, 7, 1)),
+        ("Europe/Dublin", datetime.datetime(2025, 3, 30)),
+        ("Europe/Dublin", datetime.datetime(2025, 10, 26)),
+        ("Pacific/Apia", datetime.datetime(2011, 12, 29)),
+        ("Pacific/Apia", datetime.datetime(2011, 12, 30)),
+    ],
+)
+def test_localize_zoneinfo_matches_pytz(name: str, start: datetime.datetime) -> None:
+    """Verify the zoneinfo backend resolves DST changes like pytz."""
+    values = _quarter_hours(start, 24)
+    expected = localize_naive(pytz.timezone(name), values)
+    localized = localize_naive(zoneinfo.ZoneInfo(name), values)
+
+    assert [dt.timestamp() for dt in localized.values] == [  # nosec: B101
+        dt.timestamp() for dt in expected.values
+    ]
+    assert [dt.utcoffset() for dt in localized.values] == [  # nosec: B101
+        dt.utcoffset() for dt in expected.values
+    ]
+    assert localized.ordered == expected.ordered  # nosec: B101
+
+
+def test_get_timezone_backends() -> None:
+    """Verify timezone lookups per backend are cached."""
+    pytz_zone = get_timezone("US/Central")
+    assert pytz_zone is pytz.timezone("US/Central")  # nosec: B101
+
+    zone = get_timezone("US/Central", TimezoneBackend.ZONEINFO)
+    assert isinstance(zone, zoneinfo.ZoneInfo)  # nosec: B101
+    assert get_timezone("US/Central", TimezoneBackend.ZONEINFO) is zone  # nosec: B101
+
+
+@pytest.mark.parametrize("backend", list(TimezoneBackend))
+def test_get_timezone_unknown(backend: TimezoneBackend) -> None:
+    """Verify unknown timezones raise KeyError for every backend."""
+    with pytest.raises(KeyError):
+        get_timezone("Not/AZone", backend)
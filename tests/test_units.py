@@ -1,14 +1,21 @@
 """Tests for units conversion."""
 
+from array import array
+from datetime import datetime, timezone
 from typing import Any
 
 import pytest
 
 from pyonwater import (
+    DataPoint,
     EOWUnits,
     EyeOnWaterUnitError,
     NativeUnits,
+    conversion_factor,
+    conversion_ratio,
+    convert_datapoints_to_native,
     convert_to_native,
+    convert_values_to_native,
     deduce_native_units,
 )
 
@@ -65,3 +72,70 @@ def test_convert_units():
     with pytest.raises(EyeOnWaterUnitError):
         bad_unit: Any = "hey"
         convert_to_native(bad_unit, EOWUnits.UNIT_GAL, 1.0)
+
+
+def test_conversion_factor():
+    """Test the factor table covers every unit of its native unit."""
+    for read_unit in EOWUnits:
+        native_unit = deduce_native_units(read_unit)
+        multiplier, divisor = conversion_ratio(native_unit, read_unit)
+        expected = 2.0 * multiplier / divisor
+        assert convert_to_native(native_unit, read_unit, 2.0) == expected
+        assert conversion_factor(native_unit, read_unit) == multiplier / divisor
+        # Plain strings, as stored in DataPoint.unit, resolve the same way.
+        assert conversion_ratio(native_unit, read_unit.value) == (multiplier, divisor)
+
+    with pytest.raises(EyeOnWaterUnitError, match="for native unit"):
+        conversion_factor(NativeUnits.GAL, "hey")
+    with pytest.raises(EyeOnWaterUnitError, match="Unsupported native unit"):
+        bad_unit: Any = "hey"
+        conversion_factor(bad_unit, EOWUnits.UNIT_GAL)
+
+
+def test_convert_liters_exactly():
+    """Test liters convert exactly like a division by 1000."""
+    values = [0.1 * i for i in range(1000)] + [123456.789, 1e-7]
+    expected = [value / 1000.0 for value in values]
+
+    assert [
+        convert_to_native(NativeUnits.CM, EOWUnits.UNIT_LITER, value)
+        for value in values
+    ] == expected
+    assert (
+        list(convert_values_to_native(NativeUnits.CM, EOWUnits.UNIT_LITERS, values))
+        == expected
+    )
+    dt = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    points = [DataPoint(dt=dt, reading=value, unit="Liters") for value in values]
+    converted = convert_datapoints_to_native(NativeUnits.CM, points)
+    assert [dp.reading for dp in converted] == expected
+
+
+def test_convert_values_to_native():
+    """Test converting a series of values in one pass."""
+    converted = convert_values_to_native(
+        NativeUnits.GAL, EOWUnits.UNIT_10_GAL, [1.0, 2.5, 0.0]
+    )
+    assert converted == array("d", [10.0, 25.0, 0.0])
+
+    with pytest.raises(EyeOnWaterUnitError):
+        convert_values_to_native(NativeUnits.CM, EOWUnits.UNIT_GAL, [1.0])
+
+
+def test_convert_datapoints_to_native():
+    """Test converting data points with mixed read units."""
+    dt = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    points = [
+        DataPoint(dt=dt, reading=1.0, unit="KGAL", flow_value=0.5),
+        DataPoint(dt=dt, reading=3.0, unit=EOWUnits.UNIT_GAL, end_dt=dt),
+    ]
+
+    converted = convert_datapoints_to_native(NativeUnits.GAL, points)
+
+    assert [p.reading for p in converted] == [1000.0, 3.0]
+    assert [p.flow_value for p in converted] == [500.0, None]
+    assert all(p.unit == NativeUnits.GAL for p in converted)
+    assert converted[1].end_dt == dt
+
+    with pytest.raises(EyeOnWaterUnitError):
+        convert_datapoints_to_native(NativeUnits.CF, points)
@@ -4,6 +4,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from pyonwater.account import Account
 from pyonwater.meter_reader import MeterReader
 from pyonwater.models.units import AggregationLevel, RequestUnits
 
@@ -140,3 +141,43 @@ def test_units_defaults_to_cm_when_none() -> None:
     units_value = RequestUnits.GALLONS
     result = units_value.value
     assert result == "gallons"
+
+
+@pytest.mark.asyncio()
+async def test_historical_data_zero_concurrency() -> None:
+    """Verify that max_concurrency=0 raises ValueError."""
+    reader = MeterReader(meter_uuid="test-uuid", meter_id="12345")
+    mock_client = Mock()  # Won't be accessed due to early validation
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        await reader.read_historical_data(
+            client=mock_client, days_to_load=1, max_concurrency=0
+        )
+
+
+@pytest.mark.asyncio()
+async def test_read_meter_infos_zero_chunk_size() -> None:
+    """Verify that chunk_size=0 raises ValueError."""
+    mock_client = Mock()  # Won't be accessed due to early validation
+    with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+        await MeterReader.read_meter_infos(mock_client, ["test-uuid"], chunk_size=0)
+
+
+@pytest.mark.asyncio()
+async def test_iter_meter_readers_zero_page_size() -> None:
+    """Verify that page_size=0 raises ValueError."""
+    account = Account(eow_hostname="", username="user", password="")  # nosec: B106
+    mock_client = Mock()  # Won't be accessed due to early validation
+    with pytest.raises(ValueError, match="page_size must be at least 1"):
+        async for _ in account.iter_meter_readers(mock_client, page_size=0):
+            pass
+
+
+@pytest.mark.asyncio()
+async def test_historical_data_zero_window_days() -> None:
+    """Verify that window_days=0 raises ValueError."""
+    reader = MeterReader(meter_uuid="test-uuid", meter_id="12345")
+    mock_client = Mock()  # Won't be accessed due to early validation
+    with pytest.raises(ValueError, match="window_days must be at least 1"):
+        await reader.read_historical_data(
+            client=mock_client, days_to_load=1, window_days=0
+        )
@@ -0,0 +1,86 @@
+"""Measure the memory used by long DataPoint series.
+
+Compares a plain (dict-based) dataclass, the slotted DataPoint with
+interned units, and the columnar series.
+
+Usage: python tools/benchmark_datapoint_memory.py [points]
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import datetime
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+from pyonwater import ColumnarSeries, DataPoint
+
+DEFAULT_POINTS = 1_000_000
+
+
+@dataclass
+class PlainDataPoint:
+    """DataPoint as it was defined before slots were added."""
+
+    dt: datetime.datetime
+    reading: float
+    unit: str
+    flow_value: float | None = None
+    end_dt: datetime.datetime | None = None
+
+
+def measure(build: Callable[[], Any]) -> tuple[int, Any]:
+    """Return the bytes still allocated by build() and its result."""
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, result
+
+
+def main() -> None:
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_POINTS
+    start = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+    step = datetime.timedelta(minutes=15)
+    # Timestamps are shared by all variants so only the containers are measured.
+    timestamps = [start + step * i for i in range(count)]
+
+    def plain() -> list[PlainDataPoint]:
+        # "".join builds a new string per point, like csv.DictReader does.
+        return [
+            PlainDataPoint(dt=dt, reading=float(i), unit="".join(["G", "AL"]))
+            for i, dt in enumerate(timestamps)
+        ]
+
+    def slotted() -> list[DataPoint]:
+        return [
+            DataPoint(dt=dt, reading=float(i), unit="".join(["G", "AL"]))
+            for i, dt in enumerate(timestamps)
+        ]
+
+    def columnar() -> ColumnarSeries:
+        return ColumnarSeries(
+            [int(dt.timestamp()) for dt in timestamps],
+            [float(i) for i in range(count)],
+            [float("nan")] * count,
+            unit="GAL",
+        )
+
+    plain_bytes, _ = measure(plain)
+    for name, build in (
+        ("plain dataclass", plain),
+        ("slotted DataPoint", slotted),
+        ("ColumnarSeries", columnar),
+    ):
+        used, _ = measure(build)
+        print(  # noqa: T201
+            f"{name:<18} {used / 2**20:10.1f} MiB"
+            f"  {used / count:6.1f} B/point"
+            f"  {used / plain_bytes:6.1%} of plain"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark Series date parsing on the mock historical payloads.
+
+Each mock payload's series is repeated to a year of 15-minute points and
+its dates are rewritten into every shape the API sends (hourly, ISO,
+daily, monthly and yearly).
+
+Usage: python tools/benchmark_date_parsing.py [points]
+"""
+
+from __future__ import annotations
+
+import copy
+import datetime
+import json
+from pathlib import Path
+import sys
+import timeit
+from typing import Any
+
+from pyonwater.models import HistoricalData
+from pyonwater.models.eow_historical_models import Series
+
+DEFAULT_POINTS = 35_040  # One year of 15-minute intervals.
+MOCK_DATA = Path(__file__).parent.parent / "tests" / "mock_data"
+SHAPES = {
+    "hourly": "%Y-%m-%d %H:%M:%S",
+    "iso": "%Y-%m-%dT%H:%M:%S",
+    "daily": "%Y-%m-%d",
+    "monthly": "%Y-%m",
+    "yearly": "%Y",
+}
+LEGACY_FORMATS = list(SHAPES.values())
+
+
+def legacy_parse(value: str) -> datetime.datetime:
+    """Parse a date the way Series did before the fast path."""
+    for fmt in LEGACY_FORMATS:
+        try:
+            return datetime.datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise ValueError(value)
+
+
+def scaled_payload(payload: dict[str, Any], count: int, fmt: str) -> dict[str, Any]:
+    """Return the payload with `count` points per series dated in `fmt`."""
+    payload = copy.deepcopy(payload)
+    start = datetime.datetime(2026, 1, 1)
+    step = datetime.timedelta(minutes=15)
+    for timeserie in payload["timeseries"].values():
+        template = timeserie["series"]
+        timeserie["series"] = [
+            {**template[i % len(template)], "date": (start + step * i).strftime(fmt)}
+            for i in range(count)
+        ]
+    return payload
+
+
+def main() -> None:
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_POINTS
+    for path in sorted(MOCK_DATA.glob("historical_data_mock_*.json")):
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        print(f"{path.name} ({count} points per series)")  # noqa: T201
+        for shape, fmt in SHAPES.items():
+            scaled = scaled_payload(payload, count, fmt)
+            dates = [
+                point["date"]
+                for timeserie in scaled["timeseries"].values()
+                for point in timeserie["series"]
+            ]
+            raw = json.dumps(scaled)
+
+            legacy = timeit.timeit(
+                lambda: [legacy_parse(d) for d in dates],  # noqa: B023
+                number=1,
+            )
+            fast = timeit.timeit(
+                lambda: [Series.parse_flexible_date(d) for d in dates],  # noqa: B023
+                number=1,
+            )
+            model = timeit.timeit(
+                lambda: HistoricalData.model_validate_json(raw),  # noqa: B023
+                number=1,
+            )
+            print(  # noqa: T201
+                f"  {shape:<8} legacy {legacy * 1000:8.1f} ms"
+                f"  fast {fast * 1000:8.1f} ms ({legacy / fast:4.1f}x)"
+                f"  full validation {model * 1000:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
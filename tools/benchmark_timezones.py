@@ -0,0 +1,69 @@
+"""Benchmark the pytz and zoneinfo timezone backends.
+
+Measures localizing a year of 15-minute consumption points (as done by
+MeterReader.convert) and parsing a range export CSV of the same size, once
+with per-point `pytz.localize` as before and once per backend.
+
+Usage: python tools/benchmark_timezones.py [points]
+"""
+
+from __future__ import annotations
+
+import datetime
+import sys
+import timeit
+
+import pytz
+
+from pyonwater import MeterReader, TimezoneBackend
+from pyonwater.timezones import get_timezone, localize_naive
+
+DEFAULT_POINTS = 35_040  # One year of 15-minute intervals.
+TIMEZONE = "US/Central"
+
+
+def export_csv(values: list[datetime.datetime]) -> str:
+    """Return a range export CSV with one row per timestamp."""
+    rows = [
+        f"{value.strftime('%m/%d/%Y %I:%M %p')},{i * 0.5},GAL,0.5,{TIMEZONE}"
+        for i, value in enumerate(values)
+    ]
+    return "\n".join(["Read_Time,Read,Read_Unit,Flow,Timezone", *rows])
+
+
+def main() -> None:
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_POINTS
+    start = datetime.datetime(2026, 1, 1)
+    values = [start + datetime.timedelta(minutes=15 * i) for i in range(count)]
+    raw_csv = export_csv(values)
+    reader = MeterReader(meter_uuid="meter_uuid", meter_id="meter_id")
+
+    legacy = timeit.timeit(
+        lambda: [pytz.timezone(TIMEZONE).localize(value) for value in values],
+        number=1,
+    )
+    print(f"localize {count} points")  # noqa: T201
+    print(f"  per point pytz {legacy * 1000:8.1f} ms")  # noqa: T201
+    for backend in TimezoneBackend:
+        zone = get_timezone(TIMEZONE, backend)
+        elapsed = timeit.timeit(
+            lambda: localize_naive(zone, values),  # noqa: B023
+            number=1,
+        )
+        print(  # noqa: T201
+            f"  {backend.value:<14} {elapsed * 1000:8.1f} ms"
+            f" ({legacy / elapsed:4.1f}x)"
+        )
+
+    print(f"parse export CSV with {count} rows")  # noqa: T201
+    for backend in TimezoneBackend:
+        elapsed = timeit.timeit(
+            lambda: reader._parse_export_csv(raw_csv, backend),  # noqa: B023
+            number=1,
+        )
+        print(f"  {backend.value:<14} {elapsed * 1000:8.1f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()